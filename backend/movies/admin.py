@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Movie, Genre, Person, MovieGenre, MovieCredit, HomeSectionEntry
+from .models import Movie, Genre, Person, MovieGenre, MovieCredit, HomeSection, HomeSectionEntry, SyncCheckpoint, SyncRun, SyncShard, EnrichmentJob, FetchLease, ImageAsset
 
 
 @admin.register(Movie)
@@ -22,4 +22,32 @@ class PersonAdmin(admin.ModelAdmin):
 
 admin.site.register(MovieGenre)
 admin.site.register(MovieCredit)
+admin.site.register(HomeSection)
 admin.site.register(HomeSectionEntry)
+admin.site.register(SyncCheckpoint)
+admin.site.register(FetchLease)
+
+
+@admin.register(SyncRun)
+class SyncRunAdmin(admin.ModelAdmin):
+    list_display = ("id", "sort_by", "status", "last_page", "pages", "total", "errors", "updated_at")
+    list_filter = ("status",)
+
+
+@admin.register(SyncShard)
+class SyncShardAdmin(admin.ModelAdmin):
+    list_display = ("id", "run", "start_page", "end_page", "last_page", "status", "attempts", "locked_until")
+    list_filter = ("status",)
+
+
+@admin.register(EnrichmentJob)
+class EnrichmentJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "tmdb_id", "status", "attempts", "run_after", "locked_until", "updated_at")
+    list_filter = ("status", "kind")
+    search_fields = ("tmdb_id",)
+
+
+@admin.register(ImageAsset)
+class ImageAssetAdmin(admin.ModelAdmin):
+    list_display = ("id", "source_path", "width", "height", "bytes", "accessed_at")
+    search_fields = ("source_path", "sha1")
@@ -0,0 +1,191 @@
+# backend/movies/management/commands/bench_tmdb_ingest.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from movies.models import Genre, Movie, MovieCredit, MovieGenre, Person
+from movies.services.tmdb import (
+    _movie_defaults,
+    apply_movie_credits,
+    genre_registry,
+    upsert_movie_page,
+)
+
+# 실제 TMDB id와 겹치지 않도록 충분히 큰 값부터 사용
+BENCH_TMDB_ID_BASE = 2_000_000_000
+BENCH_GENRE_IDS = [900001, 900002, 900003, 900004, 900005]
+
+
+def _fake_page(page: int, page_size: int, revision: int) -> list[dict]:
+    results = []
+    for i in range(page_size):
+        tmdb_id = BENCH_TMDB_ID_BASE + (page - 1) * page_size + i
+        results.append(
+            {
+                "id": tmdb_id,
+                "title": f"벤치마크 영화 {tmdb_id}",
+                "original_title": f"Bench Movie {tmdb_id}",
+                "overview": f"rev {revision}",
+                "release_date": "2024-01-01",
+                "poster_path": f"/bench{tmdb_id}.jpg",
+                "backdrop_path": "",
+                "popularity": float(revision * 10 + i),
+                "vote_average": 7.5,
+                "vote_count": 100 + revision,
+                "genre_ids": BENCH_GENRE_IDS[i % 3 : i % 3 + 2],
+            }
+        )
+    return results
+
+
+def _fake_credits(movie_idx: int) -> dict:
+    # 감독 1명 + 배우 10명, 배우 풀을 영화끼리 공유해서 실제처럼 Person이 겹치게 함
+    director = movie_idx % 500
+    actors = [(movie_idx * 7 + k) % 20000 for k in range(10)]
+    return {
+        "crew": [
+            {"id": BENCH_TMDB_ID_BASE + director, "name": f"감독{director}",
+             "job": "Director", "known_for_department": "Directing"},
+        ],
+        "cast": [
+            {"id": BENCH_TMDB_ID_BASE + 1000 + a, "name": f"배우{a}",
+             "character": f"역할{k}", "order": k, "known_for_department": "Acting"}
+            for k, a in enumerate(actors)
+        ],
+    }
+
+
+# ----------------------------
+# 기존(행 단위) 구현 - 비교 기준
+# ----------------------------
+def _legacy_movies(results):
+    for item in results:
+        movie, _ = Movie.objects.update_or_create(tmdb_id=item["id"], defaults=_movie_defaults(item))
+        if Genre.objects.exists() and item.get("genre_ids"):
+            MovieGenre.objects.filter(movie=movie).delete()
+            for gen in Genre.objects.filter(tmdb_id__in=item["genre_ids"]):
+                MovieGenre.objects.create(movie=movie, genre=gen)
+
+
+def _legacy_credits(movie, credits):
+    MovieCredit.objects.filter(movie=movie).delete()
+    for crew in credits["crew"]:
+        person, _ = Person.objects.update_or_create(
+            tmdb_id=crew["id"],
+            defaults={"name": crew["name"], "profile_path": "", "known_for_department": crew["known_for_department"]},
+        )
+        MovieCredit.objects.create(movie=movie, person=person, role_type="DIRECTOR", job="Director", order=0)
+    for cast in credits["cast"]:
+        person, _ = Person.objects.update_or_create(
+            tmdb_id=cast["id"],
+            defaults={"name": cast["name"], "profile_path": "", "known_for_department": cast["known_for_department"]},
+        )
+        MovieCredit.objects.create(
+            movie=movie, person=person, role_type="CAST", character_name=cast["character"], order=cast["order"]
+        )
+
+
+def _batched_movies(results):
+    upsert_movie_page(results)
+
+
+class _StatementCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _measure(fn):
+    counter = _StatementCounter()
+    with connection.execute_wrapper(counter):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+    return counter.count, elapsed
+
+
+class Command(BaseCommand):
+    help = "TMDB 적재 경로 벤치마크 (가짜 데이터로 기존/일괄 경로 비교, 결과는 롤백)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target", choices=["movies", "credits"], default="movies",
+            help="movies: Movie/Genre/MovieGenre upsert, credits: 크레딧 재동기화",
+        )
+        parser.add_argument("--pages", type=int, default=10, help="[movies] 가짜 결과 페이지 수")
+        parser.add_argument("--page-size", type=int, default=20, help="[movies] 페이지당 영화 수(TMDB 기본 20)")
+        parser.add_argument("--movies", type=int, default=1000, help="[credits] 카탈로그 영화 수")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["target"] == "credits":
+                self._bench_credits(options["movies"])
+            else:
+                self._bench_movies(options["pages"], options["page_size"])
+            # 벤치마크 데이터는 남기지 않음
+            transaction.set_rollback(True)
+
+    def _write_table(self, unit, rate_label, rows):
+        self.stdout.write(f"{'path':<10} {'phase':<10} {f'stmts/{unit}':>12} {rate_label:>11}")
+        for label, phase, stmts, rate in rows:
+            self.stdout.write(f"{label:<10} {phase:<10} {stmts:>12.1f} {rate:>11.0f}")
+
+    def _bench_movies(self, pages, page_size):
+        for g in BENCH_GENRE_IDS:
+            Genre.objects.get_or_create(tmdb_id=g, defaults={"name": f"bench-{g}"})
+        genre_registry.load()
+
+        rows = []
+        for label, fn in (("per-item", _legacy_movies), ("batched", _batched_movies)):
+            # 1회차: 신규 INSERT, 2회차: 같은 영화 UPDATE
+            for phase, revision in (("insert", 1), ("update", 2)):
+                sid = transaction.savepoint()
+                if phase == "update":
+                    for page in range(1, pages + 1):
+                        fn(_fake_page(page, page_size, 1))
+
+                def run():
+                    for page in range(1, pages + 1):
+                        fn(_fake_page(page, page_size, revision))
+
+                count, elapsed = _measure(run)
+                rows.append((label, phase, count / pages, pages * page_size / elapsed))
+                transaction.savepoint_rollback(sid)
+
+        self.stdout.write(f"pages={pages} page_size={page_size} db={connection.vendor}")
+        self._write_table("page", "rows/sec", rows)
+
+    def _bench_credits(self, n_movies):
+        Movie.objects.bulk_create(
+            [Movie(tmdb_id=BENCH_TMDB_ID_BASE + i, title=f"bench {i}") for i in range(n_movies)],
+            batch_size=500,
+        )
+        movies = list(Movie.objects.filter(tmdb_id__gte=BENCH_TMDB_ID_BASE).order_by("tmdb_id"))
+        credits = [_fake_credits(i) for i in range(len(movies))]
+
+        rows = []
+        for label, fn in (
+            ("per-row", _legacy_credits),
+            ("diff", lambda m, c: apply_movie_credits(m, c, cast_limit=10)),
+        ):
+            sid = transaction.savepoint()
+
+            def run():
+                for movie, payload in zip(movies, credits):
+                    with transaction.atomic():
+                        fn(movie, payload)
+
+            # 1회차: 빈 상태에서 최초 동기화, 2회차: 변경 없는 카탈로그 재동기화
+            for phase in ("initial", "unchanged"):
+                count, elapsed = _measure(run)
+                rows.append((label, phase, count / len(movies), len(movies) / elapsed))
+            transaction.savepoint_rollback(sid)
+
+        self.stdout.write(f"movies={len(movies)} (감독 1 + 배우 10) db={connection.vendor}")
+        self.stdout.write("※ stmts에는 벤치마크가 영화마다 여는 트랜잭션(SAVEPOINT/RELEASE) 2개 포함")
+        self._write_table("movie", "movies/sec", rows)
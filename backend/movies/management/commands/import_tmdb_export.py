@@ -0,0 +1,58 @@
+# backend/movies/management/commands/import_tmdb_export.py
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from movies.services.tmdb import import_tmdb_export
+
+
+class Command(BaseCommand):
+    help = "TMDB daily ID export(movie_ids_MM_DD_YYYY.json.gz)로 새 영화 일괄 등록 (로컬 파일 스트리밍)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="export 파일 경로 (.json.gz 또는 압축 안 한 NDJSON)")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 처리할 id 수")
+        parser.add_argument("--limit", type=int, default=None, help="새로 등록할 최대 영화 수")
+        parser.add_argument("--min-popularity", type=float, default=0.0, help="이 popularity 미만은 건너뜀")
+        parser.add_argument("--include-adult", action="store_true", help="성인물도 포함")
+        parser.add_argument("--with-credits", action="store_true", help="credits(감독/출연진)까지 보강")
+        parser.add_argument(
+            "--inline", action="store_true",
+            help="작업 큐에 넣지 않고 바로 TMDB detail을 받아서 반영 (기본: 큐에만 넣고 run_workers가 처리)",
+        )
+        parser.add_argument("--concurrency", type=int, default=1, help="[--inline] detail/credits 병렬 워커 수")
+        parser.add_argument("--rps", type=float, default=None, help="[--inline] 초당 TMDB 요청 수 제한")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"파일이 없습니다: {path}")
+
+        self.stdout.write(self.style.SUCCESS(f"export 가져오기... {path}"))
+
+        def progress(stats):
+            self.stdout.write(
+                f"  읽음 {stats['read']} / 기존 {stats['existing']} / 신규 {stats['created']} / 보강 {stats['enriched']}"
+            )
+
+        stats = import_tmdb_export(
+            path,
+            chunk_size=options["chunk_size"],
+            limit=options["limit"],
+            include_adult=options["include_adult"],
+            min_popularity=options["min_popularity"],
+            with_credits=options["with_credits"],
+            inline=options["inline"],
+            concurrency=options["concurrency"],
+            rps=options["rps"],
+            progress=progress,
+        )
+
+        tail = f"보강 {stats['enriched']}건" if options["inline"] else "보강은 run_workers로 처리"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 완료: 읽음 {stats['read']}줄 → 신규 {stats['created']}개 / 기존 {stats['existing']}개 / "
+                f"제외 {stats['filtered']}개 / 잘못된 줄 {stats['invalid']}개 ({tail})"
+            )
+        )
@@ -0,0 +1,38 @@
+# backend/movies/management/commands/mirror_tmdb_images.py
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from movies.models import ImageAsset, Movie
+from movies.services.images import enforce_image_budget
+from movies.services.jobs import enqueue_jobs
+
+
+class Command(BaseCommand):
+    help = "포스터/배경 이미지 로컬 미러 작업(IMAGES) 등록 - 다운로드/변형 생성은 run_workers가 처리"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=500, help="popularity 상위 몇 편까지 (미러에 없는 것만)")
+        parser.add_argument("--home", action="store_true", help="홈 섹션에 노출 중인 영화도 포함")
+        parser.add_argument("--evict", action="store_true", help="작업 등록 없이 용량 초과분만 정리(LRU)")
+
+    def handle(self, *args, **options):
+        if not options["evict"]:
+            mirrored = ImageAsset.objects.values("source_path")
+            missing = Movie.objects.filter(
+                (Q(poster_path__gt="") & ~Q(poster_path__in=mirrored))
+                | (Q(backdrop_path__gt="") & ~Q(backdrop_path__in=mirrored))
+            )
+            ids = list(missing.order_by("-popularity").values_list("tmdb_id", flat=True)[: options["limit"]])
+            if options["home"]:
+                ids += list(
+                    missing.filter(home_entries__isnull=False).distinct().values_list("tmdb_id", flat=True)
+                )
+            ids = list(dict.fromkeys(ids))
+            enqueue_jobs("IMAGES", ids)
+            self.stdout.write(self.style.SUCCESS(f"IMAGES 작업 {len(ids)}건 등록 (run_workers로 처리)"))
+
+        evicted, used = enforce_image_budget()
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 미러 사용량 {used / 1024 / 1024:.1f}MB (오래된 이미지 {evicted}건 삭제)")
+        )
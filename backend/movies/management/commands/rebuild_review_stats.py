@@ -0,0 +1,27 @@
+# backend/movies/management/commands/rebuild_review_stats.py
+
+from django.core.management.base import BaseCommand
+
+from movies.models import Movie
+from movies.services.reviews import refresh_review_stats
+from movies.services.utils import chunked
+
+
+class Command(BaseCommand):
+    help = "영화별 리뷰 통계(review_count/rating_avg/rating_hist/top_review) 전체 재계산 (백필/보정용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="한 번에 재계산할 영화 수")
+        parser.add_argument("--reviewed-only", action="store_true", help="리뷰가 있는 영화만 (통계 초기화 생략)")
+
+    def handle(self, *args, **options):
+        if options["reviewed_only"]:
+            ids = Movie.objects.filter(reviews__isnull=False).distinct().values_list("id", flat=True)
+        else:
+            ids = Movie.objects.values_list("id", flat=True)
+
+        total = 0
+        # id 목록은 먼저 다 읽어둠 (SQLite에서 커서를 열어둔 채 같은 테이블을 갱신하지 않도록)
+        for chunk in chunked(list(ids.order_by("id")), options["chunk_size"]):
+            total += refresh_review_stats(chunk)
+        self.stdout.write(self.style.SUCCESS(f"✅ 리뷰 통계 재계산 완료: 영화 {total}편"))
@@ -0,0 +1,32 @@
+# backend/movies/management/commands/rebuild_search_index.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from movies.models import Movie, Person
+from movies.services.search import clear_search_index, fts_enabled, index_movies, index_people
+from movies.services.utils import chunked
+
+
+class Command(BaseCommand):
+    help = "영화/인물 검색 색인(SQLite FTS5) 전체 재생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000, help="한 번에 색인할 행 수")
+
+    def handle(self, *args, **options):
+        if not fts_enabled():
+            self.stdout.write(self.style.WARNING("SQLite가 아니라서 검색 색인을 쓰지 않습니다 (icontains 검색)"))
+            return
+
+        size = options["chunk_size"]
+        with transaction.atomic():
+            clear_search_index()
+            movies = list(Movie.objects.only("id", "title", "original_title", "overview").order_by("id"))
+            for chunk in chunked(movies, size):
+                index_movies(chunk)
+            people = list(Person.objects.order_by("id").values_list("id", "name"))
+            for chunk in chunked(people, size):
+                index_people(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ 검색 색인 재생성: 영화 {len(movies)}편 / 인물 {len(people)}명"))
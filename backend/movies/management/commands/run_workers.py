@@ -0,0 +1,48 @@
+# backend/movies/management/commands/run_workers.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from movies.services.jobs import JOB_LEASE_SECONDS, claim_jobs, worker_id
+from movies.services.tmdb import fetch_pool, run_enrichment_jobs
+
+
+class Command(BaseCommand):
+    help = "TMDB 보강 작업 큐(EnrichmentJob) 처리 - 여러 프로세스로 동시에 실행해도 됨"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="TMDB 요청 병렬 워커 수")
+        parser.add_argument("--rps", type=float, default=None, help="초당 TMDB 요청 수 제한(병렬 모드 기본 40)")
+        parser.add_argument("--batch", type=int, default=20, help="한 번에 점유할 작업 수")
+        parser.add_argument("--lease", type=int, default=JOB_LEASE_SECONDS, help="작업 점유 시간(초)")
+        parser.add_argument("--poll", type=float, default=2.0, help="작업이 없을 때 대기(초)")
+        parser.add_argument("--once", action="store_true", help="대기 중인 작업을 다 처리하면 종료")
+
+    def handle(self, *args, **options):
+        worker = worker_id()
+        limiter, executor = fetch_pool(options["workers"], options["rps"])
+        self.stdout.write(self.style.SUCCESS(f"워커 {worker} 시작 (workers={options['workers']})"))
+
+        done = failed = 0
+        try:
+            while True:
+                jobs = claim_jobs(worker, limit=options["batch"], lease=options["lease"])
+                if not jobs:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll"])
+                    continue
+
+                ok, ng = run_enrichment_jobs(jobs, limiter=limiter, executor=executor)
+                done += ok
+                failed += ng
+                self.stdout.write(f"  작업 {len(jobs)}건 처리 (완료 {ok} / 실패 {ng})")
+        except KeyboardInterrupt:
+            # 점유 중이던 작업은 lease가 끝나면 다른 워커가 다시 가져감
+            self.stdout.write(self.style.WARNING("중단됨"))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        self.stdout.write(self.style.SUCCESS(f"✅ 완료 {done}건 / 실패 {failed}건"))
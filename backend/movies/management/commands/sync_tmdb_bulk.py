@@ -1,7 +1,13 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from movies.management.mixins import TMDBCommandMixin
+from movies.models import SyncRun
 from movies.services.tmdb import fetch_and_sync_genre_master, sync_bulk_movies
+from movies.services.profiling import IngestProfiler, profiling
+from movies.services.jobs import worker_id
+from movies.services.shards import SHARD_LEASE_SECONDS, create_sharded_run, latest_sharded_run, run_shard_worker
+from movies.services.tmdb_cache import cache_mode
 
-class Command(BaseCommand):
+class Command(TMDBCommandMixin, BaseCommand):
     help = "TMDB discover/movie로 영화 다량(예: 500개) 동기화"
 
     def add_arguments(self, parser):
@@ -10,24 +16,142 @@ class Command(BaseCommand):
         parser.add_argument("--with-credits", action="store_true", help="credits(감독/출연진)까지 동기화")
         parser.add_argument("--with-detail", action="store_true", help="detail(runtime/genres 보정)까지 동기화")
         parser.add_argument("--sleep", type=float, default=0.2, help="요청 간 sleep(초)")
+        parser.add_argument("--concurrency", type=int, default=1, help="detail/credits 병렬 워커 수(1이면 순차)")
+        parser.add_argument("--rps", type=float, default=None, help="초당 TMDB 요청 수 제한(병렬 모드 기본 40)")
+        parser.add_argument("--resume", action="store_true", help="같은 --sort로 중단된 마지막 실행을 이어서 진행")
+        parser.add_argument(
+            "--shard-pages", type=int, default=0,
+            help="분할 실행: N페이지씩 구간(SyncShard)으로 나눠 DB에 등록 (다른 프로세스는 --worker로 참여)",
+        )
+        parser.add_argument("--worker", action="store_true", help="진행 중인 분할 실행에 워커로 참여")
+        parser.add_argument("--run", type=int, default=None, help="[--worker] 참여할 실행 번호(기본: 마지막 미완료 분할 실행)")
+        parser.add_argument("--coordinate-only", action="store_true", help="[--shard-pages] 구간만 등록하고 종료")
+        parser.add_argument("--lease", type=int, default=SHARD_LEASE_SECONDS, help="구간 점유 시간(초), 페이지마다 연장")
+        parser.add_argument("--no-cache", action="store_true", help="TMDB 응답 캐시를 사용하지 않음")
+        parser.add_argument("--refresh", action="store_true", help="캐시를 읽지 않고 새로 받아서 캐시 갱신")
+        parser.add_argument("--profile", action="store_true", help="단계별 시간/쿼리 수/HTTP 상태/행 변경 요약 출력")
+        parser.add_argument("--profile-json", type=str, default=None, help="프로파일 결과를 JSON 파일로 저장(--profile 포함)")
 
     def handle(self, *args, **options):
+        mode = "off" if options["no_cache"] else "refresh" if options["refresh"] else "on"
+        profiler = IngestProfiler() if options["profile"] or options["profile_json"] else None
+        with cache_mode(mode), profiling(profiler):
+            self._run(**options)
+        self.write_http_stats()
+        if profiler is not None:
+            self.write_profile(profiler, options["profile_json"])
+
+    def _run(self, **options):
+        if options["shard_pages"] or options["worker"]:
+            return self._run_sharded(**options)
+
         pages = options["pages"]
         sort_by = options["sort"]
         with_credits = options["with_credits"]
         with_detail = options["with_detail"]
         sleep_sec = options["sleep"]
+        concurrency = options["concurrency"]
+        rps = options["rps"]
+
+        run = None
+        if options["resume"]:
+            run = SyncRun.objects.filter(sort_by=sort_by, shard_pages=0).exclude(status="DONE").first()
+            if run is None:
+                self.stdout.write(self.style.WARNING("이어서 할 실행이 없어 새로 시작합니다."))
+            else:
+                # 재개 시에는 처음 실행했던 옵션을 그대로 사용
+                pages, with_detail, with_credits = run.pages, run.with_detail, run.with_credits
+                run.status = "RUNNING"
+                run.save(update_fields=["status", "updated_at"])
+                self.stdout.write(
+                    self.style.SUCCESS(f"실행 #{run.pk} 재개: {run.last_page + 1}페이지부터 (누적 {run.total}개)")
+                )
+        if run is None:
+            run = SyncRun.objects.create(
+                sort_by=sort_by, pages=pages, with_detail=with_detail, with_credits=with_credits
+            )
 
         self.stdout.write(self.style.SUCCESS("1) Genre master 동기화..."))
         fetch_and_sync_genre_master()
 
-        self.stdout.write(self.style.SUCCESS(f"2) Bulk movies 동기화... pages={pages} (≈{pages*20}개)"))
-        total = sync_bulk_movies(
-            pages=pages,
-            sort_by=sort_by,
-            with_credits=with_credits,
-            with_detail=with_detail,
-            sleep_sec=sleep_sec,
+        start_page = run.last_page + 1
+        self.stdout.write(
+            self.style.SUCCESS(f"2) Bulk movies 동기화... pages={start_page}~{pages} (≈{(pages - start_page + 1)*20}개)")
+        )
+        try:
+            total = sync_bulk_movies(
+                pages=pages,
+                sort_by=sort_by,
+                with_credits=with_credits,
+                with_detail=with_detail,
+                sleep_sec=sleep_sec,
+                concurrency=concurrency,
+                rps=rps,
+                start_page=start_page,
+                run=run,
+            )
+        except Exception as e:
+            raise CommandError(
+                f"실행 #{run.pk}가 {run.last_page}페이지까지 반영 후 실패했습니다: {e} "
+                f"(--resume으로 이어서 실행)"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 완료: {total}개 upsert (실행 #{run.pk} 누적 {run.total}개 중 변경 {run.changed}개, "
+                f"실패 {run.errors}건)")
         )
 
-        self.stdout.write(self.style.SUCCESS(f"✅ 완료: {total}개 upsert"))
+    def _run_sharded(self, **options):
+        if options["worker"]:
+            run = (
+                SyncRun.objects.filter(pk=options["run"], shard_pages__gt=0).first()
+                if options["run"] else latest_sharded_run()
+            )
+            if run is None:
+                raise CommandError("참여할 분할 실행이 없습니다. (--shard-pages로 먼저 등록)")
+        else:
+            self.stdout.write(self.style.SUCCESS("1) Genre master 동기화..."))
+            fetch_and_sync_genre_master()
+            run = create_sharded_run(
+                options["pages"],
+                options["shard_pages"],
+                sort_by=options["sort"],
+                with_detail=options["with_detail"],
+                with_credits=options["with_credits"],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"실행 #{run.pk} 등록: {run.pages}페이지 → {run.shards.count()}개 구간 "
+                    f"(다른 프로세스: sync_tmdb_bulk --worker --run {run.pk})"
+                )
+            )
+            if options["coordinate_only"]:
+                return
+
+        worker = worker_id()
+        self.stdout.write(self.style.SUCCESS(f"워커 {worker}: 실행 #{run.pk} 구간 처리..."))
+
+        def on_shard(shard, total, error):
+            if error is None:
+                self.stdout.write(f"  p{shard.start_page}-{shard.end_page}: {total}개")
+            else:
+                self.stdout.write(self.style.WARNING(f"  p{shard.start_page}-{shard.end_page} 실패: {error}"))
+
+        done = run_shard_worker(
+            run,
+            worker=worker,
+            concurrency=options["concurrency"],
+            rps=options["rps"],
+            sleep_sec=options["sleep"],
+            lease=options["lease"],
+            on_shard=on_shard,
+        )
+
+        run.refresh_from_db()
+        remaining = run.shards.exclude(status="DONE").count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 워커 종료: 구간 {done}개 처리 (실행 #{run.pk} {run.status}, 누적 {run.total}개 중 변경 {run.changed}개, "
+                f"실패 {run.errors}건, 남은 구간 {remaining}개)"
+            )
+        )
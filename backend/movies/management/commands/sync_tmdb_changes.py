@@ -0,0 +1,56 @@
+# backend/movies/management/commands/sync_tmdb_changes.py
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from movies.models import SyncCheckpoint
+from movies.services.tmdb import sync_changed_movies
+from movies.services.tmdb_cache import cache_mode
+
+CHECKPOINT_NAME = "movie_changes"
+
+
+class Command(BaseCommand):
+    help = "TMDB /movie/changes 기반 증분 동기화 (DB에 있는 영화 중 변경된 것만 갱신)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=1, help="체크포인트가 없을 때 조회할 최근 일수")
+        parser.add_argument("--with-credits", action="store_true", help="credits(감독/출연진)까지 다시 동기화")
+        parser.add_argument("--concurrency", type=int, default=1, help="detail/credits 병렬 워커 수(1이면 순차)")
+        parser.add_argument("--rps", type=float, default=None, help="초당 TMDB 요청 수 제한(병렬 모드 기본 40)")
+
+    def handle(self, *args, **options):
+        started_at = timezone.now()
+        checkpoint = SyncCheckpoint.objects.filter(name=CHECKPOINT_NAME).first()
+        if checkpoint:
+            since = checkpoint.last_synced_at
+        else:
+            since = started_at - timedelta(days=options["days"])
+
+        start_date = timezone.localdate(since)
+        end_date = timezone.localdate(started_at)
+        self.stdout.write(self.style.SUCCESS(f"1) 변경 피드 조회... {start_date} ~ {end_date}"))
+
+        # 변경된 영화를 다시 받는 것이 목적이므로 캐시된 detail은 읽지 않음
+        with cache_mode("refresh"):
+            result = sync_changed_movies(
+                start_date,
+                end_date,
+                with_credits=options["with_credits"],
+                concurrency=options["concurrency"],
+                rps=options["rps"],
+            )
+
+        # 실패가 있어도 체크포인트는 전진(실패 건은 다음 변경 때 다시 잡힘) - 시작 시각 기준으로 저장
+        SyncCheckpoint.objects.update_or_create(
+            name=CHECKPOINT_NAME, defaults={"last_synced_at": started_at}
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 완료: 변경 {result['changed']}건 → 갱신 {result['updated']}건 / "
+                f"미보유 스킵 {result['skipped']}건 / 실패 {result['failed']}건"
+            )
+        )
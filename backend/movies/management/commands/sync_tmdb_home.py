@@ -1,30 +1,58 @@
 # backend/movies/management/commands/sync_tmdb_home.py
 
 from django.core.management.base import BaseCommand
+from movies.management.mixins import TMDBCommandMixin
 from movies.services.tmdb import fetch_and_sync_genre_master, sync_home_section
+from movies.services.profiling import IngestProfiler, profiling
+from movies.services.tmdb_cache import cache_mode
 
 
-class Command(BaseCommand):
+class Command(TMDBCommandMixin, BaseCommand):
     help = "TMDB 홈 섹션(POPULAR/NOW_PLAYING/TOP_RATED) 동기화"
 
     def add_arguments(self, parser):
         parser.add_argument("--pages", type=int, default=1, help="각 섹션당 가져올 페이지 수(기본 1)")
         parser.add_argument("--no-credits", action="store_true", help="credits(감독/출연진) 동기화 생략")
+        parser.add_argument("--with-detail", action="store_true", help="detail(runtime/genres 보정)까지 동기화")
+        parser.add_argument("--no-cache", action="store_true", help="TMDB 응답 캐시를 사용하지 않음")
+        parser.add_argument("--refresh", action="store_true", help="캐시를 읽지 않고 새로 받아서 캐시 갱신")
+        parser.add_argument("--profile", action="store_true", help="단계별 시간/쿼리 수/HTTP 상태/행 변경 요약 출력")
+        parser.add_argument("--profile-json", type=str, default=None, help="프로파일 결과를 JSON 파일로 저장(--profile 포함)")
 
     def handle(self, *args, **options):
+        mode = "off" if options["no_cache"] else "refresh" if options["refresh"] else "on"
+        profiler = IngestProfiler() if options["profile"] or options["profile_json"] else None
+        with cache_mode(mode), profiling(profiler):
+            self._run(**options)
+        self.write_http_stats()
+        if profiler is not None:
+            self.write_profile(profiler, options["profile_json"])
+
+    def _run(self, **options):
         pages = options["pages"]
         with_credits = not options["no_credits"]
+        with_detail = options["with_detail"]
 
         self.stdout.write(self.style.SUCCESS("1) Genre master 동기화..."))
         fetch_and_sync_genre_master()
 
         self.stdout.write(self.style.SUCCESS("2) POPULAR 동기화..."))
-        sync_home_section("POPULAR", "/movie/popular", pages=pages, with_credits=with_credits)
+        self._write_section(
+            sync_home_section("POPULAR", "/movie/popular", pages=pages, with_credits=with_credits, with_detail=with_detail)
+        )
 
         self.stdout.write(self.style.SUCCESS("3) NOW_PLAYING 동기화..."))
-        sync_home_section("NOW_PLAYING", "/movie/now_playing", pages=pages, with_credits=with_credits)
+        self._write_section(
+            sync_home_section("NOW_PLAYING", "/movie/now_playing", pages=pages, with_credits=with_credits, with_detail=with_detail)
+        )
 
         self.stdout.write(self.style.SUCCESS("4) TOP_RATED 동기화..."))
-        sync_home_section("TOP_RATED", "/movie/top_rated", pages=pages, with_credits=with_credits)
+        self._write_section(
+            sync_home_section("TOP_RATED", "/movie/top_rated", pages=pages, with_credits=with_credits, with_detail=with_detail)
+        )
 
         self.stdout.write(self.style.SUCCESS("✅ 완료"))
+
+    def _write_section(self, result):
+        count, changed = result
+        self.stdout.write(f"   {count}개 (변경 {changed}개 / 그대로 {count - changed}개)")
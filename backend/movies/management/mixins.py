@@ -0,0 +1,30 @@
+# backend/movies/management/mixins.py
+from movies.services.tmdb_cache import get_cache
+from movies.services.tmdb_client import get_client
+
+
+class TMDBCommandMixin:
+    """
+    TMDB 동기화 커맨드 공용 출력
+    - write_http_stats(): 공용 클라이언트의 요청/재시도/실패/지연 + 응답 캐시 hit/miss
+    - write_profile(): --profile 요약 표 (+ --profile-json 저장)
+    """
+
+    def write_http_stats(self):
+        stats = get_client().stats()
+        self.stdout.write(
+            f"HTTP: 요청 {stats['requests']}건 / 재시도 {stats['retries']}건 / 실패 {stats['errors']}건 / "
+            f"평균 {stats['latency_avg'] * 1000:.0f}ms / 최대 {stats['latency_max'] * 1000:.0f}ms"
+        )
+        cache = get_cache()
+        if cache is not None:
+            cache_stats = cache.stats()
+            self.stdout.write(f"캐시: hit {cache_stats['hits']}건 / miss {cache_stats['misses']}건")
+
+    def write_profile(self, profiler, json_path=None):
+        self.stdout.write(self.style.SUCCESS("프로파일"))
+        for line in profiler.summary_lines():
+            self.stdout.write(line)
+        if json_path:
+            profiler.write_json(json_path)
+            self.stdout.write(f"프로파일 JSON 저장: {json_path}")
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-18 08:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_syncrun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HomeSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=20, unique=True)),
+                ('active_version', models.PositiveIntegerField(default=0)),
+                ('swapped_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RemoveConstraint(
+            model_name='homesectionentry',
+            name='unique_section_movie',
+        ),
+        migrations.AddField(
+            model_name='homesectionentry',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='homesectionentry',
+            constraint=models.UniqueConstraint(fields=('section', 'version', 'movie'), name='unique_section_version_movie'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_homesection_versions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
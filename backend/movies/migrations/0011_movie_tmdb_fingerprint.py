@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0010_fetchlease'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='tmdb_fingerprint',
+            field=models.CharField(blank=True, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='syncrun',
+            name='changed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
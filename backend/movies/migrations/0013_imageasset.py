@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0012_syncshard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageAsset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_path', models.CharField(max_length=255, unique=True)),
+                ('sha1', models.CharField(db_index=True, max_length=40)),
+                ('width', models.PositiveIntegerField(default=0)),
+                ('height', models.PositiveIntegerField(default=0)),
+                ('variants', models.JSONField(default=dict)),
+                ('bytes', models.PositiveIntegerField(default=0)),
+                ('accessed_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='enrichmentjob',
+            name='kind',
+            field=models.CharField(choices=[('DETAIL', 'Detail'), ('CREDITS', 'Credits'), ('ENRICH', 'Detail + Credits'), ('IMAGES', 'Poster/Backdrop mirror')], max_length=10),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0015_contentversion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['popularity', 'vote_count', 'id'], name='movie_popular_keyset'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['release_date', 'id'], name='movie_latest_keyset'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['vote_average', 'vote_count', 'id'], name='movie_rating_keyset'),
+        ),
+    ]
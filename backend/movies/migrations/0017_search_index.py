@@ -0,0 +1,69 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:11
+
+import re
+import unicodedata
+
+from django.db import migrations
+
+# 이 시점의 테이블 이름/토큰화 규칙을 고정 (services/search.py가 바뀌어도 마이그레이션 결과는 그대로)
+# 이후 규칙이 바뀌면 manage.py rebuild_search_index로 다시 색인
+MOVIE_FTS = "movies_movie_fts"
+PERSON_FTS = "movies_person_fts"
+_CJK = "\u1100-\u11FF\u3040-\u30FF\u3130-\u318F\u3400-\u4DBF\u4E00-\u9FFF\uAC00-\uD7A3"
+_TOKEN_RE = re.compile(rf"([{_CJK}]+)|([^\W{_CJK}]+)")
+
+
+def search_tokens(text):
+    # 한글/한자/가나 연속 구간은 2글자씩(bigram), 나머지는 단어 단위 → 공백으로 이음
+    tokens = []
+    for m in _TOKEN_RE.finditer(unicodedata.normalize("NFKC", text or "").lower()):
+        run = m.group(1)
+        if run:
+            tokens.extend([run] if len(run) == 1 else [run[i : i + 2] for i in range(len(run) - 1)])
+        else:
+            tokens.append(m.group(2))
+    return " ".join(tokens)
+
+
+def create_search_index(apps, schema_editor):
+    # SQLite FTS5 전용 (다른 DB는 검색이 icontains로 동작)
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    Movie = apps.get_model("movies", "Movie")
+    Person = apps.get_model("movies", "Person")
+    with schema_editor.connection.cursor() as cursor:
+        # 토큰은 위 search_tokens로 미리 만들어서 넣음 (한글 bigram)
+        cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {MOVIE_FTS} USING fts5(title, original_title, overview)")
+        cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {PERSON_FTS} USING fts5(name)")
+        cursor.executemany(
+            f"INSERT INTO {MOVIE_FTS} (rowid, title, original_title, overview) VALUES (%s, %s, %s, %s)",
+            [
+                (pk, search_tokens(title), search_tokens(original_title), search_tokens(overview))
+                for pk, title, original_title, overview in Movie.objects.values_list(
+                    "pk", "title", "original_title", "overview"
+                ).iterator()
+            ],
+        )
+        cursor.executemany(
+            f"INSERT INTO {PERSON_FTS} (rowid, name) VALUES (%s, %s)",
+            [(pk, search_tokens(name)) for pk, name in Person.objects.values_list("pk", "name").iterator()],
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {MOVIE_FTS}")
+        cursor.execute(f"DROP TABLE IF EXISTS {PERSON_FTS}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0016_movie_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,6 +1,18 @@
 # backend/movies/models.py
+import re
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+
+def describe_error(error) -> str:
+    """
+    예외를 저장용 문자열로 (요청 URL에 api_key가 포함될 수 있으므로 가려서 저장)
+    """
+    return re.sub(r"api_key=[^&\s]+", "api_key=***", f"{type(error).__name__}: {error}")
 
 
 class Genre(models.Model):
@@ -43,6 +55,24 @@ class Movie(models.Model):
     people = models.ManyToManyField(Person, through="MovieCredit", related_name="movies")
 
     updated_at = models.DateTimeField(auto_now=True)
+    enriched_at = models.DateTimeField(null=True, blank=True)  # TMDB 상세(+크레딧) 마지막 반영 시각
+    tmdb_fingerprint = models.CharField(max_length=40, blank=True)  # TMDB 목록 필드+장르 해시(같으면 쓰기 생략)
+
+    # 리뷰 통계 (watched 리뷰 기준, movies/services/reviews.py refresh_review_stats가 갱신)
+    # → 영화 카드/상세는 reviews 테이블을 읽지 않음
+    review_count = models.PositiveIntegerField(default=0)
+    rating_avg = models.FloatField(default=0)
+    rating_hist = models.JSONField(default=list, blank=True)  # [1점 수, 2점 수, ..., 5점 수]
+    top_review_id = models.PositiveIntegerField(null=True, blank=True)  # 좋아요 최다(→최신) 리뷰
+    top_review = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)  # 카드용 스냅샷
+
+    class Meta:
+        # movie_list 커서 모드 정렬 키 (views.MOVIE_LIST_KEYSETS) → 깊은 페이지도 인덱스 범위 스캔
+        indexes = [
+            models.Index(fields=["popularity", "vote_count", "id"], name="movie_popular_keyset"),
+            models.Index(fields=["release_date", "id"], name="movie_latest_keyset"),
+            models.Index(fields=["vote_average", "vote_count", "id"], name="movie_rating_keyset"),
+        ]
 
     def __str__(self):
         return self.title
@@ -78,6 +108,18 @@ class MovieCredit(models.Model):
         ]
 
 
+class HomeSection(models.Model):
+    """
+    홈 섹션별 현재 노출 중인 순위 version (sync_home_section이 새 version을 다 넣은 뒤 포인터만 교체)
+    """
+    code = models.CharField(max_length=20, unique=True)
+    active_version = models.PositiveIntegerField(default=0)
+    swapped_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.code} v{self.active_version}"
+
+
 class HomeSectionEntry(models.Model):
     SECTION_CHOICES = [
         ("POPULAR", "Popular"),
@@ -85,17 +127,262 @@ class HomeSectionEntry(models.Model):
         ("TOP_RATED", "Top Rated"),
     ]
     section = models.CharField(max_length=20, choices=SECTION_CHOICES)
+    version = models.PositiveIntegerField(default=0)
     movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name="home_entries")
     rank = models.PositiveIntegerField(default=0)
     synced_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
-            models.UniqueConstraint(fields=["section", "movie"], name="unique_section_movie")
+            models.UniqueConstraint(fields=["section", "version", "movie"], name="unique_section_version_movie")
         ]
         ordering = ["rank"]
 
 
+class ContentVersion(models.Model):
+    """
+    캐시 무효화용 내용 version (movies/services/response_cache.py)
+    - 예: key="home" → 홈 섹션 교체/홈 영화 리뷰 통계 변경 시 +1, 캐시 키에 version이 들어가서 이전 응답은 자연히 버려짐
+    """
+    key = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key} v{self.version}"
+
+
+class SyncCheckpoint(models.Model):
+    """
+    증분 동기화 체크포인트 (예: name="movie_changes" → 마지막으로 반영한 시각)
+    """
+    name = models.CharField(max_length=50, unique=True)
+    last_synced_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_synced_at}"
+
+
+class SyncRun(models.Model):
+    """
+    sync_tmdb_bulk 실행 기록 - 페이지마다 진행 상황을 남겨서 --resume으로 이어서 실행
+    """
+    STATUS_CHOICES = [
+        ("RUNNING", "Running"),
+        ("FAILED", "Failed"),
+        ("DONE", "Done"),
+    ]
+
+    sort_by = models.CharField(max_length=50)
+    pages = models.PositiveIntegerField()
+    with_detail = models.BooleanField(default=False)
+    with_credits = models.BooleanField(default=False)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="RUNNING")
+    last_page = models.PositiveIntegerField(default=0)  # 커밋까지 끝난 마지막 페이지
+    total = models.PositiveIntegerField(default=0)      # upsert한 영화 수
+    errors = models.PositiveIntegerField(default=0)     # detail/credits 실패 수
+    changed = models.PositiveIntegerField(default=0)    # 새로 생겼거나 내용이 바뀐 영화 수(나머지는 쓰기 생략)
+    shard_pages = models.PositiveIntegerField(default=0)  # 0이면 단일 프로세스, N이면 N페이지씩 SyncShard로 분할
+    last_error = models.TextField(blank=True)
+
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-id"]
+
+    def __str__(self):
+        return f"#{self.pk} {self.sort_by} {self.last_page}/{self.pages} ({self.status})"
+
+    def record_page(self, page, count: int, errors: int = 0, changed: int = 0):
+        """
+        page=None이면 누적 수만 더함 (분할 실행은 진행 페이지를 SyncShard가 기록)
+        """
+        fields = {"last_page": page} if page is not None else {}
+        SyncRun.objects.filter(pk=self.pk).update(
+            **fields,
+            total=models.F("total") + count,
+            errors=models.F("errors") + errors,
+            changed=models.F("changed") + changed,
+            updated_at=timezone.now(),
+        )
+        self.refresh_from_db(fields=["last_page", "total", "errors", "changed", "updated_at"])
+
+    def mark_failed(self, error):
+        self.status = "FAILED"
+        self.last_error = describe_error(error)
+        self.save(update_fields=["status", "last_error", "updated_at"])
+
+    def mark_done(self):
+        self.status = "DONE"
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "finished_at", "updated_at"])
+
+
+class ShardLeaseLost(Exception):
+    """SyncShard lease가 만료돼 다른 워커에게 넘어감"""
+
+
+class SyncShard(models.Model):
+    """
+    분할 실행(SyncRun.shard_pages > 0)의 페이지 구간 lease - 여러 프로세스가 나눠서 처리
+    - 워커는 locked_until까지 점유하고 페이지마다 연장(heartbeat)
+    - 워커가 죽어서 lease가 끝나면 다른 워커가 last_page 다음 페이지부터 이어서 처리
+    - sync_bulk_movies(run=shard)로 넘기므로 SyncRun과 같은 record_page/mark_failed/mark_done을 제공
+    """
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+
+    run = models.ForeignKey(SyncRun, on_delete=models.CASCADE, related_name="shards")
+    start_page = models.PositiveIntegerField()
+    end_page = models.PositiveIntegerField()
+    last_page = models.PositiveIntegerField(default=0)  # 커밋까지 끝난 마지막 페이지(0이면 시작 전)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="PENDING")
+    total = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    locked_by = models.CharField(max_length=64, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # 워커가 lease 연장 시 사용 (movies/services/shards.py)
+    lease_seconds = 120
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["run", "start_page"], name="unique_run_shard")
+        ]
+        ordering = ["start_page"]
+
+    def __str__(self):
+        return f"run #{self.run_id} p{self.start_page}-{self.end_page} ({self.status})"
+
+    @property
+    def next_page(self) -> int:
+        return max(self.start_page, self.last_page + 1)
+
+    def _mine(self):
+        return SyncShard.objects.filter(pk=self.pk, locked_by=self.locked_by, status="RUNNING")
+
+    def record_page(self, page: int, count: int, errors: int = 0, changed: int = 0):
+        now = timezone.now()
+        updated = self._mine().update(
+            last_page=page,
+            total=models.F("total") + count,
+            errors=models.F("errors") + errors,
+            locked_until=now + timedelta(seconds=self.lease_seconds),
+            updated_at=now,
+        )
+        if not updated:
+            # lease가 끝나 다른 워커가 가져감 → 이 워커는 여기서 중단
+            raise ShardLeaseLost(str(self))
+        self.last_page = page
+        self.run.record_page(None, count, errors, changed=changed)
+
+    def mark_failed(self, error):
+        retry = self.attempts < self.max_attempts and not isinstance(error, ShardLeaseLost)
+        self._mine().update(
+            status="PENDING" if retry else "FAILED",
+            locked_until=None,
+            last_error=describe_error(error),
+            updated_at=timezone.now(),
+        )
+        if not retry and not isinstance(error, ShardLeaseLost):
+            self.run.mark_failed(error)
+
+    def mark_done(self):
+        self._mine().update(status="DONE", locked_until=None, updated_at=timezone.now())
+        if not self.run.shards.exclude(status="DONE").exists():
+            self.run.mark_done()
+
+
+class EnrichmentJob(models.Model):
+    """
+    TMDB 보강 작업 큐 (movies/services/jobs.py, run_workers 명령이 처리)
+    - (kind, tmdb_id)당 1행: 이미 대기/실행 중이면 다시 넣어도 중복되지 않음
+    - 워커는 locked_until(lease)까지 점유, 그 안에 끝내지 못하면 다른 워커가 다시 가져감
+    """
+    KIND_CHOICES = [
+        ("DETAIL", "Detail"),
+        ("CREDITS", "Credits"),
+        ("ENRICH", "Detail + Credits"),
+        ("IMAGES", "Poster/Backdrop mirror"),
+    ]
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    tmdb_id = models.PositiveIntegerField()
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="PENDING")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)   # 이 시각 이후에 실행(재시도 백오프)
+    locked_by = models.CharField(max_length=64, blank=True)  # 점유한 워커의 claim 토큰
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "tmdb_id"], name="unique_enrichment_job")
+        ]
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="enrichment_job_due"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.tmdb_id} ({self.status})"
+
+
+class ImageAsset(models.Model):
+    """
+    TMDB 이미지(poster_path/backdrop_path) 로컬 미러 (movies/services/images.py)
+    - 원본을 1번 받아서 폭별 변형(w185/w342/w780)만 MEDIA_ROOT에 저장, 파일명은 원본 내용 해시(sha1)
+    - accessed_at: 응답에 로컬 URL을 내보낸 마지막 시각 → 용량 초과 시 오래된 것부터 삭제(LRU)
+    """
+    source_path = models.CharField(max_length=255, unique=True)  # TMDB 경로 (예: "/abc.jpg")
+    sha1 = models.CharField(max_length=40, db_index=True)
+    width = models.PositiveIntegerField(default=0)
+    height = models.PositiveIntegerField(default=0)
+    variants = models.JSONField(default=dict)   # {"w185": "tmdb_images/ab/abcd..._w185.jpg", ...}
+    bytes = models.PositiveIntegerField(default=0)  # 변형 파일 크기 합
+    accessed_at = models.DateTimeField(default=timezone.now, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.source_path
+
+
+class FetchLease(models.Model):
+    """
+    프로세스 간 TMDB 요청 중복 방지용 lease (movies/services/singleflight.py)
+    - key(예: "enrich:550")당 1행, 가진 쪽만 요청 → 끝나면 삭제, 프로세스가 죽어도 expires_at 이후엔 다시 잡을 수 있음
+    """
+    key = models.CharField(max_length=100, unique=True)
+    holder = models.CharField(max_length=64)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.key} ({self.holder})"
+
+
 
 
 
@@ -0,0 +1,139 @@
+# backend/movies/pagination.py
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    # datetime은 마이크로초까지 그대로 (경계값이 조금이라도 바뀌면 행이 빠지거나 중복됨)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+class KeysetPagination:
+    """
+    정렬 키 튜플 기준 커서 페이지네이션 (?cursor=)
+    - ordering: ["-popularity", "-vote_count", "-id"]처럼 마지막은 유일한 키(id)
+      → 다음 페이지는 "마지막 행의 키보다 뒤" 조건(WHERE)으로 바로 찾음 (OFFSET 스캔/COUNT 없음)
+    - 커서: 마지막 행의 정렬 키 값을 base64로 감싼 값 (클라이언트는 내용을 몰라도 됨)
+    - nullable 필드는 NULL을 항상 맨 뒤로 정렬
+    - count는 ?with_count=1일 때만
+    - 응답: {"next": url | null, "results": [...], ("count": n)}
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    count_query_param = "with_count"
+
+    def __init__(self, ordering, nullable=()):
+        self.ordering = [(f.lstrip("-"), f.startswith("-")) for f in ordering]
+        self.nullable = set(nullable)
+
+    @classmethod
+    def requested(cls, request) -> bool:
+        # ?cursor= (빈 값 = 첫 페이지)가 있으면 커서 모드, 없으면 기존 페이지 번호 방식
+        return cls.cursor_query_param in request.query_params
+
+    # ----------------------------
+    # 커서
+    # ----------------------------
+    def _signature(self) -> str:
+        return ",".join(("-" if desc else "") + name for name, desc in self.ordering)
+
+    def encode_cursor(self, obj) -> str:
+        payload = {"o": self._signature(), "v": [_encode_value(getattr(obj, name)) for name, _ in self.ordering]}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> list:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = payload["v"]
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound("잘못된 cursor입니다.")
+        # 다른 정렬(sort)에서 만든 커서
+        if payload.get("o") != self._signature() or len(values) != len(self.ordering):
+            raise NotFound("잘못된 cursor입니다.")
+        return values
+
+    # ----------------------------
+    # 쿼리
+    # ----------------------------
+    def _order_by(self):
+        out = []
+        for name, desc in self.ordering:
+            expr = F(name).desc(nulls_last=True) if desc else F(name).asc(nulls_last=True)
+            out.append(expr if name in self.nullable else (f"-{name}" if desc else name))
+        return out
+
+    def _after(self, name, desc, value) -> Q:
+        # 정렬상 value보다 뒤에 오는 행
+        if value is None:
+            return Q(pk__in=[])  # NULL은 맨 뒤 → 더 뒤는 없음
+        after = Q(**{f"{name}__lt" if desc else f"{name}__gt": value})
+        if name in self.nullable:
+            after |= Q(**{f"{name}__isnull": True})
+        return after
+
+    def _same(self, name, value) -> Q:
+        return Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+
+    def _keyset_filter(self, values) -> Q:
+        # (a, b, id) > (va, vb, vid) 를 정렬 방향/NULL 고려해서 풀어 씀:
+        # a 뒤 | (a 같고 b 뒤) | (a, b 같고 id 뒤)
+        condition = Q(pk__in=[])
+        prefix = Q()
+        for (name, desc), value in zip(self.ordering, values):
+            condition |= prefix & self._after(name, desc, value)
+            prefix &= self._same(name, value)
+
+        # 첫 키의 범위 조건을 따로 붙여서 인덱스 범위 탐색(seek)이 되게 함 (OR만 있으면 처음부터 스캔)
+        name, desc = self.ordering[0]
+        if values[0] is not None and name not in self.nullable:
+            condition &= Q(**{f"{name}__lte" if desc else f"{name}__gte": values[0]})
+        return condition
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        self.count = None
+        if request.query_params.get(self.count_query_param) in ("1", "true"):
+            self.count = queryset.order_by().count()
+
+        cursor = request.query_params.get(self.cursor_query_param) or ""
+        if cursor:
+            queryset = queryset.filter(self._keyset_filter(self.decode_cursor(cursor)))
+
+        size = self.get_page_size(request)
+        rows = list(queryset.order_by(*self._order_by())[: size + 1])
+        self.has_next = len(rows) > size
+        self.page = rows[:size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data, **extra):
+        body = {"next": self.get_next_link(), **extra, "results": data}
+        if self.count is not None:
+            body["count"] = self.count
+        return Response(body)
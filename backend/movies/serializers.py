@@ -1,6 +1,7 @@
-from django.db.models import Count
+from django.db.models import Manager
 from rest_framework import serializers
 from .models import Movie, Genre, Person, MovieCredit
+from .services.images import assets_for_paths, variant_urls
 
 
 class GenreSerializer(serializers.ModelSerializer):
@@ -15,9 +16,58 @@ class PersonSerializer(serializers.ModelSerializer):
         fields = ["tmdb_id", "name", "profile_path", "known_for_department"]
 
 
-class MovieListSerializer(serializers.ModelSerializer):
+def preload_movie_context(context: dict, movies) -> None:
+    """
+    영화 여러 편을 직렬화하기 전에 미러 이미지(ImageAsset)를 쿼리 1번으로 읽어서 context에 넣음
+    - 없는 경로도 None으로 기록 → get_images에서 다시 조회하지 않음 (이미 context에 있는 경로는 건너뜀)
+    - 대표 리뷰/리뷰 통계는 Movie에 저장된 값을 그대로 사용 (services/reviews.py refresh_review_stats)
+    """
+    movies = [m for m in movies if m is not None]
+    loaded = context.get("image_assets", {})
+    paths = [p for m in movies for p in (m.poster_path, m.backdrop_path) if p and p not in loaded]
+    if not paths:
+        return
+    found = assets_for_paths(paths)
+    context.setdefault("image_assets", {}).update({p: found.get(p) for p in paths})
+
+
+class MovieListPageSerializer(serializers.ListSerializer):
+    """
+    MovieListSerializer(many=True): 페이지 전체 영화의 부가 데이터를 미리 읽음 (영화 수와 상관없이 쿼리 수 고정)
+    """
+
+    def to_representation(self, data):
+        movies = list(data.all() if isinstance(data, Manager) else data)
+        preload_movie_context(self.context, movies)
+        return super().to_representation(movies)
+
+
+class MovieImagesMixin:
+    """
+    images: {"poster": {"w185": url, ...} | None, "backdrop": ...}
+    - 로컬 미러(services/images.py)에 변형이 있을 때만 URL, 없으면 None (프론트는 TMDB CDN 사용)
+    - context에 request가 있으면 절대 URL
+    """
+
+    def get_images(self, obj):
+        assets = self.context.get("image_assets")
+        if assets is None or any(p and p not in assets for p in (obj.poster_path, obj.backdrop_path)):
+            # 단건 직렬화: 이 영화 것만 조회
+            paths = [p for p in (obj.poster_path, obj.backdrop_path) if p]
+            found = assets_for_paths(paths)
+            assets = self.context.setdefault("image_assets", {})
+            assets.update({p: found.get(p) for p in paths})
+
+        request = self.context.get("request")
+        return {
+            "poster": variant_urls(assets.get(obj.poster_path), request),
+            "backdrop": variant_urls(assets.get(obj.backdrop_path), request),
+        }
+
+
+class MovieListSerializer(MovieImagesMixin, serializers.ModelSerializer):
     genres = GenreSerializer(many=True, read_only=True)
-    top_review = serializers.SerializerMethodField()
+    images = serializers.SerializerMethodField()
 
     class Meta:
         model = Movie
@@ -32,41 +82,19 @@ class MovieListSerializer(serializers.ModelSerializer):
             "vote_count",
             "popularity",
             "genres",
+            "review_count",
+            "rating_avg",
             "top_review",
+            "images",
         ]
-
-    def get_top_review(self, obj):
-        # ✅ 안전하게: Review 객체에 annotate 붙여서 setter 문제 터지지 않게 values()로 처리
-        try:
-            from reviews.models import Review  # 필요할 때만 import (순환 방지)
-        except Exception:
-            return None
-
-        r = (
-            Review.objects.filter(movie=obj)
-            .annotate(likes_count=Count("likes"))
-            .select_related("user")
-            .order_by("-likes_count", "-created_at")
-            .values("id", "content", "rating", "likes_count", "created_at", "user__username")
-            .first()
-        )
-        if not r:
-            return None
-
-        return {
-            "id": r["id"],
-            "content": r["content"],
-            "rating": r["rating"],
-            "like_count": r["likes_count"],  # 프론트 호환
-            "username": r["user__username"],
-            "created_at": r["created_at"],
-        }
+        list_serializer_class = MovieListPageSerializer
 
 
-class MovieDetailSerializer(serializers.ModelSerializer):
+class MovieDetailSerializer(MovieImagesMixin, serializers.ModelSerializer):
     genres = GenreSerializer(many=True, read_only=True)
     directors = serializers.SerializerMethodField()
     cast = serializers.SerializerMethodField()
+    images = serializers.SerializerMethodField()
 
     class Meta:
         model = Movie
@@ -85,14 +113,19 @@ class MovieDetailSerializer(serializers.ModelSerializer):
             "genres",
             "directors",
             "cast",
+            "review_count",
+            "rating_avg",
+            "rating_hist",
+            "images",
         ]
 
-    def _credits_qs(self, movie):
-        # 기본 reverse name이 moviecredit_set일 가능성 높아서 모델로 직접 조회
-        return MovieCredit.objects.filter(movie=movie).select_related("person")
+    def _credits(self, movie, role_type):
+        # movie_detail/movie_bundle은 moviecredit_set(+person)을 prefetch해 둠 → 추가 쿼리 없이 메모리에서 나눔
+        credits = [c for c in movie.moviecredit_set.all() if c.role_type == role_type]
+        return sorted(credits, key=lambda c: c.order)
 
     def get_directors(self, obj):
-        qs = self._credits_qs(obj).filter(role_type="DIRECTOR").order_by("order")
+        qs = self._credits(obj, "DIRECTOR")
         return [
             {
                 "tmdb_id": c.person.tmdb_id,
@@ -105,7 +138,7 @@ class MovieDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_cast(self, obj):
-        qs = self._credits_qs(obj).filter(role_type="CAST").order_by("order")
+        qs = self._credits(obj, "CAST")
         return [
             {
                 "tmdb_id": c.person.tmdb_id,
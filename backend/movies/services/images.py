@@ -0,0 +1,178 @@
+# backend/movies/services/images.py
+import hashlib
+import io
+import os
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+import requests
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+from PIL import Image
+
+from movies.models import ImageAsset
+from movies.services.response_cache import HOME_VERSION_KEY, bump_version
+
+# 미러에 만들 폭별 변형 (원본보다 넓은 변형은 원본 크기 그대로 저장)
+IMAGE_VARIANTS = {"w185": 185, "w342": 342, "w780": 780}
+# MEDIA_ROOT 아래 미러 디렉터리
+IMAGE_DIR = "tmdb_images"
+# accessed_at은 이 간격(초)보다 오래됐을 때만 갱신 (응답마다 UPDATE 하지 않도록)
+TOUCH_INTERVAL = 3600
+
+_session = requests.Session()
+
+
+def _variant_relpath(sha1: str, variant: str) -> str:
+    # 원본 내용 해시로 경로 결정 → 같은 이미지는 경로가 달라도 파일 1벌
+    return f"{IMAGE_DIR}/{sha1[:2]}/{sha1}_{variant}.jpg"
+
+
+def _write_atomic(path: Path, data: bytes):
+    # 임시 파일에 쓰고 교체 → 다른 워커/요청이 반쯤 쓴 파일을 보지 않게
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def fetch_image(source_path: str, timeout=10) -> dict:
+    """
+    TMDB 원본 이미지 1장을 받아서 변형(IMAGE_VARIANTS)을 MEDIA_ROOT에 저장 (DB 접근 없음 → 워커 스레드용)
+    - 이미 같은 해시의 변형 파일이 있으면 다시 만들지 않음
+    - 반환: ImageAsset 필드 dict
+    """
+    url = f"{settings.TMDB_IMAGE_BASE_URL.rstrip('/')}/original{source_path}"
+    res = _session.get(url, timeout=timeout)
+    res.raise_for_status()
+
+    sha1 = hashlib.sha1(res.content).hexdigest()
+    media_root = Path(settings.MEDIA_ROOT)
+    with Image.open(io.BytesIO(res.content)) as original:
+        original = original.convert("RGB")
+        width, height = original.size
+
+        variants, total = {}, 0
+        for variant, max_width in IMAGE_VARIANTS.items():
+            relpath = _variant_relpath(sha1, variant)
+            path = media_root / relpath
+            if not path.exists():
+                img = original
+                if width > max_width:
+                    img = original.resize((max_width, round(height * max_width / width)), Image.LANCZOS)
+                buf = io.BytesIO()
+                img.save(buf, "JPEG", quality=85, optimize=True, progressive=True)
+                _write_atomic(path, buf.getvalue())
+            variants[variant] = relpath
+            total += path.stat().st_size
+
+    return {
+        "source_path": source_path,
+        "sha1": sha1,
+        "width": width,
+        "height": height,
+        "variants": variants,
+        "bytes": total,
+    }
+
+
+def fetch_movie_images(movie) -> list[dict]:
+    """
+    영화의 poster_path/backdrop_path 미러 (IMAGES 작업의 워커 스레드 단계)
+    """
+    return [fetch_image(p) for p in (movie.poster_path, movie.backdrop_path) if p]
+
+
+def save_image_assets(movie, assets: list[dict]):
+    """
+    fetch_movie_images 결과를 ImageAsset에 반영 (source_path 기준 upsert)
+    """
+    if not assets:
+        return
+    now = timezone.now()
+    ImageAsset.objects.bulk_create(
+        [ImageAsset(accessed_at=now, **fields) for fields in assets],
+        update_conflicts=True,
+        unique_fields=["source_path"],
+        update_fields=["sha1", "width", "height", "variants", "bytes", "accessed_at"],
+    )
+
+
+def assets_for_paths(paths) -> dict:
+    """
+    source_path → ImageAsset (응답 1번에 쿼리 1번)
+    - 오래 안 쓴 것만 accessed_at 갱신(LRU 기준), 갱신도 UPDATE 1번
+    """
+    paths = {p for p in paths if p}
+    if not paths:
+        return {}
+    assets = {a.source_path: a for a in ImageAsset.objects.filter(source_path__in=paths)}
+
+    now = timezone.now()
+    stale = [a.pk for a in assets.values() if a.accessed_at < now - timedelta(seconds=TOUCH_INTERVAL)]
+    if stale:
+        ImageAsset.objects.filter(pk__in=stale).update(accessed_at=now)
+    return assets
+
+
+def variant_urls(asset, request=None) -> dict | None:
+    """
+    {"w185": url, ...} (미러에 없으면 None → 프론트는 TMDB CDN 사용)
+    """
+    if asset is None or not asset.variants:
+        return None
+    urls = {}
+    for variant, relpath in asset.variants.items():
+        url = f"{settings.MEDIA_URL}{relpath}"
+        urls[variant] = request.build_absolute_uri(url) if request is not None else url
+    return urls
+
+
+def mirror_usage() -> int:
+    """
+    미러 디스크 사용량 - 같은 해시를 쓰는 ImageAsset은 파일을 공유하므로 해시당 1번만 셈
+    """
+    return sum(ImageAsset.objects.values("sha1").annotate(size=Max("bytes")).values_list("size", flat=True))
+
+
+def enforce_image_budget(max_bytes=None, batch=200) -> tuple[int, int]:
+    """
+    미러 용량이 TMDB_IMAGE_MIRROR_MAX_BYTES를 넘으면 accessed_at이 오래된 것부터 삭제 (LRU)
+    - 같은 해시를 쓰는 다른 ImageAsset이 남아 있으면 파일은 지우지 않음 (그만큼 줄지 않으므로 사용량은 배치마다 다시 계산)
+    - 삭제했으면 홈 캐시 무효화 (캐시된 응답이 지운 파일 URL을 가리키지 않도록)
+    - 반환: (삭제한 ImageAsset 수, 삭제 후 사용량)
+    """
+    max_bytes = settings.TMDB_IMAGE_MIRROR_MAX_BYTES if max_bytes is None else max_bytes
+    used = mirror_usage()
+    media_root = Path(settings.MEDIA_ROOT)
+    evicted = 0
+
+    while used > max_bytes:
+        victims, seen, expected = [], set(), used
+        for asset in ImageAsset.objects.order_by("accessed_at", "pk")[:batch]:
+            victims.append(asset)
+            if asset.sha1 not in seen:
+                seen.add(asset.sha1)
+                expected -= asset.bytes
+            if expected <= max_bytes:
+                break
+        if not victims:
+            break
+
+        ImageAsset.objects.filter(pk__in=[a.pk for a in victims]).delete()
+        evicted += len(victims)
+
+        shas = {a.sha1 for a in victims}
+        shared = set(ImageAsset.objects.filter(sha1__in=shas).values_list("sha1", flat=True))
+        for asset in victims:
+            if asset.sha1 in shared:
+                continue
+            for relpath in asset.variants.values():
+                (media_root / relpath).unlink(missing_ok=True)
+        used = mirror_usage()
+
+    if evicted:
+        bump_version(HOME_VERSION_KEY)
+    return evicted, max(used, 0)
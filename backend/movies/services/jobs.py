@@ -0,0 +1,122 @@
+# backend/movies/services/jobs.py
+import os
+import random
+import socket
+import uuid
+from datetime import timedelta
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from movies.models import EnrichmentJob, describe_error
+
+# 워커가 작업을 점유하는 시간(초) - 이 안에 끝내지 못하면 다른 워커가 다시 가져감
+JOB_LEASE_SECONDS = 300
+# 실패 시 재시도 대기: 30초, 60초, 120초 ... 최대 1시간 (+ 지터)
+JOB_BACKOFF_BASE = 30
+JOB_BACKOFF_MAX = 60 * 60
+
+
+def worker_id() -> str:
+    """
+    이 프로세스의 워커 이름 (lease 점유자 표시용, 작업 큐/분할 실행 공용)
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_jobs(kind: str, tmdb_ids, delay=0) -> None:
+    """
+    (kind, tmdb_id) 작업 등록
+    - 대기/실행 중인 작업이 이미 있으면 그대로 둠(중복 X)
+    - 끝났거나(DONE) 포기한(FAILED) 작업은 다시 대기 상태로 되돌림
+    """
+    tmdb_ids = list(dict.fromkeys(tmdb_ids))
+    if not tmdb_ids:
+        return
+    run_after = timezone.now() + timedelta(seconds=delay)
+
+    EnrichmentJob.objects.bulk_create(
+        [EnrichmentJob(kind=kind, tmdb_id=tmdb_id, run_after=run_after) for tmdb_id in tmdb_ids],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+    EnrichmentJob.objects.filter(
+        kind=kind, tmdb_id__in=tmdb_ids, status__in=["DONE", "FAILED"]
+    ).update(status="PENDING", attempts=0, run_after=run_after, last_error="", updated_at=timezone.now())
+
+
+def enqueue_job(kind: str, tmdb_id: int, delay=0) -> None:
+    """
+    작업 1개 등록 - 대기/실행 중인 작업이 이미 있으면 조회 1번으로 끝
+    (상세 페이지처럼 요청마다 불리는 경로에서 매번 쓰기 락을 잡지 않게)
+    """
+    if EnrichmentJob.objects.filter(kind=kind, tmdb_id=tmdb_id, status__in=["PENDING", "RUNNING"]).exists():
+        return
+    enqueue_jobs(kind, [tmdb_id], delay=delay)
+
+
+def claimable(now, pending=None) -> Q:
+    """
+    lease로 점유하는 행(EnrichmentJob, SyncShard) 중 지금 가져갈 수 있는 것
+    - 대기 중(pending, 기본 status=PENDING) + lease가 끝난(워커가 죽은) 실행 중, 재시도 횟수가 남은 것만
+    """
+    if pending is None:
+        pending = Q(status="PENDING")
+    return (pending | Q(status="RUNNING", locked_until__lt=now)) & Q(attempts__lt=F("max_attempts"))
+
+
+def _claimable(now):
+    # 실행 시각이 된 대기 작업만
+    return claimable(now, pending=Q(status="PENDING", run_after__lte=now))
+
+
+def claim_jobs(worker_id: str, limit=20, lease=JOB_LEASE_SECONDS) -> list[EnrichmentJob]:
+    """
+    실행할 작업을 최대 limit개 점유
+    - 후보를 고른 뒤 같은 조건을 건 UPDATE로 점유(compare-and-swap) → 여러 워커/프로세스가 동시에 돌아도
+      한 작업은 한 워커만 가져감 (SQLite는 SELECT ... FOR UPDATE SKIP LOCKED가 없음)
+    - 재시도를 다 쓴 채 lease가 끝난 작업은 FAILED로 정리
+    """
+    now = timezone.now()
+    EnrichmentJob.objects.filter(
+        status="RUNNING", locked_until__lt=now, attempts__gte=F("max_attempts")
+    ).update(status="FAILED", last_error="lease expired", updated_at=now)
+
+    ids = list(
+        EnrichmentJob.objects.filter(_claimable(now))
+        .order_by("run_after")
+        .values_list("pk", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+
+    token = f"{worker_id}:{uuid.uuid4().hex[:12]}"
+    EnrichmentJob.objects.filter(_claimable(now), pk__in=ids).update(
+        status="RUNNING",
+        locked_by=token,
+        locked_until=now + timedelta(seconds=lease),
+        attempts=F("attempts") + 1,
+        updated_at=now,
+    )
+    return list(EnrichmentJob.objects.filter(locked_by=token, status="RUNNING").order_by("run_after"))
+
+
+def complete_job(job: EnrichmentJob) -> None:
+    # lease를 잃은 뒤(다른 워커가 가져간 뒤)에는 상태를 덮어쓰지 않음
+    EnrichmentJob.objects.filter(pk=job.pk, locked_by=job.locked_by, status="RUNNING").update(
+        status="DONE", locked_until=None, last_error="", updated_at=timezone.now()
+    )
+
+
+def fail_job(job: EnrichmentJob, error, retry=True) -> None:
+    """
+    재시도 횟수가 남아 있으면 지수 백오프 후 다시 대기, 아니면 FAILED
+    """
+    now = timezone.now()
+    fields = {"locked_until": None, "last_error": describe_error(error), "updated_at": now}
+    if retry and job.attempts < job.max_attempts:
+        delay = min(JOB_BACKOFF_MAX, JOB_BACKOFF_BASE * (2 ** (job.attempts - 1)))
+        fields.update(status="PENDING", run_after=now + timedelta(seconds=delay + random.uniform(0, delay / 2)))
+    else:
+        fields.update(status="FAILED")
+    EnrichmentJob.objects.filter(pk=job.pk, locked_by=job.locked_by, status="RUNNING").update(**fields)
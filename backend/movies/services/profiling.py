@@ -0,0 +1,176 @@
+# backend/movies/services/profiling.py
+import functools
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+
+from django.db import connection
+
+from movies.services.tmdb_client import get_client
+
+# 보고서에 표시할 단계 순서 (그 외 단계는 뒤에 이름순)
+STAGE_ORDER = ["http", "cache", "rate_limit", "sleep", "upsert", "genres", "detail", "credits", "swap"]
+
+# 현재 켜져 있는 profiler (관리 명령의 --profile 동안만)
+_profiler = None
+
+
+class IngestProfiler:
+    """
+    TMDB 적재 프로파일러 (sync_tmdb_bulk/sync_tmdb_home --profile)
+    - 단계별 시간: 중첩되면 안쪽 단계 시간은 바깥 단계에서 빼서 기록(self time)
+      → 요청 단계(http/rate_limit)는 워커 스레드 시간을 합친 값이라 경과 시간보다 클 수 있음
+    - 단계별 쿼리 수: 메인 스레드 DB 연결(execute_wrapper) 기준, 실행 중인 가장 안쪽 단계에 집계
+    - HTTP: 상태 코드 분포/재시도/JSON 파싱 시간 (TMDBClient.stats)
+    - 행: 모델별 inserted/updated/unchanged/deleted
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.seconds = defaultdict(float)
+        self.calls = Counter()
+        self.queries = Counter()
+        self.rows = defaultdict(Counter)
+        self.started = None
+        self.elapsed = 0.0
+        self.http = {}
+
+    # ----------------------------
+    # 수집
+    # ----------------------------
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name: str):
+        stack = self._stack()
+        stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            with self._lock:
+                self.seconds[name] += elapsed
+                self.calls[name] += 1
+                if stack:
+                    self.seconds[stack[-1]] -= elapsed
+
+    def count_rows(self, model: str, **counts):
+        with self._lock:
+            for key, n in counts.items():
+                self.rows[model][key] += n
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper: 실행 중인 단계에 쿼리 수 집계
+        stack = self._stack()
+        with self._lock:
+            self.queries[stack[-1] if stack else "other"] += 1
+        return execute(sql, params, many, context)
+
+    # ----------------------------
+    # 결과
+    # ----------------------------
+    def as_dict(self) -> dict:
+        names = [n for n in STAGE_ORDER if n in self.calls or n in self.queries]
+        names += sorted(n for n in set(self.calls) | set(self.queries) if n not in names)
+        return {
+            "elapsed": round(self.elapsed, 3),
+            "stages": {
+                name: {
+                    "calls": self.calls[name],
+                    "seconds": round(self.seconds[name], 3),
+                    "queries": self.queries[name],
+                }
+                for name in names
+            },
+            "queries": sum(self.queries.values()),
+            "http": self.http,
+            "rows": {model: dict(counts) for model, counts in self.rows.items()},
+            "movies_per_sec": round(sum(self.rows["movie"].values()) / self.elapsed, 2) if self.elapsed else 0.0,
+        }
+
+    def summary_lines(self) -> list[str]:
+        report = self.as_dict()
+        elapsed = report["elapsed"] or 1e-9
+        lines = [f"{'stage':<12} {'calls':>7} {'sec':>9} {'%':>6} {'queries':>8}"]
+        for name, s in report["stages"].items():
+            lines.append(
+                f"{name:<12} {s['calls']:>7} {s['seconds']:>9.3f} {s['seconds'] / elapsed * 100:>5.1f}% {s['queries']:>8}"
+            )
+        lines.append(f"{'total':<12} {'':>7} {report['elapsed']:>9.3f} {'':>6} {report['queries']:>8}")
+
+        http = report["http"]
+        statuses = " ".join(f"{code}:{n}" for code, n in sorted(http.get("status", {}).items())) or "-"
+        lines.append(
+            f"HTTP: 요청 {http.get('requests', 0)}건 / 재시도 {http.get('retries', 0)}건 / 상태 {statuses} / "
+            f"JSON 파싱 {http.get('parse_total', 0):.3f}s"
+        )
+        for model, counts in report["rows"].items():
+            lines.append(
+                f"{model}: inserted {counts.get('inserted', 0)} / updated {counts.get('updated', 0)} / "
+                f"unchanged {counts.get('unchanged', 0)} / deleted {counts.get('deleted', 0)}"
+            )
+        lines.append(f"처리량: {report['movies_per_sec']:.1f} movies/sec")
+        return lines
+
+    def write_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False, indent=2)
+
+
+@contextmanager
+def profiling(profiler: IngestProfiler | None):
+    """
+    with profiling(IngestProfiler()): ... 블록 안의 적재 단계를 profiler에 기록 (None이면 아무것도 안 함)
+    """
+    global _profiler
+    if profiler is None:
+        yield None
+        return
+
+    client = get_client()
+    client.reset_stats()
+    prev, _profiler = _profiler, profiler
+    profiler.started = time.perf_counter()
+    try:
+        with connection.execute_wrapper(profiler):
+            yield profiler
+    finally:
+        _profiler = prev
+        profiler.elapsed = time.perf_counter() - profiler.started
+        profiler.http = client.stats()
+
+
+def stage(name: str):
+    """
+    적재 코드에서 사용: with stage("upsert"): ... (profiler가 꺼져 있으면 아무것도 안 함)
+    """
+    profiler = _profiler
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def count_rows(model: str, **counts):
+    profiler = _profiler
+    if profiler is not None:
+        profiler.count_rows(model, **counts)
+
+
+def profiled(name: str):
+    """
+    함수 전체를 한 단계로 기록하는 데코레이터 (@transaction.atomic보다 바깥에 두면 커밋 시간까지 포함)
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
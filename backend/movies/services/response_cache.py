@@ -0,0 +1,76 @@
+# backend/movies/services/response_cache.py
+import threading
+import time
+
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from movies.models import ContentVersion
+from movies.services.singleflight import SingleFlightTimeout, single_flight
+
+# 홈 응답(movies.views.home) version - 홈 섹션 교체, 홈 영화의 리뷰 통계/미러 이미지 변경 시 +1
+HOME_VERSION_KEY = "home"
+# 영화/인물 이름 목록 version - 검색 색인(services/search.py) 갱신 시 +1, 자동완성 색인(services/suggest.py)이 보고 다시 만듦
+CATALOG_VERSION_KEY = "catalog"
+# 프로세스 안에서 version을 다시 읽지 않고 쓰는 시간(초) - 다른 프로세스의 bump는 최대 이만큼 늦게 반영
+VERSION_MEMO_SECONDS = 2.0
+# version이 안 바뀌어도 이 시간이 지나면 다시 만듦 (안전장치)
+RESPONSE_CACHE_TIMEOUT = 10 * 60
+# 캐시가 비었을 때 다른 요청이 다시 만드는 동안 기다리는 최대 시간(초)
+REBUILD_WAIT = 5.0
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+def get_version(key: str) -> int:
+    now = time.monotonic()
+    with _memo_lock:
+        hit = _memo.get(key)
+    if hit is not None and now - hit[1] < VERSION_MEMO_SECONDS:
+        return hit[0]
+
+    version = ContentVersion.objects.filter(key=key).values_list("version", flat=True).first() or 0
+    with _memo_lock:
+        _memo[key] = (version, now)
+    return version
+
+
+def bump_version(key: str) -> None:
+    """
+    key의 version +1 (트랜잭션 안에서 호출하면 커밋과 동시에 반영)
+    """
+    ContentVersion.objects.get_or_create(key=key)
+    ContentVersion.objects.filter(key=key).update(version=F("version") + 1, updated_at=timezone.now())
+    with _memo_lock:
+        _memo.pop(key, None)
+
+
+def versioned_response(name: str, version_key: str, build, vary="", timeout=RESPONSE_CACHE_TIMEOUT):
+    """
+    build()로 만든 응답 데이터를 version_key의 현재 version과 함께 캐시
+    - 캐시 hit: DB 접근 없음 (version도 VERSION_MEMO_SECONDS 동안 프로세스 메모리 값 사용)
+    - miss: single_flight로 한 요청만 build, 나머지는 그 결과를 받음 (stampede 방지)
+    - vary: 응답이 달라지는 요청 정보 (예: 절대 URL을 만드는 host)
+    """
+    version = get_version(version_key)
+    cache_key = f"resp:{name}:v{version}:{vary}"
+    data = cache.get(cache_key)
+    if data is not None:
+        return data
+
+    def rebuild():
+        # 기다리는 동안 다른 요청이 이미 채웠을 수 있음
+        data = cache.get(cache_key)
+        if data is None:
+            data = build()
+            cache.set(cache_key, data, timeout)
+        return data
+
+    try:
+        data = single_flight(cache_key, rebuild, wait=REBUILD_WAIT)
+    except SingleFlightTimeout:
+        data = None
+    # 다른 프로세스가 만든 경우(None) 캐시가 프로세스별이면 여기서 다시 만듦
+    return data if data is not None else rebuild()
@@ -0,0 +1,114 @@
+# backend/movies/services/reviews.py
+from django.db.models import Count, Exists, F, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+from movies.models import HomeSection, HomeSectionEntry, Movie
+from movies.services.response_cache import HOME_VERSION_KEY, bump_version
+from reviews.models import Review
+
+# 별점 범위 (rating_hist 길이)
+RATING_SCALE = 5
+
+
+def _top_review_payload(r: dict) -> dict:
+    return {
+        "id": r["id"],
+        "content": r["content"],
+        "rating": r["rating"],
+        "like_count": r["likes_count"],  # 프론트 호환
+        "username": r["user__username"],
+        "created_at": r["created_at"],
+    }
+
+
+def annotate_review_list(qs, user=None):
+    """
+    리뷰 목록/단건 응답(ReviewSerializer)에 필요한 값을 같은 쿼리에서 계산
+    - likes_count, comments_count, is_liked (user가 좋아요 눌렀는지, 리뷰마다 조회하지 않도록)
+    """
+    qs = qs.select_related("user", "movie").annotate(
+        likes_count=Count("likes", distinct=True),
+        comments_count=Count("comments", distinct=True),
+    )
+    if user is not None and user.is_authenticated:
+        liked = Review.likes.through.objects.filter(review_id=OuterRef("pk"), user_id=user.pk)
+        qs = qs.annotate(is_liked=Exists(liked))
+    return qs
+
+
+def load_top_reviews(movie_ids) -> dict:
+    """
+    영화별 대표 리뷰(watched 리뷰 중 좋아요 많은 순 → 최신순 1개)를 쿼리 1번으로 조회
+    - ROW_NUMBER() OVER (PARTITION BY movie ORDER BY 좋아요 수 DESC, created_at DESC) = 1 만 남김
+    - 반환: {movie_id: top_review dict | None} (리뷰 없는 영화도 None으로 포함)
+    """
+    movie_ids = list(dict.fromkeys(movie_ids))
+    if not movie_ids:
+        return {}
+
+    rows = (
+        Review.objects.filter(movie_id__in=movie_ids, watched=True)
+        .annotate(likes_count=Count("likes"))
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=F("movie_id"),
+                order_by=[F("likes_count").desc(), F("created_at").desc()],
+            )
+        )
+        .filter(rank=1)
+        .order_by()
+        .values("id", "movie_id", "content", "rating", "likes_count", "created_at", "user__username")
+    )
+    top = dict.fromkeys(movie_ids)
+    for r in rows:
+        top[r["movie_id"]] = _top_review_payload(r)
+    return top
+
+
+def refresh_review_stats(movie_ids) -> int:
+    """
+    영화별 리뷰 통계(review_count/rating_avg/rating_hist/top_review)를 다시 계산해서 Movie에 반영
+    - 리뷰 작성/수정/삭제, 좋아요, 보고싶어요 토글 직후 해당 영화만 호출
+    - 쿼리: 별점 분포 1번 + 대표 리뷰 1번 + bulk_update (+ 홈에 노출 중인 영화면 홈 캐시 무효화)
+    - 반환: 갱신한 영화 수
+    """
+    movie_ids = list(dict.fromkeys(movie_ids))
+    if not movie_ids:
+        return 0
+
+    hists = {movie_id: [0] * RATING_SCALE for movie_id in movie_ids}
+    rows = (
+        Review.objects.filter(movie_id__in=movie_ids, watched=True)
+        .values("movie_id", "rating")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    for r in rows:
+        if 1 <= r["rating"] <= RATING_SCALE:
+            hists[r["movie_id"]][r["rating"] - 1] += r["n"]
+
+    top = load_top_reviews(movie_ids)
+    movies = []
+    for movie_id, hist in hists.items():
+        count = sum(hist)
+        top_review = top.get(movie_id)
+        movies.append(
+            Movie(
+                pk=movie_id,
+                review_count=count,
+                rating_avg=round(sum((i + 1) * n for i, n in enumerate(hist)) / count, 2) if count else 0,
+                rating_hist=hist,
+                top_review_id=top_review["id"] if top_review else None,
+                top_review=top_review,
+            )
+        )
+    Movie.objects.bulk_update(
+        movies, ["review_count", "rating_avg", "rating_hist", "top_review_id", "top_review"], batch_size=500
+    )
+
+    # HomeSection 행이 없는 섹션은 홈 뷰처럼 version 0이 활성
+    active = HomeSection.objects.filter(code=OuterRef("section")).values("active_version")
+    if HomeSectionEntry.objects.filter(movie_id__in=movie_ids, version=Coalesce(Subquery(active), 0)).exists():
+        bump_version(HOME_VERSION_KEY)
+    return len(movies)
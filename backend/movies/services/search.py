@@ -0,0 +1,219 @@
+# backend/movies/services/search.py
+import math
+import re
+import unicodedata
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from movies.services.response_cache import CATALOG_VERSION_KEY, bump_version
+
+# FTS5 가상 테이블 (migrations/0017_search_index.py에서 생성, SQLite 전용)
+MOVIE_FTS = "movies_movie_fts"
+PERSON_FTS = "movies_person_fts"
+MOVIE_FTS_COLUMNS = ("title", "original_title", "overview")
+
+# bm25 컬럼 가중치 (title > original_title > overview)
+MOVIE_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+# 최종 점수 = 관련도(-bm25) + POPULARITY_WEIGHT * log(1 + popularity)
+POPULARITY_WEIGHT = 0.5
+# bm25 상위 몇 개를 가져와서 popularity까지 섞어 다시 정렬할지
+RERANK_POOL = 200
+
+# 한글/한자/가나는 띄어쓰기로 단어를 나눌 수 없어서 2글자씩(bigram), 나머지는 단어 단위
+_CJK = "\u1100-\u11FF\u3040-\u30FF\u3130-\u318F\u3400-\u4DBF\u4E00-\u9FFF\uAC00-\uD7A3"  # 한글 자모/가나/한글 호환 자모/한자/한글 음절
+_TOKEN_RE = re.compile(rf"([{_CJK}]+)|([^\W{_CJK}]+)")
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def _runs(text: str):
+    # (CJK 여부, 문자열) 순서대로
+    for m in _TOKEN_RE.finditer(_normalize(text)):
+        if m.group(1):
+            yield True, m.group(1)
+        else:
+            yield False, m.group(2)
+
+
+def _bigrams(run: str) -> list[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def search_tokens(text: str) -> str:
+    """
+    색인용 토큰 문자열 ("어벤져스 엔드게임" → "어벤 벤져 져스 엔드 드게 게임")
+    - FTS5 unicode61 토크나이저가 공백으로 나누므로 bigram을 공백으로 이어서 저장
+    - migrations/0017_search_index.py에 같은 규칙이 복사돼 있음 → 규칙을 바꾸면 rebuild_search_index로 재색인
+    """
+    tokens = []
+    for is_cjk, run in _runs(text):
+        tokens.extend(_bigrams(run) if is_cjk else [run])
+    return " ".join(tokens)
+
+
+def match_expression(query: str, columns=None) -> str | None:
+    """
+    검색어 → FTS5 MATCH 식 (모든 단어 AND)
+    - 한글 2글자 이상: bigram 구(phrase) → 붙어 있는 순서 그대로 일치 ("어벤져" → "어벤 벤져")
+    - 한글 1글자/영문 단어: 접두어 일치 ("봄"*, "aveng"*)
+    - columns: 특정 컬럼만 검색 (예: ("title", "original_title"))
+    """
+    terms = []
+    for is_cjk, run in _runs(query):
+        if is_cjk and len(run) > 1:
+            terms.append('"' + " ".join(_bigrams(run)) + '"')
+        else:
+            terms.append(f'"{run}"*')
+    if not terms:
+        return None
+    expr = " AND ".join(terms)
+    if columns:
+        expr = "{" + " ".join(columns) + "} : (" + expr + ")"
+    return expr
+
+
+def fts_enabled() -> bool:
+    return connection.vendor == "sqlite"
+
+
+# ----------------------------
+# 색인 갱신 (영화/인물 upsert 직후 호출, catalog version +1 → 자동완성 색인도 다시 만듦)
+# - 개별 save()/delete() (admin, loaddata, 직접 ORM)는 movies/signals.py가 호출
+# - bulk_create/bulk_update/update()는 시그널이 없으므로 쓰는 쪽에서 직접 호출
+# ----------------------------
+def index_movies(movies) -> None:
+    """
+    영화 색인 갱신 (rowid = Movie.pk) - 바뀐 영화만 넘기면 됨
+    """
+    movies = [m for m in movies if m.pk is not None]
+    if not movies:
+        return
+    bump_version(CATALOG_VERSION_KEY)
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {MOVIE_FTS} WHERE rowid IN ({','.join('%s' for _ in movies)})", [m.pk for m in movies]
+        )
+        cursor.executemany(
+            f"INSERT INTO {MOVIE_FTS} (rowid, title, original_title, overview) VALUES (%s, %s, %s, %s)",
+            [(m.pk, search_tokens(m.title), search_tokens(m.original_title), search_tokens(m.overview)) for m in movies],
+        )
+
+
+def index_people(people) -> None:
+    """
+    인물 색인 갱신 (rowid = Person.pk), people: [(pk, name), ...]
+    """
+    people = [(pk, name) for pk, name in people if pk is not None]
+    if not people:
+        return
+    bump_version(CATALOG_VERSION_KEY)
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {PERSON_FTS} WHERE rowid IN ({','.join('%s' for _ in people)})", [pk for pk, _ in people]
+        )
+        cursor.executemany(
+            f"INSERT INTO {PERSON_FTS} (rowid, name) VALUES (%s, %s)",
+            [(pk, search_tokens(name)) for pk, name in people],
+        )
+
+
+def unindex_movies(pks) -> None:
+    """
+    삭제된 영화를 색인에서 제거
+    """
+    _unindex(MOVIE_FTS, pks)
+
+
+def unindex_people(pks) -> None:
+    _unindex(PERSON_FTS, pks)
+
+
+def _unindex(table: str, pks) -> None:
+    pks = [pk for pk in pks if pk is not None]
+    if not pks:
+        return
+    bump_version(CATALOG_VERSION_KEY)
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE rowid IN ({','.join('%s' for _ in pks)})", pks)
+
+
+def clear_search_index() -> None:
+    bump_version(CATALOG_VERSION_KEY)
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {MOVIE_FTS}")
+        cursor.execute(f"DELETE FROM {PERSON_FTS}")
+
+
+# ----------------------------
+# 검색
+# ----------------------------
+def movie_search_q(query: str, columns=("title", "original_title")) -> Q:
+    """
+    검색어와 일치하는 영화 조건 (다른 필터/정렬/페이지네이션과 같이 쓰는 용도)
+    - FTS: pk IN (SELECT rowid FROM movies_movie_fts WHERE ... MATCH ...)
+    - FTS를 쓸 수 없으면 컬럼별 icontains
+    """
+    expr = match_expression(query, columns)
+    if expr is None or not fts_enabled():
+        q = Q()
+        for column in columns:
+            q |= Q(**{f"{column}__icontains": query})
+        return q
+    return Q(pk__in=RawSQL(f"SELECT rowid FROM {MOVIE_FTS} WHERE {MOVIE_FTS} MATCH %s", [expr]))
+
+
+def person_search_q(query: str) -> Q:
+    expr = match_expression(query)
+    if expr is None or not fts_enabled():
+        return Q(name__icontains=query)
+    return Q(pk__in=RawSQL(f"SELECT rowid FROM {PERSON_FTS} WHERE {PERSON_FTS} MATCH %s", [expr]))
+
+
+def search_movie_ids(query: str, limit=30, columns=None) -> list[int]:
+    """
+    BM25 + popularity 순으로 Movie.pk 목록
+    - FTS에서 bm25 상위 RERANK_POOL개 → popularity를 섞어서 다시 정렬 (log라 인기작이 관련도를 뒤집지는 못함)
+    """
+    expr = match_expression(query, columns)
+    if expr is None or not fts_enabled():
+        return []
+    weights = ", ".join(str(w) for w in MOVIE_BM25_WEIGHTS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT f.rowid, bm25({MOVIE_FTS}, {weights}) AS rank, m.popularity
+            FROM {MOVIE_FTS} f JOIN movies_movie m ON m.id = f.rowid
+            WHERE {MOVIE_FTS} MATCH %s
+            ORDER BY rank LIMIT %s
+            """,
+            [expr, max(limit, RERANK_POOL)],
+        )
+        rows = cursor.fetchall()
+    rows.sort(key=lambda r: -r[1] + POPULARITY_WEIGHT * math.log1p(max(r[2] or 0, 0)), reverse=True)
+    return [r[0] for r in rows[:limit]]
+
+
+def search_person_ids(query: str, limit=30) -> list[int]:
+    expr = match_expression(query)
+    if expr is None or not fts_enabled():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid FROM {PERSON_FTS} WHERE {PERSON_FTS} MATCH %s ORDER BY bm25({PERSON_FTS}) LIMIT %s",
+            [expr, limit],
+        )
+        return [r[0] for r in cursor.fetchall()]
@@ -0,0 +1,107 @@
+# backend/movies/services/shards.py
+import uuid
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from movies.models import SyncRun, SyncShard
+from movies.services.jobs import claimable, worker_id
+from movies.services.tmdb import sync_bulk_movies
+
+# 워커가 구간을 점유하는 시간(초) - 페이지를 끝낼 때마다 연장
+SHARD_LEASE_SECONDS = 120
+
+
+@transaction.atomic
+def create_sharded_run(pages: int, shard_pages: int, sort_by="popularity.desc", with_detail=False, with_credits=False):
+    """
+    1~pages를 shard_pages씩 나눈 SyncShard들과 함께 SyncRun 생성 (코디네이터)
+    """
+    shard_pages = max(1, int(shard_pages))
+    run = SyncRun.objects.create(
+        sort_by=sort_by,
+        pages=pages,
+        with_detail=with_detail,
+        with_credits=with_credits,
+        shard_pages=shard_pages,
+    )
+    SyncShard.objects.bulk_create(
+        [
+            SyncShard(run=run, start_page=start, end_page=min(pages, start + shard_pages - 1))
+            for start in range(1, pages + 1, shard_pages)
+        ]
+    )
+    return run
+
+
+def latest_sharded_run():
+    return SyncRun.objects.filter(shard_pages__gt=0).exclude(status="DONE").first()
+
+
+def claim_shard(run: SyncRun, worker: str, lease=SHARD_LEASE_SECONDS):
+    """
+    run의 구간 하나를 점유 (jobs.claim_jobs와 같은 조건부 UPDATE 방식)
+    - 다른 워커와 같은 구간을 골랐다면 UPDATE가 0건 → 다음 후보로
+    """
+    now = timezone.now()
+    candidates = SyncShard.objects.filter(claimable(now), run=run).values_list("pk", flat=True)
+    for pk in candidates[:10]:
+        token = f"{worker}:{uuid.uuid4().hex[:8]}"
+        claimed = SyncShard.objects.filter(claimable(now), pk=pk).update(
+            status="RUNNING",
+            locked_by=token,
+            locked_until=now + timedelta(seconds=lease),
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if claimed:
+            shard = SyncShard.objects.select_related("run").get(pk=pk)
+            shard.lease_seconds = lease
+            return shard
+    return None
+
+
+def run_shard_worker(
+    run: SyncRun,
+    worker=None,
+    concurrency=1,
+    rps=None,
+    sleep_sec=0.15,
+    lease=SHARD_LEASE_SECONDS,
+    on_shard=None,
+):
+    """
+    run의 남은 구간을 하나씩 점유해서 sync_bulk_movies로 처리 (구간이 없으면 종료)
+    - 실패한 구간은 max_attempts까지 다른 워커(또는 자신)가 다시 가져감
+    - on_shard(shard, total, error): 구간 하나가 끝날 때마다 호출 (진행 상황 출력용)
+    - 반환: 처리한 구간 수
+    """
+    worker = worker or worker_id()
+    done = 0
+    while True:
+        shard = claim_shard(run, worker, lease=lease)
+        if shard is None:
+            return done
+
+        total, error = 0, None
+        try:
+            total = sync_bulk_movies(
+                pages=shard.end_page,
+                start_page=shard.next_page,
+                sort_by=run.sort_by,
+                with_credits=run.with_credits,
+                with_detail=run.with_detail,
+                sleep_sec=sleep_sec,
+                concurrency=concurrency,
+                rps=rps,
+                run=shard,
+            )
+            done += 1
+        except Exception as e:
+            # 구간 상태는 sync_bulk_movies → shard.mark_failed가 기록(lease를 잃었으면 그대로 둠),
+            # 워커는 다음 구간으로
+            error = e
+        if on_shard is not None:
+            on_shard(shard, total, error)
@@ -0,0 +1,107 @@
+# backend/movies/services/singleflight.py
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from movies.models import FetchLease
+
+# lease 기본 유지 시간(초) - 요청이 이보다 오래 걸리면 다른 프로세스가 다시 잡을 수 있음
+LEASE_SECONDS = 30
+# 다른 프로세스가 lease를 가지고 있을 때 해제됐는지 다시 확인하는 간격(초)
+LEASE_POLL_INTERVAL = 0.1
+
+
+class SingleFlightTimeout(TimeoutError):
+    """같은 key의 요청을 기다리다 wait 시간을 넘김"""
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _holder() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def acquire_lease(key: str, holder: str, seconds=LEASE_SECONDS) -> bool:
+    """
+    key lease 획득 시도 (없으면 INSERT, 만료된 lease면 조건부 UPDATE로 가져옴)
+    """
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=seconds)
+    try:
+        with transaction.atomic():
+            FetchLease.objects.create(key=key, holder=holder, expires_at=expires_at)
+        return True
+    except IntegrityError:
+        return bool(
+            FetchLease.objects.filter(key=key, expires_at__lt=now).update(holder=holder, expires_at=expires_at)
+        )
+
+
+def release_lease(key: str, holder: str) -> None:
+    FetchLease.objects.filter(key=key, holder=holder).delete()
+
+
+def _wait_for_lease(key: str, deadline: float) -> None:
+    # 다른 프로세스의 요청이 끝나(lease 삭제/만료)기를 기다림
+    while time.monotonic() < deadline:
+        if not FetchLease.objects.filter(key=key, expires_at__gte=timezone.now()).exists():
+            return
+        time.sleep(LEASE_POLL_INTERVAL)
+    raise SingleFlightTimeout(key)
+
+
+def single_flight(key: str, fn, wait=5.0, lease_seconds=LEASE_SECONDS):
+    """
+    같은 key(예: "credits:550")의 fn은 한 번에 하나만 실행
+    - 같은 프로세스: 먼저 들어온 스레드만 실행하고 나머지는 그 결과(예외 포함)를 그대로 받음
+    - 다른 프로세스: FetchLease로 한 곳만 실행, 나머지는 lease가 풀릴 때까지 기다렸다가 None 반환
+      (호출한 쪽은 DB를 다시 읽으면 됨)
+    - wait 초 안에 끝나지 않으면 SingleFlightTimeout
+    """
+    deadline = time.monotonic() + wait
+
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        if not flight.event.wait(max(0.0, deadline - time.monotonic())):
+            raise SingleFlightTimeout(key)
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    holder = _holder()
+    try:
+        if acquire_lease(key, holder, lease_seconds):
+            try:
+                flight.result = fn()
+            finally:
+                release_lease(key, holder)
+        else:
+            _wait_for_lease(key, deadline)
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.event.set()
@@ -0,0 +1,232 @@
+# backend/movies/services/suggest.py
+import heapq
+import logging
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+
+from django.db import connection
+from django.db.models import Max
+
+from movies.models import Movie, Person
+from movies.services.response_cache import CATALOG_VERSION_KEY, get_version
+
+logger = logging.getLogger(__name__)
+
+# 색인에 넣을 최대 개수 (popularity 높은 순) - 프로세스 메모리에 올라가므로 상한을 둠
+SUGGEST_MAX_MOVIES = 200_000
+SUGGEST_MAX_PEOPLE = 100_000
+# 제목의 몇 번째 단어까지 시작 위치로 쓸지 ("어벤져스: 엔드게임" → "엔드게임"으로도 찾기)
+MAX_WORD_KEYS = 4
+# 접두어 범위의 상위 결과를 빨리 고르기 위한 블록 크기 (블록마다 상위 SUGGEST_MAX_LIMIT개를 미리 계산)
+BLOCK_SIZES = (64, 4096, 262144)
+SUGGEST_MAX_LIMIT = 20
+# catalog version이 바뀌어도 이 간격(초) 안에는 다시 만들지 않음 (대량 동기화 중 재빌드 반복 방지)
+REBUILD_MIN_INTERVAL = 60
+
+_WORD_RE = re.compile(r"\w+")
+# 한글 음절 → 초성 (U+1100 조합형 초성; 입력한 호환 자모 "ㅇ"도 NFKC 정규화하면 조합형 초성이 됨)
+_HANGUL_BASE, _HANGUL_LAST, _JAMO_PER_CHOSUNG = 0xAC00, 0xD7A3, 21 * 28
+_CHOSUNG_BASE = 0x1100
+_KEY_END = "\U0010ffff"
+
+
+def suggest_key(text: str) -> str:
+    """
+    비교용 키: NFKC + 소문자 + 공백/문장부호 제거 ("Avengers: Endgame" → "avengersendgame")
+    """
+    return "".join(_WORD_RE.findall(unicodedata.normalize("NFKC", text or "").lower()))
+
+
+def chosung(key: str) -> str:
+    """
+    한글 음절만 초성으로 ("어벤져스" → "ᄋᄇᄌᄉ"), 나머지 글자는 그대로
+    """
+    out = []
+    for ch in key:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            ch = chr(_CHOSUNG_BASE + (code - _HANGUL_BASE) // _JAMO_PER_CHOSUNG)
+        out.append(ch)
+    return "".join(out)
+
+
+def entry_keys(text: str) -> set[str]:
+    """
+    항목 하나의 키들: 전체/단어 시작 위치부터의 키 + 각각의 초성 키
+    """
+    words = _WORD_RE.findall(unicodedata.normalize("NFKC", text or "").lower())
+    keys = set()
+    for i in range(min(len(words), MAX_WORD_KEYS)):
+        key = "".join(words[i:])
+        keys.add(key)
+        keys.add(chosung(key))
+    return keys
+
+
+class SuggestIndex:
+    """
+    접두어 검색용 정렬 배열
+    - 항목은 weight(popularity) 높은 순으로 번호(ref)를 붙임 → ref가 작을수록 상위
+    - keys[i]로 시작하는 항목 = items[refs[i]] (keys는 정렬, bisect로 접두어 범위 탐색)
+    - tops[level][b]: BLOCK_SIZES[level] 단위 블록 b의 가장 작은 ref 목록
+      → 범위가 커도 (블록 상위 목록 + 양 끝 일부)만 보고 상위 결과를 고름
+    """
+
+    def __init__(self, version: int, entries):
+        # entries: [(payload, weight, [text, ...]), ...]
+        self.version = version
+        self.built_at = time.monotonic()
+        entries = sorted(entries, key=lambda e: e[1] or 0, reverse=True)
+        self.items = [payload for payload, _, _ in entries]
+
+        pairs = []
+        for ref, (_, _, texts) in enumerate(entries):
+            keys = set()
+            for text in texts:
+                keys |= entry_keys(text)
+            keys.discard("")
+            pairs.extend((key, ref) for key in keys)
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.refs = [ref for _, ref in pairs]
+
+        # 가장 작은 블록은 refs에서 바로, 큰 블록은 바로 아래 단계 블록들의 상위 목록을 합쳐서
+        size = BLOCK_SIZES[0]
+        level = [
+            heapq.nsmallest(SUGGEST_MAX_LIMIT, set(self.refs[start : start + size]))
+            for start in range(0, len(self.refs), size)
+        ]
+        self.tops = [level]
+        for prev_size, size in zip(BLOCK_SIZES, BLOCK_SIZES[1:]):
+            step = size // prev_size
+            level = [
+                heapq.nsmallest(SUGGEST_MAX_LIMIT, {ref for top in level[start : start + step] for ref in top})
+                for start in range(0, len(level), step)
+            ]
+            self.tops.append(level)
+
+    def __len__(self):
+        return len(self.items)
+
+    def _collect(self, lo: int, hi: int, level: int, out: set):
+        # refs[lo:hi]의 후보를 out에 모음 (큰 블록부터, 블록에 안 맞는 양 끝은 한 단계 작은 블록으로)
+        if lo >= hi:
+            return
+        if level < 0:
+            out.update(self.refs[lo:hi])
+            return
+        size = BLOCK_SIZES[level]
+        first, last = -(-lo // size), hi // size
+        if first >= last:
+            self._collect(lo, hi, level - 1, out)
+            return
+        self._collect(lo, first * size, level - 1, out)
+        for top in self.tops[level][first:last]:
+            out.update(top)
+        self._collect(last * size, hi, level - 1, out)
+
+    def lookup(self, query: str, limit=10) -> list[dict]:
+        prefix = suggest_key(query)
+        if not prefix:
+            return []
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + _KEY_END, lo)
+        candidates = set()
+        self._collect(lo, hi, len(BLOCK_SIZES) - 1, candidates)
+        return [self.items[ref] for ref in heapq.nsmallest(min(limit, SUGGEST_MAX_LIMIT), candidates)]
+
+
+def _movie_entries():
+    rows = (
+        Movie.objects.order_by("-popularity")
+        .values_list("tmdb_id", "title", "original_title", "release_date", "poster_path", "popularity")[
+            :SUGGEST_MAX_MOVIES
+        ]
+    )
+    for tmdb_id, title, original_title, release_date, poster_path, popularity in rows.iterator(chunk_size=5000):
+        payload = {
+            "type": "movie",
+            "tmdb_id": tmdb_id,
+            "title": title,
+            "original_title": original_title,
+            "year": release_date.year if release_date else None,
+            "poster_path": poster_path,
+        }
+        yield payload, popularity, [title, original_title]
+
+
+def _person_entries():
+    rows = (
+        Person.objects.annotate(weight=Max("movies__popularity"))
+        .order_by("-weight")
+        .values_list("tmdb_id", "name", "profile_path", "known_for_department", "weight")[:SUGGEST_MAX_PEOPLE]
+    )
+    for tmdb_id, name, profile_path, department, weight in rows.iterator(chunk_size=5000):
+        payload = {
+            "type": "person",
+            "tmdb_id": tmdb_id,
+            "name": name,
+            "profile_path": profile_path,
+            "known_for_department": department,
+        }
+        yield payload, weight, [name]
+
+
+def build_suggest_index(version=None) -> SuggestIndex:
+    if version is None:
+        version = get_version(CATALOG_VERSION_KEY)
+    started = time.monotonic()
+    entries = list(_movie_entries()) + list(_person_entries())
+    index = SuggestIndex(version, entries)
+    logger.info("suggest index v%s: %d entries, %d keys in %.2fs", version, len(index), len(index.keys), time.monotonic() - started)
+    return index
+
+
+_index = None
+_build_lock = threading.Lock()
+_rebuilding = threading.Event()
+
+
+def _rebuild_in_background(version: int):
+    global _index
+    try:
+        _index = build_suggest_index(version)
+    except Exception:
+        logger.exception("suggest index rebuild failed")
+    finally:
+        connection.close()  # 이 스레드의 DB 연결
+        _rebuilding.clear()
+
+
+def get_suggest_index() -> SuggestIndex:
+    """
+    현재 색인
+    - 처음 한 번은 요청 스레드에서 만듦 (동시에 온 요청은 lock에서 기다림)
+    - 그 뒤 catalog version이 바뀌면 백그라운드 스레드에서 다시 만들고, 그동안은 이전 색인으로 응답
+    """
+    global _index
+    index = _index
+    if index is None:
+        with _build_lock:
+            if _index is None:
+                _index = build_suggest_index()
+            return _index
+
+    version = get_version(CATALOG_VERSION_KEY)
+    if (
+        version != index.version
+        and time.monotonic() - index.built_at >= REBUILD_MIN_INTERVAL
+        and not _rebuilding.is_set()
+    ):
+        with _build_lock:
+            if not _rebuilding.is_set():
+                _rebuilding.set()
+                threading.Thread(target=_rebuild_in_background, args=(version,), daemon=True).start()
+    return index
+
+
+def suggest(query: str, limit=10) -> list[dict]:
+    return get_suggest_index().lookup(query, max(1, min(limit, SUGGEST_MAX_LIMIT)))
@@ -1,28 +1,95 @@
 # backend/movies/services/tmdb.py
-import requests
+import gzip
+import hashlib
+import json
+import logging
+import threading
 import time
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
-from movies.models import Movie, Genre, MovieGenre, Person, MovieCredit, HomeSectionEntry
+from movies.models import Movie, Genre, MovieGenre, Person, MovieCredit, HomeSection, HomeSectionEntry, describe_error
+from movies.services.images import enforce_image_budget, fetch_movie_images, save_image_assets
+from movies.services.jobs import complete_job, enqueue_job, enqueue_jobs, fail_job
+from movies.services.profiling import count_rows, profiled, stage
+from movies.services.response_cache import HOME_VERSION_KEY, bump_version
+from movies.services.search import index_movies, index_people
+from movies.services.singleflight import single_flight
+from movies.services.tmdb_client import get_client
+from movies.services.tmdb_cache import get_cache, get_mode, ttl_for
+from movies.services.utils import chunked
 
+logger = logging.getLogger(__name__)
 
-TMDB_BASE_URL = "https://api.themoviedb.org/3"
+# TMDB는 IP당 초당 약 50건까지 허용 → 여유를 두고 40rps를 기본값으로 사용
+TMDB_DEFAULT_RPS = 40
 
 
-def _tmdb_get(path: str, params=None):
+def _tmdb_get(path: str, params=None, timeout=None, max_retries=None, refresh=False):
+    # refresh=True: 캐시를 읽지 않고 새로 받아서 덮어씀 (보강처럼 "지금 값"이 필요한 요청)
     if params is None:
         params = {}
     params = {
-        "api_key": settings.TMDB_API_KEY,
         "language": "ko-KR",
         **params,
     }
-    url = f"{TMDB_BASE_URL}{path}"
-    r = requests.get(url, params=params, timeout=15)
-    r.raise_for_status()
-    return r.json()
+
+    # 디스크 응답 캐시 (movies/services/tmdb_cache.py) - 엔드포인트별 TTL
+    cache = get_cache()
+    mode = get_mode()
+    ttl = ttl_for(path)
+    use_cache = cache is not None and mode != "off" and ttl > 0
+    if use_cache and mode != "refresh" and not refresh:
+        with stage("cache"):
+            cached = cache.get(path, params)
+        if cached is not None:
+            return cached
+
+    # 커넥션 풀/재시도/집계는 공용 클라이언트가 담당 (movies/services/tmdb_client.py)
+    with stage("http"):
+        data = get_client().get(path, params=params, timeout=timeout, max_retries=max_retries)
+    if use_cache:
+        with stage("cache"):
+            cache.set(path, params, data, ttl)
+    return data
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰을 채우는 토큰 버킷 (스레드 안전)
+    - acquire(): 토큰이 생길 때까지 대기 후 1개 소비
+    - burst: 한 번에 몰아서 쓸 수 있는 최대 토큰 수(기본 = rate)
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _limited_get(limiter, path: str, params=None, refresh=False):
+    if limiter is not None:
+        with stage("rate_limit"):
+            limiter.acquire()
+    return _tmdb_get(path, params=params, refresh=refresh)
 
 
 def _parse_date(s):
@@ -34,126 +101,417 @@ def _parse_date(s):
         return None
 
 
-@transaction.atomic
-def upsert_movie_from_tmdb(movie_json: dict) -> Movie:
-    movie, _ = Movie.objects.update_or_create(
-        tmdb_id=movie_json["id"],
-        defaults={
-            "title": movie_json.get("title") or "",
-            "original_title": movie_json.get("original_title") or "",
-            "overview": movie_json.get("overview") or "",
-            "release_date": _parse_date(movie_json.get("release_date")),
-            "poster_path": movie_json.get("poster_path") or "",
-            "backdrop_path": movie_json.get("backdrop_path") or "",
-            "popularity": float(movie_json.get("popularity") or 0),
-            "vote_average": float(movie_json.get("vote_average") or 0),
-            "vote_count": int(movie_json.get("vote_count") or 0),
-        },
+# 목록 API(discover/popular 등)에서 채워지는 Movie 필드
+MOVIE_LIST_FIELDS = [
+    "title",
+    "original_title",
+    "overview",
+    "release_date",
+    "poster_path",
+    "backdrop_path",
+    "popularity",
+    "vote_average",
+    "vote_count",
+]
+
+
+def _movie_defaults(movie_json: dict) -> dict:
+    return {
+        "title": movie_json.get("title") or "",
+        "original_title": movie_json.get("original_title") or "",
+        "overview": movie_json.get("overview") or "",
+        "release_date": _parse_date(movie_json.get("release_date")),
+        "poster_path": movie_json.get("poster_path") or "",
+        "backdrop_path": movie_json.get("backdrop_path") or "",
+        "popularity": float(movie_json.get("popularity") or 0),
+        "vote_average": float(movie_json.get("vote_average") or 0),
+        "vote_count": int(movie_json.get("vote_count") or 0),
+    }
+
+
+def _movie_fingerprint(fields: dict, genre_ids) -> str:
+    """
+    TMDB 목록 필드 + 장르 id로 만든 내용 해시 (Movie.tmdb_fingerprint)
+    - 목록 응답(genre_ids)과 상세 응답(genres)에서 같은 값이 나오도록 정규화
+    - genre_ids는 실제로 연결하는 id만(_linked_genre_ids) → 그때 없던 장르가 나중에 생기면
+      같은 응답을 다시 받아도 "바뀜"으로 보고 장르를 연결함
+    """
+    raw = json.dumps(
+        [[fields.get(f) for f in MOVIE_LIST_FIELDS], sorted(set(genre_ids or []))],
+        default=str,
+        ensure_ascii=False,
     )
-    return movie
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
 
 
+def _linked_genre_ids(genre_ids) -> list[int]:
+    # Genre master에 있는(set_movies_genres가 실제로 연결하는) 장르 id만
+    return sorted(genre_registry.pk_map(set(genre_ids or [])))
+
+
+def upsert_movie_from_tmdb(movie_json: dict) -> Movie:
+    return upsert_movies_from_tmdb([movie_json])[0]
+
+
+def upsert_movies_from_tmdb(results: list) -> list[Movie]:
+    """
+    TMDB 결과 페이지 전체를 한 번에 upsert (+ 바뀐 영화 장르 연결)
+    - 반환: results 순서대로 Movie (같은 tmdb_id 중복은 첫 번째만)
+    """
+    return upsert_movie_page(results)[0]
+
+
+@profiled("upsert")
 @transaction.atomic
+def _upsert_movies(results: list):
+    """
+    페이지 upsert 본체 (페이지당 쿼리 수 고정)
+    - 기존 행 조회 1번 → tmdb_fingerprint가 같은 영화는 쓰지 않음(updated_at 유지)
+    - 새로 생겼거나 바뀐 영화만 INSERT ... ON CONFLICT(tmdb_id) DO UPDATE 1번 (+ 검색 색인 갱신)
+    - 반환: (movies, 새로 생겼거나 바뀐 tmdb_id 집합)
+    """
+    payloads = {}
+    for item in results:
+        if item.get("id") and item["id"] not in payloads:
+            fields = _movie_defaults(item)
+            payloads[item["id"]] = (fields, _movie_fingerprint(fields, _linked_genre_ids(item.get("genre_ids"))))
+    if not payloads:
+        return [], set()
+
+    by_tmdb_id = Movie.objects.in_bulk(list(payloads), field_name="tmdb_id")
+    counts = Counter()
+    changed = set()
+    for tmdb_id, (fields, fingerprint) in payloads.items():
+        movie = by_tmdb_id.get(tmdb_id)
+        if movie is not None and movie.tmdb_fingerprint == fingerprint:
+            counts["unchanged"] += 1
+            continue
+        counts["inserted" if movie is None else "updated"] += 1
+        changed.add(tmdb_id)
+        if movie is not None:
+            for k, v in fields.items():
+                setattr(movie, k, v)
+            movie.tmdb_fingerprint = fingerprint
+
+    if changed:
+        created = Movie.objects.bulk_create(
+            [
+                Movie(tmdb_id=tmdb_id, tmdb_fingerprint=payloads[tmdb_id][1], **payloads[tmdb_id][0])
+                for tmdb_id in changed
+            ],
+            update_conflicts=True,
+            unique_fields=["tmdb_id"],
+            update_fields=[*MOVIE_LIST_FIELDS, "tmdb_fingerprint", "updated_at"],
+        )
+        # 새로 들어간 행은 bulk_create가 돌려준 pk 사용 (RETURNING 미지원 DB면 다시 조회)
+        for movie in created:
+            if movie.tmdb_id not in by_tmdb_id:
+                by_tmdb_id[movie.tmdb_id] = movie
+        if any(by_tmdb_id[tmdb_id].pk is None for tmdb_id in changed):
+            by_tmdb_id = Movie.objects.in_bulk(list(payloads), field_name="tmdb_id")
+        # 검색 색인도 같은 트랜잭션에서 (바뀐 영화만)
+        index_movies([by_tmdb_id[tmdb_id] for tmdb_id in changed])
+
+    count_rows("movie", **counts)
+    return [by_tmdb_id[tmdb_id] for tmdb_id in payloads], changed
+
+
+def upsert_movie_page(results: list):
+    """
+    목록 페이지(discover/popular 등) 반영: 영화 upsert + 바뀐 영화만 장르 연결 (한 트랜잭션)
+    - 반환: (movies, 바뀐 영화 수)
+    """
+    with transaction.atomic():
+        movies, changed = _upsert_movies(results)
+
+        # 장르 연결(Genre master가 있어야 함) - 목록에 genre_ids가 없으면 기존 연결 유지
+        if changed and genre_registry.exists():
+            genre_ids_by_tmdb = {item.get("id"): item.get("genre_ids") or [] for item in results}
+            set_movies_genres(
+                {
+                    m: genre_ids_by_tmdb[m.tmdb_id]
+                    for m in movies
+                    if m.tmdb_id in changed and genre_ids_by_tmdb.get(m.tmdb_id)
+                }
+            )
+    return movies, len(changed)
+
+
+class GenreRegistry:
+    """
+    Genre master 프로세스 캐시: tmdb_id → (pk, name)
+    - 장르는 거의 바뀌지 않으므로 동기화 실행마다 1번 로드(load)하고 영화마다 조회하지 않음
+    - upsert_genres가 새 장르/이름 변경을 쓰면 다시 로드
+    - 모르는 tmdb_id를 만나면(다른 프로세스가 추가했을 수 있음) RELOAD_INTERVAL에 1번만 다시 로드
+    """
+
+    RELOAD_INTERVAL = 60
+
+    def __init__(self):
+        self._genres = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self):
+        genres = {tmdb_id: (pk, name) for pk, tmdb_id, name in Genre.objects.values_list("id", "tmdb_id", "name")}
+        with self._lock:
+            self._genres = genres
+            self._loaded_at = time.monotonic()
+        return genres
+
+    def invalidate(self):
+        with self._lock:
+            self._genres = None
+
+    def _get(self, tmdb_ids=()) -> dict:
+        genres = self._genres
+        if genres is None:
+            return self.load()
+        if any(gid not in genres for gid in tmdb_ids) and time.monotonic() - self._loaded_at > self.RELOAD_INTERVAL:
+            return self.load()
+        return genres
+
+    def exists(self) -> bool:
+        return bool(self._get())
+
+    def pk_map(self, tmdb_ids) -> dict:
+        """
+        {genre tmdb_id: Genre pk} - DB에 없는 id는 빠짐
+        """
+        genres = self._get(tmdb_ids)
+        return {gid: genres[gid][0] for gid in tmdb_ids if gid in genres}
+
+    def changed(self, genres_list: list) -> list:
+        """
+        genres_list 중 DB에 없거나 이름이 바뀐 것만
+        """
+        genres = self._get([g["id"] for g in genres_list])
+        return [g for g in genres_list if genres.get(g["id"], (None, None))[1] != (g.get("name") or "")]
+
+
+genre_registry = GenreRegistry()
+
+
 def upsert_genres(genres_list: list):
     # genres_list: [{"id":..., "name":...}, ...]
-    for g in genres_list:
-        Genre.objects.update_or_create(
-            tmdb_id=g["id"],
-            defaults={"name": g.get("name") or ""},
-        )
+    # registry와 같으면(대부분의 detail 응답) 쓰기 없이 끝
+    changed = genre_registry.changed(genres_list or [])
+    if not changed:
+        return
+    Genre.objects.bulk_create(
+        [Genre(tmdb_id=g["id"], name=g.get("name") or "") for g in changed],
+        update_conflicts=True,
+        unique_fields=["tmdb_id"],
+        update_fields=["name"],
+    )
+    # 다음 조회 때 새 장르 pk까지 다시 로드
+    genre_registry.invalidate()
 
 
 @transaction.atomic
 def set_movie_genres(movie: Movie, genre_ids: list[int]):
-    # 중복/정합성 단순화를 위해: 기존 매핑 삭제 후 재생성
-    MovieGenre.objects.filter(movie=movie).delete()
-    genres = Genre.objects.filter(tmdb_id__in=genre_ids)
-    for gen in genres:
-        MovieGenre.objects.create(movie=movie, genre=gen)
+    set_movies_genres({movie: genre_ids})
 
 
+@profiled("genres")
 @transaction.atomic
-def sync_movie_credits(movie: Movie, cast_limit=10):
-    credits = _tmdb_get(f"/movie/{movie.tmdb_id}/credits")
+def set_movies_genres(genre_ids_by_movie: dict):
+    """
+    {movie: [genre tmdb_id, ...]} 를 한 번에 반영
+    - 중복/정합성 단순화를 위해: 기존 매핑 삭제 후 재생성 (영화 수와 무관하게 쿼리 2번, 장르 pk는 genre_registry)
+    """
+    if not genre_ids_by_movie:
+        return
+    all_ids = {gid for ids in genre_ids_by_movie.values() for gid in ids}
+    genre_pk = genre_registry.pk_map(all_ids)
+
+    MovieGenre.objects.filter(movie__in=list(genre_ids_by_movie)).delete()
+    MovieGenre.objects.bulk_create(
+        [
+            MovieGenre(movie=movie, genre_id=genre_pk[gid])
+            for movie, ids in genre_ids_by_movie.items()
+            for gid in dict.fromkeys(ids)
+            if gid in genre_pk
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def sync_movie_credits(movie: Movie, cast_limit=10, timeout=None):
+    credits = _tmdb_get(f"/movie/{movie.tmdb_id}/credits", timeout=timeout, max_retries=0 if timeout else None)
+    apply_movie_credits(movie, credits, cast_limit=cast_limit)
 
-    # 기존 크레딧 제거 후 재생성(정합성 유지)
-    MovieCredit.objects.filter(movie=movie).delete()
+
+PERSON_FIELDS = ["name", "profile_path", "known_for_department"]
+CREDIT_FIELDS = ["character_name", "job", "order"]
+
+
+def _person_defaults(person_json: dict) -> dict:
+    return {
+        "name": (person_json.get("name") or "")[:100],
+        "profile_path": person_json.get("profile_path") or "",
+        "known_for_department": (person_json.get("known_for_department") or "")[:50],
+    }
+
+
+def _desired_credits(credits: dict, cast_limit=10):
+    """
+    credits JSON → (people, rows)
+    - people: {person tmdb_id: Person 필드}
+    - rows: {(person tmdb_id, role_type): MovieCredit 필드}  (같은 키가 또 나오면 첫 번째만)
+    """
+    people, rows = {}, {}
 
     # 감독(crew에서 job == Director)
-    for crew in credits.get("crew", []):
-        if crew.get("job") == "Director":
-            person, _ = Person.objects.update_or_create(
-                tmdb_id=crew["id"],
-                defaults={
-                    "name": crew.get("name") or "",
-                    "profile_path": crew.get("profile_path") or "",
-                    "known_for_department": crew.get("known_for_department") or "",
-                },
-            )
-            MovieCredit.objects.create(
-                movie=movie,
-                person=person,
-                role_type="DIRECTOR",
-                job="Director",
-                order=0,
-            )
+    for crew in credits.get("crew") or []:
+        if crew.get("job") == "Director" and crew.get("id"):
+            people.setdefault(crew["id"], _person_defaults(crew))
+            rows.setdefault((crew["id"], "DIRECTOR"), {"character_name": "", "job": "Director", "order": 0})
 
     # 출연진(cast 상위 N명)
     for idx, cast in enumerate((credits.get("cast") or [])[:cast_limit]):
-        person, _ = Person.objects.update_or_create(
-            tmdb_id=cast["id"],
-            defaults={
-                "name": cast.get("name") or "",
-                "profile_path": cast.get("profile_path") or "",
-                "known_for_department": cast.get("known_for_department") or "",
+        if not cast.get("id"):
+            continue
+        people.setdefault(cast["id"], _person_defaults(cast))
+        rows.setdefault(
+            (cast["id"], "CAST"),
+            {
+                "character_name": (cast.get("character") or "")[:100],
+                "job": "",
+                "order": int(cast.get("order") or idx),
             },
         )
-        MovieCredit.objects.create(
-            movie=movie,
-            person=person,
-            role_type="CAST",
-            character_name=cast.get("character") or "",
-            order=int(cast.get("order") or idx),
-        )
+    return people, rows
 
 
-@transaction.atomic
-def sync_home_section(section_code: str, tmdb_path: str, pages=1, with_credits=True):
-    # section_code: POPULAR / NOW_PLAYING / TOP_RATED
-    HomeSectionEntry.objects.filter(section=section_code).delete()
+@profiled("credits")
+def apply_movie_credits(movie: Movie, credits: dict, cast_limit=10):
+    """
+    이미 받아온 credits JSON을 DB에 반영 (네트워크 호출 없음)
+    - 기존 크레딧과 비교해서 바뀐 것만 insert/update/delete (쓰기가 있을 때만 트랜잭션)
+    - 변경이 없으면 기존 크레딧 조회 1번으로 끝
+    - Person은 새로 등장했거나 정보가 바뀐 사람만 일괄 upsert
+    """
+    people, rows = _desired_credits(credits, cast_limit=cast_limit)
+
+    current = {
+        (c.person.tmdb_id, c.role_type): c
+        for c in MovieCredit.objects.filter(movie=movie).select_related("person")
+    }
+    known_people = {key[0]: c.person for key, c in current.items()}
+
+    stale_people = [
+        tmdb_id
+        for tmdb_id, fields in people.items()
+        if tmdb_id not in known_people
+        or any(getattr(known_people[tmdb_id], k) != v for k, v in fields.items())
+    ]
+    to_delete = [c.pk for key, c in current.items() if key not in rows]
+    to_update = []
+    for key, fields in rows.items():
+        c = current.get(key)
+        if c is not None and any(getattr(c, k) != v for k, v in fields.items()):
+            for k, v in fields.items():
+                setattr(c, k, v)
+            to_update.append(c)
+    new_keys = [key for key in rows if key not in current]
+    count_rows(
+        "credit",
+        inserted=len(new_keys),
+        updated=len(to_update),
+        unchanged=len(rows) - len(new_keys) - len(to_update),
+        deleted=len(to_delete),
+    )
+
+    if not (stale_people or to_delete or to_update or new_keys):
+        return
+
+    with transaction.atomic():
+        person_pk = {tmdb_id: p.pk for tmdb_id, p in known_people.items()}
+        if stale_people:
+            Person.objects.bulk_create(
+                [Person(tmdb_id=tmdb_id, **people[tmdb_id]) for tmdb_id in stale_people],
+                update_conflicts=True,
+                unique_fields=["tmdb_id"],
+                update_fields=PERSON_FIELDS,
+            )
+            missing = [tmdb_id for tmdb_id in stale_people if tmdb_id not in person_pk]
+            if missing:
+                person_pk.update(Person.objects.filter(tmdb_id__in=missing).values_list("tmdb_id", "id"))
+            index_people([(person_pk[tmdb_id], people[tmdb_id]["name"]) for tmdb_id in stale_people])
+
+        if to_delete:
+            MovieCredit.objects.filter(pk__in=to_delete).delete()
+        if to_update:
+            MovieCredit.objects.bulk_update(to_update, CREDIT_FIELDS)
+        if new_keys:
+            MovieCredit.objects.bulk_create(
+                [
+                    MovieCredit(movie=movie, person_id=person_pk[tmdb_id], role_type=role_type, **rows[(tmdb_id, role_type)])
+                    for tmdb_id, role_type in new_keys
+                ]
+            )
+
 
-    rank = 1
+def sync_home_section(section_code: str, tmdb_path: str, pages=1, with_credits=True, with_detail=False):
+    """
+    section_code: POPULAR / NOW_PLAYING / TOP_RATED
+    1) 네트워크: 목록 페이지와 detail/credits를 트랜잭션 밖에서 전부 받아둠
+    2) 카탈로그 반영: 영화/장르/크레딧 upsert (짧은 트랜잭션 여러 개)
+    3) 교체: 새 version으로 순위를 넣고 활성 version만 바꿈 → home은 빈 섹션을 보지 않음
+    """
+    genre_registry.load()   # 실행마다 장르 master 1번만 조회
+    items = []
     seen_tmdb_ids = set()   # ✅ 중복 방지
 
     for page in range(1, pages + 1):
         data = _tmdb_get(tmdb_path, params={"page": page})
-        results = data.get("results") or []
-
-        for item in results:
-            movie = upsert_movie_from_tmdb(item)
-
+        for item in data.get("results") or []:
             # ✅ 같은 섹션에 같은 영화가 또 나오면 스킵
-            if movie.tmdb_id in seen_tmdb_ids:
+            if not item.get("id") or item["id"] in seen_tmdb_ids:
                 continue
-            seen_tmdb_ids.add(movie.tmdb_id)
+            seen_tmdb_ids.add(item["id"])
+            items.append(item)
 
-            genre_ids = item.get("genre_ids") or []
-            if Genre.objects.exists():
-                set_movie_genres(movie, genre_ids)
+    # detail+credits 둘 다면 영화당 요청 1번(append_to_response)
+    enrichments = {}
+    if with_detail or with_credits:
+        for item in items:
+            enrichments[item["id"]] = _fetch_enrichment(item["id"], with_detail, with_credits)
+
+    movies, changed = upsert_movie_page(items)
+
+    for movie in movies:
+        if movie.tmdb_id in enrichments:
+            detail, credits = enrichments[movie.tmdb_id]
+            _apply_enrichment(movie, detail, credits, with_detail, with_credits)
+
+    swap_home_section(section_code, movies)
+    return len(movies), changed
 
-            # ✅ create 대신 update_or_create (유니크 충돌 안전)
-            HomeSectionEntry.objects.update_or_create(
-                section=section_code,
-                movie=movie,
-                defaults={"rank": rank},
-            )
-            rank += 1
 
-            if with_credits:
-                try:
-                    sync_movie_credits(movie, cast_limit=10)
-                except Exception:
-                    pass
+@profiled("swap")
+@transaction.atomic
+def swap_home_section(section_code: str, movies: list):
+    """
+    새 순위를 다음 version으로 넣고 활성 version 포인터를 교체 (네트워크 없음, 짧은 쓰기 1번)
+    - 직전 version은 교체 순간 읽고 있던 요청을 위해 한 세대 남겨두고, 그보다 오래된 것만 삭제
+    """
+    section, _ = HomeSection.objects.select_for_update().get_or_create(code=section_code)
+    version = section.active_version + 1
+
+    HomeSectionEntry.objects.bulk_create(
+        [
+            HomeSectionEntry(section=section_code, version=version, movie=movie, rank=rank)
+            for rank, movie in enumerate(movies, start=1)
+        ]
+    )
+    section.active_version = version
+    section.save(update_fields=["active_version", "swapped_at"])
+    bump_version(HOME_VERSION_KEY)  # 같은 트랜잭션 → 교체가 커밋되는 순간 홈 캐시도 새 version
+
+    HomeSectionEntry.objects.filter(section=section_code, version__lt=version - 1).delete()
+    return version
 
 
 
@@ -161,74 +519,494 @@ def fetch_and_sync_genre_master():
     data = _tmdb_get("/genre/movie/list")
     genres = data.get("genres") or []
     upsert_genres(genres)
+    genre_registry.load()
     return genres
 
 
 def fetch_movie_detail_and_update(movie: Movie):
     detail = _tmdb_get(f"/movie/{movie.tmdb_id}")
-    # 런타임 등 상세 정보 업데이트
+    apply_movie_detail(movie, detail)
+
+
+@profiled("detail")
+def apply_movie_detail(movie: Movie, detail: dict):
+    """
+    이미 받아온 detail JSON을 DB에 반영 (네트워크 호출 없음)
+    """
+    # 런타임 등 상세 정보 업데이트 (목록 필드도 상세에 값이 있으면 최신으로 덮어씀)
+    runtime_before, fingerprint_before = movie.runtime, movie.tmdb_fingerprint
+    fields = ["runtime"]
+    for field, value in _movie_defaults(detail).items():
+        if detail.get(field) not in ("", None):
+            setattr(movie, field, value)
+            fields.append(field)
     movie.runtime = detail.get("runtime") or movie.runtime
-    movie.overview = detail.get("overview") or movie.overview
-    movie.save(update_fields=["runtime", "overview"])
+    movie.enriched_at = timezone.now()
 
-    # 상세의 genres는 [{"id","name"}] 형태라 master도 같이 업데이트 가능
+    # 상세의 genres는 [{"id","name"}] 형태라 master도 같이 업데이트 가능 (registry와 같으면 쓰기 없음)
     genres = detail.get("genres") or []
     upsert_genres(genres)
-    set_movie_genres(movie, [g["id"] for g in genres])
+    genre_ids = [g["id"] for g in genres]
+    movie.tmdb_fingerprint = _movie_fingerprint(
+        {f: getattr(movie, f) for f in MOVIE_LIST_FIELDS}, _linked_genre_ids(genre_ids)
+    )
 
+    # 내용이 그대로면 보강 시각만 기록 (updated_at 유지, 장르 재연결 X)
+    if movie.tmdb_fingerprint == fingerprint_before and movie.runtime == runtime_before:
+        Movie.objects.filter(pk=movie.pk).update(enriched_at=movie.enriched_at)
+        count_rows("detail", unchanged=1)
+        return
 
-# backend/movies/services/tmdb.py
+    movie.save(update_fields=[*fields, "tmdb_fingerprint", "enriched_at", "updated_at"])  # 검색 색인은 시그널(movies/signals.py)
+    count_rows("detail", updated=1)
+    set_movie_genres(movie, genre_ids)
 
-import time
-from django.db import transaction
-from movies.models import Movie, Genre
 
-# ... (기존 코드 유지)
+def fetch_movie_enrichment(movie: Movie, cast_limit=10, timeout=None):
+    """
+    detail + credits를 append_to_response로 한 번에 받아서 한 트랜잭션으로 반영 (요청 1번)
+    - timeout을 주면 재시도 없이 그 시간 안에 끝나는 요청만 시도(뷰에서 인라인 호출용)
+    - 반영하면서 enriched_at을 지금으로 찍으므로 응답 캐시(상세 1일)는 읽지 않음
+    """
+    detail = _tmdb_get(
+        f"/movie/{movie.tmdb_id}",
+        params={"append_to_response": "credits"},
+        timeout=timeout,
+        max_retries=0 if timeout else None,
+        refresh=True,
+    )
+    apply_movie_enrichment(movie, detail, cast_limit=cast_limit)
+
 
 @transaction.atomic
-def sync_bulk_movies(pages=25, sort_by="popularity.desc", with_credits=False, with_detail=False, sleep_sec=0.15):
+def apply_movie_enrichment(movie: Movie, detail: dict, cast_limit=10):
+    """
+    append_to_response=credits 응답(detail 안에 "credits" 포함)을 반영
+    """
+    credits = detail.get("credits")
+    apply_movie_detail(movie, detail)
+    if credits is not None:
+        apply_movie_credits(movie, credits, cast_limit=cast_limit)
+
+
+def _fetch_enrichment(tmdb_id: int, with_detail: bool, with_credits: bool, limiter=None):
+    """
+    워커 스레드에서 실행: detail/credits JSON만 받아온다(DB 접근 없음)
+    - 둘 다 필요하면 append_to_response=credits로 요청 1번
+    실패한 요청은 경고 로그를 남기고 None으로 돌려서 해당 항목만 건너뛰게 함
+    """
+    def get(what, path, params=None):
+        try:
+            return _limited_get(limiter, path, params=params)
+        except Exception as e:
+            logger.warning("tmdb %s fetch failed (movie %s): %s", what, tmdb_id, describe_error(e))
+            return None
+
+    if with_detail and with_credits:
+        detail = get("detail+credits", f"/movie/{tmdb_id}", {"append_to_response": "credits"})
+        return detail, detail.get("credits") if detail is not None else None
+
+    detail = get("detail", f"/movie/{tmdb_id}") if with_detail else None
+    credits = get("credits", f"/movie/{tmdb_id}/credits") if with_credits else None
+    return detail, credits
+
+
+def fetch_pool(concurrency=1, rps=None):
+    """
+    (limiter, executor) 생성
+    - concurrency 2 이상: 워커 스레드 풀 + 토큰 버킷(rps 미지정 시 TMDB_DEFAULT_RPS)
+    - concurrency 1: 순차 처리(rps를 지정한 경우에만 토큰 버킷 사용)
+    """
+    concurrency = max(1, int(concurrency or 1))
+    if rps is None and concurrency > 1:
+        rps = TMDB_DEFAULT_RPS
+    limiter = TokenBucket(rps) if rps else None
+    executor = (
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tmdb-fetch")
+        if concurrency > 1 else None
+    )
+    return limiter, executor
+
+
+def _enrich_movies(movies: list, with_detail: bool, with_credits: bool, limiter=None, executor=None):
+    """
+    movies의 detail/credits를 받아서 반영
+    - executor가 있으면 요청은 워커 풀로 분산, DB 쓰기는 호출한 스레드(단일 writer)에서만 수행
+    - 반환: 요청한 항목을 모두 반영한 영화 수
+    """
+    if executor is None:
+        fetched = (_fetch_enrichment(m.tmdb_id, with_detail, with_credits, limiter) for m in movies)
+    else:
+        fetched = executor.map(
+            lambda m: _fetch_enrichment(m.tmdb_id, with_detail, with_credits, limiter),
+            movies,
+        )
+
+    done = 0
+    for movie, (detail, credits) in zip(movies, fetched):
+        done += _apply_enrichment(movie, detail, credits, with_detail, with_credits)
+    return done
+
+
+def _apply_enrichment(movie: Movie, detail, credits, with_detail: bool, with_credits: bool) -> bool:
+    """
+    _fetch_enrichment 결과 반영 - detail/credits는 한 트랜잭션으로
+    반환: 요청한 항목을 모두 반영했으면 True
+    """
+    ok = (detail is not None or not with_detail) and (credits is not None or not with_credits)
+    try:
+        with transaction.atomic():
+            if detail is not None:
+                apply_movie_detail(movie, detail)
+            if credits is not None:
+                apply_movie_credits(movie, credits, cast_limit=10)
+    except Exception as e:
+        logger.warning("tmdb enrichment apply failed (movie %s): %s", movie.tmdb_id, describe_error(e))
+        ok = False
+    return ok
+
+
+def sync_bulk_movies(
+    pages=25,
+    sort_by="popularity.desc",
+    with_credits=False,
+    with_detail=False,
+    sleep_sec=0.15,
+    concurrency=1,
+    rps=None,
+    start_page=1,
+    run=None,
+):
     """
     TMDB discover/movie로 영화 다량 upsert
     - pages=25 -> 500개(20개*25)
     - with_credits: True면 크레딧까지 저장(요청 수 폭증하니 보통 False 추천)
     - with_detail: True면 runtime/genres 보정까지 저장(역시 요청 수 증가)
+    - concurrency: 2 이상이면 detail/credits 요청을 N개 워커로 병렬 처리
+    - rps: 초당 요청 수 제한(토큰 버킷). 병렬 모드에서 지정하지 않으면 TMDB_DEFAULT_RPS
+    - start_page/run: 페이지 단위로 커밋하고 SyncRun에 진행 상황 기록 → 실패 시 이어서 재개 가능
     """
+    limiter, executor = fetch_pool(concurrency, rps)
+    genre_registry.load()   # 실행마다 장르 master 1번만 조회
+
     total = 0
-    for page in range(1, pages + 1):
-        data = _tmdb_get(
-            "/discover/movie",
-            params={
-                "sort_by": sort_by,
-                "page": page,
-                "include_adult": False,
-                "include_video": False,
-            },
-        )
-        results = data.get("results") or []
+    try:
+        for page in range(start_page, pages + 1):
+            data = _limited_get(
+                limiter,
+                "/discover/movie",
+                params={
+                    "sort_by": sort_by,
+                    "page": page,
+                    "include_adult": False,
+                    "include_video": False,
+                },
+            )
+            results = data.get("results") or []
+
+            # 페이지 단위 커밋: 전체 실행 동안 SQLite 쓰기 락을 잡고 있지 않음
+            movies, changed = upsert_movie_page(results)
+            total += len(movies)
+
+            errors = 0
+            if with_detail or with_credits:
+                done = _enrich_movies(movies, with_detail, with_credits, limiter=limiter, executor=executor)
+                errors = len(movies) - done
+
+            if run is not None:
+                run.record_page(page, len(movies), errors, changed=changed)
+
+            # TMDB 요청 과열 방지(너무 빠르면 막힘/에러 날 수 있음)
+            # 토큰 버킷을 쓰는 경우엔 버킷이 속도를 맞춰주므로 고정 sleep 생략
+            if limiter is None:
+                with stage("sleep"):
+                    time.sleep(sleep_sec)
+    except Exception as e:
+        if run is not None:
+            run.mark_failed(e)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    if run is not None:
+        run.mark_done()
+    return total
 
-        for item in results:
-            movie = upsert_movie_from_tmdb(item)
 
-            # 장르 연결(Genre master가 있어야 함)
-            genre_ids = item.get("genre_ids") or []
-            if Genre.objects.exists() and genre_ids:
-                set_movie_genres(movie, genre_ids)
+# TMDB /movie/changes는 한 번에 최대 14일 구간만 조회 가능
+TMDB_CHANGES_MAX_DAYS = 14
 
-            if with_detail:
-                try:
-                    fetch_movie_detail_and_update(movie)
-                except Exception:
-                    pass
 
-            if with_credits:
-                try:
-                    sync_movie_credits(movie, cast_limit=10)
-                except Exception:
-                    pass
+def fetch_changed_movie_ids(start_date, end_date) -> set[int]:
+    """
+    [start_date, end_date] 사이에 TMDB에서 변경된 영화 id 전체 (14일 단위로 나눠서 조회)
+    """
+    changed = set()
+    window_start = start_date
+    while window_start <= end_date:
+        window_end = min(end_date, window_start + timedelta(days=TMDB_CHANGES_MAX_DAYS - 1))
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            data = _tmdb_get(
+                "/movie/changes",
+                params={
+                    "start_date": window_start.isoformat(),
+                    "end_date": window_end.isoformat(),
+                    "page": page,
+                },
+            )
+            for item in data.get("results") or []:
+                if item.get("id") and not item.get("adult"):
+                    changed.add(item["id"])
+            total_pages = int(data.get("total_pages") or 1)
+            page += 1
+        window_start = window_end + timedelta(days=1)
+    return changed
 
-            total += 1
 
-        # TMDB 요청 과열 방지(너무 빠르면 막힘/에러 날 수 있음)
-        time.sleep(sleep_sec)
+def sync_changed_movies(start_date, end_date, with_credits=False, concurrency=1, rps=None, chunk_size=500):
+    """
+    TMDB 변경 피드 기반 증분 동기화
+    - 변경된 id 중 우리 DB에 있는 영화만 detail(+credits) 다시 받아서 반영
+    - 반환: {"changed": 피드의 변경 수, "updated": 갱신 수, "skipped": 미보유로 건너뜀, "failed": 실패}
+    """
+    changed_ids = sorted(fetch_changed_movie_ids(start_date, end_date))
 
-    return total
+    limiter, executor = fetch_pool(concurrency, rps)
+
+    known = updated = 0
+    try:
+        # SQLite 변수 개수 제한을 피하려고 chunk 단위로 조회
+        for i in range(0, len(changed_ids), chunk_size):
+            chunk = changed_ids[i : i + chunk_size]
+            movies = list(Movie.objects.filter(tmdb_id__in=chunk))
+            known += len(movies)
+            updated += _enrich_movies(movies, True, with_credits, limiter=limiter, executor=executor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    return {
+        "changed": len(changed_ids),
+        "updated": updated,
+        "skipped": len(changed_ids) - known,
+        "failed": known - updated,
+    }
+
+
+# ----------------------------
+# TMDB daily ID export 가져오기 (movie_ids_MM_DD_YYYY.json.gz)
+# ----------------------------
+def iter_export_movies(path, include_adult=False, include_video=False, min_popularity=0.0, stats=None):
+    """
+    gzip NDJSON export를 한 줄씩 읽어서 dict를 돌려줌 (파일 전체를 메모리에 올리지 않음)
+    - 한 줄: {"adult": false, "id": 3924, "original_title": "...", "popularity": 2.1, "video": false}
+    - stats(Counter)를 넘기면 read/invalid/filtered 수를 기록
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if stats is not None:
+                stats["read"] += 1
+            try:
+                item = json.loads(line)
+                tmdb_id = int(item["id"])
+            except (ValueError, KeyError, TypeError):
+                if stats is not None:
+                    stats["invalid"] += 1
+                continue
+            if (
+                (item.get("adult") and not include_adult)
+                or (item.get("video") and not include_video)
+                or float(item.get("popularity") or 0) < min_popularity
+            ):
+                if stats is not None:
+                    stats["filtered"] += 1
+                continue
+            item["id"] = tmdb_id
+            yield item
+
+
+def import_tmdb_export(
+    path,
+    chunk_size=1000,
+    limit=None,
+    include_adult=False,
+    min_popularity=0.0,
+    with_credits=False,
+    inline=False,
+    concurrency=1,
+    rps=None,
+    progress=None,
+):
+    """
+    TMDB daily export의 영화 id 중 DB에 없는 것만 등록하고 보강 경로로 넘김
+    - chunk_size개씩: 이미 있는 id 조회 1번 → 새 id만 Movie 기본 행(original_title/popularity) 생성
+    - inline=False: 보강 작업(DETAIL, with_credits면 ENRICH)만 큐에 넣음 → run_workers가 처리 (네트워크 X)
+    - inline=True: 바로 detail(+credits)을 받아서 반영 (concurrency/rps는 sync_bulk_movies와 동일)
+    - limit: 새로 등록할 최대 영화 수
+    - progress(stats): chunk마다 호출 (진행 상황 출력용)
+    - 반환: Counter(read/invalid/filtered/existing/created/enriched)
+    """
+    stats = Counter()
+    kind = "ENRICH" if with_credits else "DETAIL"
+    limiter, executor = fetch_pool(concurrency, rps) if inline else (None, None)
+
+    try:
+        items = iter_export_movies(path, include_adult=include_adult, min_popularity=min_popularity, stats=stats)
+        for chunk in chunked(items, chunk_size):
+            by_id = {item["id"]: item for item in chunk}
+            existing = set(Movie.objects.filter(tmdb_id__in=list(by_id)).values_list("tmdb_id", flat=True))
+            stats["existing"] += len(existing)
+
+            new_ids = [tmdb_id for tmdb_id in by_id if tmdb_id not in existing]
+            if limit is not None:
+                new_ids = new_ids[: max(0, limit - stats["created"])]
+            if new_ids:
+                with transaction.atomic():
+                    Movie.objects.bulk_create(
+                        [
+                            Movie(
+                                tmdb_id=tmdb_id,
+                                title=(by_id[tmdb_id].get("original_title") or "")[:200],
+                                original_title=(by_id[tmdb_id].get("original_title") or "")[:200],
+                                popularity=float(by_id[tmdb_id].get("popularity") or 0),
+                            )
+                            for tmdb_id in new_ids
+                        ],
+                        ignore_conflicts=True,
+                        batch_size=500,
+                    )
+                    index_movies(Movie.objects.filter(tmdb_id__in=new_ids).only("id", "title", "original_title", "overview"))
+                    if not inline:
+                        enqueue_jobs(kind, new_ids)
+                stats["created"] += len(new_ids)
+
+                if inline:
+                    movies = list(Movie.objects.filter(tmdb_id__in=new_ids))
+                    stats["enriched"] += _enrich_movies(movies, True, with_credits, limiter=limiter, executor=executor)
+
+            if progress is not None:
+                progress(stats)
+            if limit is not None and stats["created"] >= limit:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+    return stats
+
+
+# ----------------------------
+# 보강 작업 큐 처리 (movies/services/jobs.py, run_workers 명령)
+# ----------------------------
+def _fetch_job_payload(job, limiter=None, movie=None):
+    """
+    워커 스레드에서 실행: 작업 종류별 TMDB 응답만 받아옴(DB 접근 없음) → (payload, error)
+    - IMAGES: 이미지 CDN에서 받아서 변형 파일까지 저장 (API 요청이 아니라 limiter 미사용)
+    - 나머지: 갱신하려고 등록한 작업이라 응답 캐시를 읽지 않음 (enriched_at이 캐시된 옛 응답으로 찍히지 않게)
+    """
+    try:
+        if job.kind == "IMAGES":
+            if movie is None:
+                return None, None
+            return fetch_movie_images(movie), None
+        if job.kind == "CREDITS":
+            return _limited_get(limiter, f"/movie/{job.tmdb_id}/credits", refresh=True), None
+        params = {"append_to_response": "credits"} if job.kind == "ENRICH" else None
+        return _limited_get(limiter, f"/movie/{job.tmdb_id}", params=params, refresh=True), None
+    except Exception as e:
+        return None, e
+
+
+JOB_APPLIERS = {
+    "DETAIL": apply_movie_detail,
+    "CREDITS": lambda movie, payload: apply_movie_credits(movie, payload, cast_limit=10),
+    "ENRICH": lambda movie, payload: apply_movie_enrichment(movie, payload, cast_limit=10),
+    "IMAGES": save_image_assets,
+}
+
+
+def run_enrichment_jobs(jobs: list, limiter=None, executor=None) -> tuple[int, int]:
+    """
+    claim_jobs로 점유한 작업 처리
+    - 요청은 executor(워커 풀)로 분산, DB 쓰기와 작업 상태 갱신은 호출한 스레드에서만
+    - TMDB 404/DB에 없는 영화는 재시도하지 않고 FAILED
+    - IMAGES 작업이 있었으면 끝난 뒤 미러 용량 정리(enforce_image_budget) + 홈 캐시 무효화
+    - 반환: (완료 수, 실패 수)
+    """
+    movies = Movie.objects.in_bulk([job.tmdb_id for job in jobs], field_name="tmdb_id")
+
+    def fetch(job):
+        return _fetch_job_payload(job, limiter, movies.get(job.tmdb_id))
+
+    if executor is None:
+        fetched = (fetch(job) for job in jobs)
+    else:
+        fetched = executor.map(fetch, jobs)
+
+    done = failed = 0
+    for job, (payload, error) in zip(jobs, fetched):
+        movie = movies.get(job.tmdb_id)
+        if movie is None:
+            fail_job(job, LookupError(f"movie {job.tmdb_id} not in DB"), retry=False)
+            failed += 1
+            continue
+
+        if error is None:
+            try:
+                with transaction.atomic():
+                    JOB_APPLIERS[job.kind](movie, payload)
+            except Exception as e:
+                error = e
+
+        if error is None:
+            complete_job(job)
+            done += 1
+        else:
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+            fail_job(job, error, retry=status_code != 404)
+            failed += 1
+
+    if any(job.kind == "IMAGES" for job in jobs):
+        enforce_image_budget()
+        bump_version(HOME_VERSION_KEY)  # 홈 카드 이미지 URL이 바뀌었을 수 있음
+    return done, failed
+
+
+# ----------------------------
+# 상세 페이지 보강 정책 (stale-while-revalidate)
+# ----------------------------
+def ensure_movie_enriched(movie: Movie, has_credits: bool) -> str:
+    """
+    상세 페이지 요청 시 TMDB 보강 정책
+    - fresh: enriched_at이 TMDB_ENRICH_TTL 이내 → DB 그대로 사용
+    - stale: 오래됐거나(상세 미반영이어도) 크레딧은 이미 있음 → 지금 값으로 응답하고 ENRICH 작업만 등록
+      (이미 대기/실행 중인 작업이 있으면 조회 1번으로 끝, 실제 갱신은 run_workers가 처리)
+    - fetched/failed: 상세/크레딧이 아예 없음 → 짧은 timeout, 재시도 없이 인라인 1회 시도
+      (같은 영화 동시 요청은 single_flight로 1번만 호출, 실패하면 작업 큐에 넘겨서 워커가 재시도)
+    """
+    if movie.enriched_at is not None:
+        age = (timezone.now() - movie.enriched_at).total_seconds()
+        if age < settings.TMDB_ENRICH_TTL:
+            return "fresh"
+
+    if movie.enriched_at is not None or has_credits:
+        enqueue_job("ENRICH", movie.tmdb_id)
+        return "stale"
+
+    timeout = settings.TMDB_INLINE_TIMEOUT
+    try:
+        # 기다리는 쪽은 요청 timeout + DB 반영 시간까지 여유를 둠
+        single_flight(
+            f"enrich:{movie.tmdb_id}",
+            lambda: fetch_movie_enrichment(movie, cast_limit=10, timeout=timeout),
+            wait=timeout * 2,
+        )
+        return "fetched"
+    except Exception:
+        enqueue_job("ENRICH", movie.tmdb_id)
+        return "failed"
@@ -0,0 +1,188 @@
+# backend/movies/services/tmdb_cache.py
+import gzip
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+
+DAY = 24 * 60 * 60
+
+# 경로 패턴별 TTL(초) - 위에서부터 먼저 매칭되는 규칙 사용, 0이면 캐시하지 않음
+TTL_RULES = [
+    (re.compile(r"^/genre/"), 7 * DAY),                              # 장르 마스터: 거의 안 바뀜
+    (re.compile(r"^/movie/changes"), 0),                             # 변경 피드는 항상 최신으로
+    (re.compile(r"^/movie/\d+/credits"), 7 * DAY),                   # 크레딧: 1주
+    (re.compile(r"^/movie/\d+$"), DAY),                              # 상세: 1일
+    (re.compile(r"^/movie/(popular|now_playing|top_rated)"), 60 * 60),  # 홈 섹션 목록: 1시간
+    (re.compile(r"^/discover/"), 60 * 60),                           # discover 목록: 1시간
+]
+DEFAULT_TTL = 60 * 60
+
+# 캐시 동작 모드
+# - "on": 읽기/쓰기 모두
+# - "refresh": 읽지 않고 새로 받아서 덮어쓰기
+# - "off": 캐시를 전혀 사용하지 않음
+_mode = "on"
+
+
+def ttl_for(path: str) -> int:
+    for pattern, ttl in TTL_RULES:
+        if pattern.search(path):
+            return ttl
+    return DEFAULT_TTL
+
+
+def get_mode() -> str:
+    return _mode
+
+
+@contextmanager
+def cache_mode(mode: str):
+    """
+    with cache_mode("refresh"): ... 블록 안에서만 캐시 모드 변경 (관리 명령 --no-cache/--refresh 용)
+    """
+    global _mode
+    prev, _mode = _mode, mode
+    try:
+        yield
+    finally:
+        _mode = prev
+
+
+class TMDBResponseCache:
+    """
+    TMDB 응답 디스크 캐시 (별도 SQLite 파일, 본문은 gzip JSON)
+    - key: path + 정렬된 params 해시
+    - 만료: 엔드포인트별 TTL(ttl_for)
+    - 용량: max_bytes 초과 시 마지막 접근이 오래된 것부터 삭제(LRU)
+    """
+
+    # 조회할 때마다 접근시간을 쓰면 쓰기 락 경합이 커지므로 이 간격 이상일 때만 갱신
+    TOUCH_INTERVAL = 60
+    # 매 put마다 전체 용량을 계산하지 않고 N번에 한 번만 점검
+    EVICT_EVERY = 100
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tmdb_cache (
+                    key TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS tmdb_cache_accessed ON tmdb_cache (accessed_at)")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(path: str, params: dict) -> str:
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "api_key")
+        raw = json.dumps([path, items], ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, path: str, params: dict):
+        key = self.make_key(path, params)
+        row = self._conn().execute(
+            "SELECT body, expires_at, accessed_at FROM tmdb_cache WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is None or row[1] < now:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if now - row[2] > self.TOUCH_INTERVAL:
+            self._conn().execute("UPDATE tmdb_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        with self._lock:
+            self.hits += 1
+        return json.loads(gzip.decompress(row[0]))
+
+    def set(self, path: str, params: dict, data, ttl: int):
+        if ttl <= 0:
+            return
+        body = gzip.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"), compresslevel=5)
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO tmdb_cache (key, path, body, size, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self.make_key(path, params), path, body, len(body), now + ttl, now),
+        )
+        with self._lock:
+            self._puts += 1
+            should_evict = self._puts % self.EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """
+        만료된 항목 삭제 후, 그래도 max_bytes를 넘으면 오래 안 쓴 것부터 90%까지 줄임
+        """
+        conn = self._conn()
+        conn.execute("DELETE FROM tmdb_cache WHERE expires_at < ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM tmdb_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        target = total - int(self.max_bytes * 0.9)
+        removed = 0
+        freed = 0
+        rows = conn.execute("SELECT key, size FROM tmdb_cache ORDER BY accessed_at").fetchall()
+        keys = []
+        for key, size in rows:
+            if freed >= target:
+                break
+            keys.append((key,))
+            freed += size
+            removed += 1
+        conn.executemany("DELETE FROM tmdb_cache WHERE key = ?", keys)
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    프로세스 전역 응답 캐시 (settings.TMDB_CACHE_ENABLED=False면 None)
+    """
+    global _cache
+    if not getattr(settings, "TMDB_CACHE_ENABLED", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TMDBResponseCache(
+                    settings.TMDB_CACHE_PATH,
+                    max_bytes=getattr(settings, "TMDB_CACHE_MAX_BYTES", 256 * 1024 * 1024),
+                )
+    return _cache
@@ -0,0 +1,161 @@
+# backend/movies/services/tmdb_client.py
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+
+TMDB_BASE_URL = "https://api.themoviedb.org/3"
+
+# 재시도 대상: 요청 과다(429) + 일시적인 서버 오류
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TMDBClient:
+    """
+    TMDB 공용 HTTP 클라이언트
+    - requests.Session 재사용(커넥션 풀) → 매 요청마다 TCP/TLS 핸드셰이크 X
+    - 429/5xx/네트워크 오류는 지수 백오프로 재시도, Retry-After 헤더가 있으면 그 값을 따름
+    - 요청/재시도/실패 횟수, 상태 코드 분포, 지연시간/JSON 파싱 시간 집계 (stats())
+    """
+
+    def __init__(
+        self,
+        base_url=None,
+        api_key=None,
+        pool_size=16,
+        max_retries=3,
+        backoff=0.5,
+        max_backoff=30.0,
+        timeout=15,
+    ):
+        self.base_url = (base_url or TMDB_BASE_URL).rstrip("/")
+        self.api_key = api_key or ""
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    # ----------------------------
+    # stats
+    # ----------------------------
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {
+                "requests": 0,
+                "retries": 0,
+                "errors": 0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+                "parse_total": 0.0,
+                "status": {},
+            }
+
+    def _record(self, latency: float, retried=False, failed=False, status=None):
+        with self._lock:
+            s = self._stats
+            s["requests"] += 1
+            # 네트워크 오류(응답 없음)는 "error"로 집계
+            code = str(status) if status is not None else "error"
+            s["status"][code] = s["status"].get(code, 0) + 1
+            s["latency_total"] += latency
+            s["latency_max"] = max(s["latency_max"], latency)
+            if retried:
+                s["retries"] += 1
+            if failed:
+                s["errors"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = dict(self._stats, status=dict(self._stats["status"]))
+        out["latency_avg"] = out["latency_total"] / out["requests"] if out["requests"] else 0.0
+        return out
+
+    # ----------------------------
+    # request
+    # ----------------------------
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(self.max_backoff, max(0.0, float(retry_after)))
+                except ValueError:
+                    try:
+                        wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                        return min(self.max_backoff, max(0.0, wait))
+                    except Exception:
+                        pass
+        delay = self.backoff * (2 ** attempt)
+        return min(self.max_backoff, delay + random.uniform(0, delay / 2))
+
+    def get(self, path: str, params=None, timeout=None, max_retries=None) -> dict:
+        """
+        timeout/max_retries: 요청 경로(뷰)에서 짧게 끊고 싶을 때 호출 단위로 덮어씀
+        """
+        params = {"api_key": self.api_key, **(params or {})}
+        url = f"{self.base_url}{path}"
+        timeout = timeout or self.timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                r = self.session.get(url, params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                retry = attempt < max_retries
+                self._record(time.perf_counter() - started, retried=retry, failed=not retry)
+                if not retry:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if r.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+                self._record(time.perf_counter() - started, retried=True, status=r.status_code)
+                time.sleep(self._retry_delay(attempt, r))
+                attempt += 1
+                continue
+
+            self._record(time.perf_counter() - started, failed=not r.ok, status=r.status_code)
+            r.raise_for_status()
+
+            started = time.perf_counter()
+            data = r.json()
+            with self._lock:
+                self._stats["parse_total"] += time.perf_counter() - started
+            return data
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> TMDBClient:
+    """
+    프로세스 전역 TMDB 클라이언트 (스레드 간 공유)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TMDBClient(
+                    base_url=getattr(settings, "TMDB_BASE_URL", "") or TMDB_BASE_URL,
+                    api_key=settings.TMDB_API_KEY,
+                    pool_size=getattr(settings, "TMDB_HTTP_POOL_SIZE", 16),
+                    max_retries=getattr(settings, "TMDB_HTTP_MAX_RETRIES", 3),
+                )
+    return _client
@@ -0,0 +1,15 @@
+# backend/movies/services/utils.py
+
+
+def chunked(iterable, size):
+    """
+    iterable을 size개씩 list로 나눠서 돌려줌 (SQLite 변수 개수 제한/트랜잭션 크기 조절용)
+    """
+    chunk = []
+    for x in iterable:
+        chunk.append(x)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
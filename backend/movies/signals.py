@@ -0,0 +1,36 @@
+# backend/movies/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from movies.models import Movie, Person
+from movies.services.search import MOVIE_FTS_COLUMNS, index_movies, index_people, unindex_movies, unindex_people
+
+# 검색 색인(services/search.py)을 개별 save/delete와 맞춤
+# - loaddata(raw=True), admin, 직접 ORM 저장도 색인되도록
+# - update_fields가 색인 컬럼과 겹치지 않으면 건너뜀 (보강 시각만 찍는 저장 등)
+
+
+def _touches(update_fields, columns) -> bool:
+    return update_fields is None or not set(update_fields).isdisjoint(columns)
+
+
+@receiver(post_save, sender=Movie)
+def index_saved_movie(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, MOVIE_FTS_COLUMNS):
+        index_movies([instance])
+
+
+@receiver(post_delete, sender=Movie)
+def unindex_deleted_movie(sender, instance, **kwargs):
+    unindex_movies([instance.pk])
+
+
+@receiver(post_save, sender=Person)
+def index_saved_person(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ("name",)):
+        index_people([(instance.pk, instance.name)])
+
+
+@receiver(post_delete, sender=Person)
+def unindex_deleted_person(sender, instance, **kwargs):
+    unindex_people([instance.pk])
@@ -1,3 +1,2011 @@
-from django.test import TestCase
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+import requests
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Count, F
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient, APIRequestFactory
+
+from reviews.models import Review
+from reviews.serializers import ReviewSerializer
+
+from .models import (
+    EnrichmentJob,
+    FetchLease,
+    Genre,
+    HomeSection,
+    HomeSectionEntry,
+    ImageAsset,
+    Movie,
+    MovieCredit,
+    MovieGenre,
+    Person,
+    ShardLeaseLost,
+    SyncRun,
+    SyncShard,
+)
+from .serializers import MovieListSerializer
+from .services import images, jobs, profiling, response_cache, singleflight, suggest, tmdb, tmdb_cache, tmdb_client
+from .services.jobs import (
+    JOB_BACKOFF_BASE,
+    JOB_BACKOFF_MAX,
+    claim_jobs,
+    complete_job,
+    enqueue_job,
+    enqueue_jobs,
+    fail_job,
+)
+from .services.profiling import IngestProfiler
+from .services.reviews import load_top_reviews, refresh_review_stats
+from .services.search import search_movie_ids, search_person_ids, search_tokens
+from .services.shards import SHARD_LEASE_SECONDS, claim_shard, create_sharded_run, run_shard_worker
+from .services.singleflight import SingleFlightTimeout, single_flight
+from .services.tmdb import (
+    GenreRegistry,
+    TokenBucket,
+    apply_movie_credits,
+    ensure_movie_enriched,
+    fetch_changed_movie_ids,
+    fetch_movie_enrichment,
+    import_tmdb_export,
+    run_enrichment_jobs,
+    swap_home_section,
+    sync_bulk_movies,
+    sync_changed_movies,
+    sync_home_section,
+    upsert_movies_from_tmdb,
+)
+from .services.tmdb_cache import DAY, TMDBResponseCache, cache_mode, ttl_for
+from .services.tmdb_client import TMDBClient
+
+User = get_user_model()
+
+
+# ----------------------------
+# 로컬 가짜 TMDB 서버
+# ----------------------------
+def fake_movie(tmdb_id: int, **extra) -> dict:
+    return {
+        "id": tmdb_id,
+        "title": f"movie {tmdb_id}",
+        "original_title": f"movie {tmdb_id}",
+        "release_date": "2020-01-01",
+        "popularity": 1000 - tmdb_id % 1000,
+        "vote_average": 7.0,
+        "vote_count": 100,
+        "genre_ids": [28],
+        **extra,
+    }
+
+
+def fake_credits(tmdb_id: int) -> dict:
+    return {
+        "cast": [{"id": tmdb_id * 10 + i, "name": f"actor {tmdb_id}-{i}", "character": f"role {i}", "order": i} for i in range(2)],
+        "crew": [{"id": tmdb_id * 10 + 9, "name": f"director {tmdb_id}", "job": "Director"}],
+    }
+
+
+def fake_detail(tmdb_id: int, query: dict) -> dict:
+    data = fake_movie(tmdb_id, runtime=100, genres=[{"id": 28, "name": "Action"}])
+    data.pop("genre_ids")
+    if "credits" in query.get("append_to_response", ""):
+        data["credits"] = fake_credits(tmdb_id)
+    return data
+
+
+class FakeTMDB:
+    """
+    ThreadingHTTPServer로 띄우는 가짜 TMDB (TMDB_BASE_URL을 여기로 돌려서 HTTP 클라이언트까지 그대로 테스트)
+    - routes: [(경로 정규식, handler(match, query) → dict 또는 (status, dict, headers))] 먼저 맞는 것 사용
+    - 기본 경로: /discover/movie(페이지마다 20편), /movie/<id>(append_to_response=credits), /movie/<id>/credits, /genre/movie/list
+    - requests: (path, query, 받은 시각) 기록, max_inflight: 동시에 처리 중이던 최대 요청 수
+    """
+
+    def __init__(self, routes=(), delay=0.0):
+        self.routes = [(re.compile(pattern), handler) for pattern, handler in routes] + [
+            (re.compile(r"^/discover/movie$"), self._discover),
+            (re.compile(r"^/movie/(\d+)$"), lambda m, q: fake_detail(int(m.group(1)), q)),
+            (re.compile(r"^/movie/(\d+)/credits$"), lambda m, q: fake_credits(int(m.group(1)))),
+            (re.compile(r"^/genre/movie/list$"), lambda m, q: {"genres": [{"id": 28, "name": "Action"}]}),
+        ]
+        self.delay = delay
+        self.requests = []
+        self.inflight = self.max_inflight = 0
+        self._lock = threading.Lock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/3"
+
+    @staticmethod
+    def _discover(match, query):
+        page = int(query.get("page", 1))
+        return {"page": page, "total_pages": 500, "results": [fake_movie(page * 100 + i) for i in range(20)]}
+
+    def _handle(self, req):
+        url = urlparse(req.path)
+        path = url.path.removeprefix("/3")
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        with self._lock:
+            self.requests.append((path, query, time.monotonic()))
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            status, body, headers = 404, {"status_message": "not found"}, {}
+            for pattern, handler in self.routes:
+                match = pattern.search(path)
+                if match:
+                    result = handler(match, query)
+                    status, body, headers = result if isinstance(result, tuple) else (200, result, {})
+                    break
+            # bytes면 그대로 (이미지 호스트 역할), 아니면 JSON
+            raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+            req.send_response(status)
+            req.send_header("Content-Type", "image/jpeg" if isinstance(body, bytes) else "application/json")
+            req.send_header("Content-Length", str(len(raw)))
+            for k, v in headers.items():
+                req.send_header(k, v)
+            req.end_headers()
+            req.wfile.write(raw)
+        finally:
+            with self._lock:
+                self.inflight -= 1
+
+    def paths(self, prefix=""):
+        return [path for path, _, _ in self.requests if path.startswith(prefix)]
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeTMDBMixin:
+    """
+    테스트마다 FakeTMDB를 띄우고 TMDB_BASE_URL/공용 클라이언트를 거기로 연결 (응답 캐시는 끔)
+    - fake_routes/fake_delay로 서버 동작 변경
+    """
+
+    fake_routes = ()
+    fake_delay = 0.0
+
+    def setUp(self):
+        super().setUp()
+        self.tmdb = FakeTMDB(self.fake_routes, self.fake_delay).__enter__()
+        self.addCleanup(self.tmdb.__exit__, None, None, None)
+        for ctx in (
+            override_settings(TMDB_BASE_URL=self.tmdb.url, TMDB_CACHE_ENABLED=False),
+            # 공용 클라이언트/장르 캐시는 프로세스 전역이라 테스트마다 새로
+            mock.patch.object(tmdb_client, "_client", None),
+        ):
+            ctx.__enter__()
+            self.addCleanup(ctx.__exit__, None, None, None)
+        tmdb.genre_registry.invalidate()
+        self.addCleanup(tmdb.genre_registry.invalidate)
+
+
+class BulkSyncConcurrencyTests(FakeTMDBMixin, TestCase):
+    """
+    sync_bulk_movies --concurrency/--rps: 요청은 워커 풀로 분산, 토큰 버킷이 rps 유지, DB 쓰기는 호출한 스레드에서만
+    """
+
+    fake_delay = 0.02
+
+    def test_token_bucket_rate(self):
+        bucket = TokenBucket(50, burst=1)
+        started = time.monotonic()
+        for _ in range(26):
+            bucket.acquire()
+        # 첫 토큰 이후 25개는 초당 50개 속도 → 0.5초
+        self.assertGreaterEqual(time.monotonic() - started, 0.45)
+
+        bucket = TokenBucket(20)
+        started = time.monotonic()
+        for _ in range(20):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - started, 0.2)  # burst(기본 = rate)까지는 기다리지 않음
+
+    def test_concurrency_fans_out(self):
+        total = sync_bulk_movies(pages=1, with_detail=True, with_credits=True, concurrency=4, rps=1000)
+        self.assertEqual(total, 20)
+        # 목록 1번 + 영화마다 detail+credits 1번(append_to_response)
+        self.assertEqual(len(self.tmdb.paths("/discover")), 1)
+        self.assertEqual(len(self.tmdb.paths("/movie/")), 20)
+        self.assertGreaterEqual(self.tmdb.max_inflight, 2)
+        self.assertEqual(Movie.objects.filter(runtime=100).count(), 20)
+        self.assertEqual(MovieCredit.objects.count(), 60)
+
+    def test_sequential_without_concurrency(self):
+        sync_bulk_movies(pages=1, with_detail=True, sleep_sec=0)
+        self.assertEqual(self.tmdb.max_inflight, 1)
+        self.assertEqual(Movie.objects.filter(runtime=100).count(), 20)
+
+    def test_limiter_holds_rps(self):
+        rps = 25
+        sync_bulk_movies(pages=2, with_detail=True, concurrency=4, rps=rps)
+        times = sorted(t for _, _, t in self.tmdb.requests)
+        self.assertEqual(len(times), 42)
+        # 토큰 버킷: k번째 요청까지 걸린 시간 ≥ (k - burst) / rps
+        for k, t in enumerate(times, start=1):
+            self.assertGreaterEqual(t - times[0], (k - rps) / rps - 0.05)
+
+    def test_db_writes_on_calling_thread(self):
+        caller = threading.get_ident()
+        db_threads, http_threads = set(), set()
+
+        def spy(fn, threads):
+            def wrapper(*args, **kwargs):
+                threads.add(threading.get_ident())
+                return fn(*args, **kwargs)
+            return wrapper
+
+        with mock.patch.object(tmdb, "upsert_movie_page", spy(tmdb.upsert_movie_page, db_threads)), \
+                mock.patch.object(tmdb, "apply_movie_detail", spy(tmdb.apply_movie_detail, db_threads)), \
+                mock.patch.object(tmdb, "apply_movie_credits", spy(tmdb.apply_movie_credits, db_threads)), \
+                mock.patch.object(tmdb, "_tmdb_get", spy(tmdb._tmdb_get, http_threads)):
+            sync_bulk_movies(pages=1, with_detail=True, with_credits=True, concurrency=4, rps=1000)
+
+        self.assertEqual(db_threads, {caller})
+        self.assertGreaterEqual(len(http_threads - {caller}), 2)  # detail 요청은 워커 스레드들에서
+
+    def test_fetch_failure_is_logged(self):
+        self.tmdb.routes.insert(0, (re.compile(r"^/movie/107/credits$"), lambda m, q: (404, {}, {})))
+        sync_bulk_movies(pages=1, with_detail=True, concurrency=4, rps=1000)  # detail만 → 실패 없음
+        with override_settings(TMDB_API_KEY="secret"), self.assertLogs(tmdb.logger, "WARNING") as logs:
+            detail, credits = tmdb._fetch_enrichment(107, with_detail=True, with_credits=True)
+            self.assertIsNotNone(detail)
+            tmdb._fetch_enrichment(107, with_detail=False, with_credits=True)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("credits fetch failed (movie 107): HTTPError", logs.output[0])
+        self.assertNotIn("secret", logs.output[0])  # describe_error로 api_key 가림
+
+    def test_apply_failure_is_logged(self):
+        def broken(movie, detail):
+            if movie.tmdb_id == 105:
+                raise ValueError("bad detail")
+            return apply(movie, detail)
+
+        apply = tmdb.apply_movie_detail
+        with mock.patch.object(tmdb, "apply_movie_detail", broken), self.assertLogs(tmdb.logger, "WARNING") as logs:
+            sync_bulk_movies(pages=1, with_detail=True, concurrency=4, rps=1000)
+
+        self.assertEqual(Movie.objects.filter(runtime=100).count(), 19)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("movie 105", logs.output[0])
+        self.assertIn("ValueError: bad detail", logs.output[0])
+
+
+class UpsertMoviesTests(TestCase):
+    """
+    _upsert_movies: 페이지 크기와 상관없이 쿼리 수 고정, insert/conflict update 경로 모두 pk·updated_at 정확
+    """
+
+    def _queries(self, results):
+        with CaptureQueriesContext(connection) as ctx:
+            tmdb._upsert_movies(results)
+        # TestCase 안이라 atomic은 SAVEPOINT로 감싸짐 → 실제 문장만 셈
+        return len([q for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]])
+
+    def test_constant_statements_per_page(self):
+        tmdb._upsert_movies([fake_movie(1)])  # catalog version 행 생성은 처음 한 번뿐이라 미리
+        small = self._queries([fake_movie(i) for i in range(2, 5)])
+        large = self._queries([fake_movie(i) for i in range(100, 120)])  # TMDB 한 페이지 = 20편
+        self.assertEqual(small, large)
+        # 기존 영화 일부 변경 + 새 영화 섞인 페이지도 같은 수
+        mixed = [fake_movie(i, title=f"changed {i}") for i in range(100, 110)] + [fake_movie(i) for i in range(200, 210)]
+        self.assertEqual(self._queries(mixed), large)
+        # 전부 그대로면 기존 행 조회 1번뿐
+        self.assertEqual(self._queries(mixed), 1)
+
+    def test_pk_and_updated_at(self):
+        existing = Movie.objects.create(tmdb_id=1, title="old")
+        Movie.objects.filter(pk=existing.pk).update(updated_at=timezone.now() - timedelta(days=1))
+        old_updated_at = Movie.objects.get(pk=existing.pk).updated_at
+
+        movies, changed = tmdb._upsert_movies([fake_movie(1), fake_movie(2), fake_movie(1, title="dup")])
+        self.assertEqual(changed, {1, 2})
+        self.assertEqual([m.tmdb_id for m in movies], [1, 2])  # 중복 tmdb_id는 첫 번째만
+        by_tmdb_id = Movie.objects.in_bulk(field_name="tmdb_id")
+        self.assertEqual(len(by_tmdb_id), 2)
+        # conflict update: 기존 pk 유지 + updated_at 갱신
+        self.assertEqual(movies[0].pk, existing.pk)
+        self.assertEqual(by_tmdb_id[1].title, "movie 1")
+        self.assertGreater(by_tmdb_id[1].updated_at, old_updated_at)
+        # insert: 돌려준 객체의 pk가 실제 행과 같음
+        self.assertEqual(movies[1].pk, by_tmdb_id[2].pk)
+        self.assertIsNotNone(by_tmdb_id[2].updated_at)
+
+        # 내용이 같으면 쓰지 않음 → updated_at 그대로
+        stamp = by_tmdb_id[2].updated_at
+        movies, changed = tmdb._upsert_movies([fake_movie(2)])
+        self.assertEqual(changed, set())
+        self.assertEqual(movies[0].pk, by_tmdb_id[2].pk)
+        self.assertEqual(Movie.objects.get(tmdb_id=2).updated_at, stamp)
+
+
+class TMDBClientTests(TestCase):
+    """
+    TMDBClient: 429/5xx 재시도, Retry-After(초/HTTP-date), max_retries=0, stats 집계
+    """
+
+    def _serve(self, *responses):
+        # 요청마다 responses를 차례대로 응답 (마지막 것은 계속 반복)
+        queue = list(responses)
+
+        def handler(match, query):
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+        fake = FakeTMDB([(r"^/x$", handler)]).__enter__()
+        self.addCleanup(fake.__exit__, None, None, None)
+        sleep = mock.patch.object(tmdb_client.time, "sleep").start()
+        self.addCleanup(mock.patch.stopall)
+        return TMDBClient(base_url=fake.url, api_key="k", backoff=0.01), fake, sleep
+
+    def test_retry_then_success(self):
+        client, fake, sleep = self._serve((503, {}, {}), (502, {}, {}), (200, {"ok": 1}, {}))
+        self.assertEqual(client.get("/x"), {"ok": 1})
+        self.assertEqual(len(fake.requests), 3)
+        self.assertEqual(fake.requests[0][1]["api_key"], "k")
+        self.assertEqual(sleep.call_count, 2)
+
+        stats = client.stats()
+        self.assertEqual((stats["requests"], stats["retries"], stats["errors"]), (3, 2, 0))
+        self.assertEqual(stats["status"], {"503": 1, "502": 1, "200": 1})
+        self.assertGreater(stats["latency_avg"], 0)
+        self.assertGreaterEqual(stats["latency_max"], stats["latency_avg"])
+
+        client.reset_stats()
+        self.assertEqual(client.stats()["requests"], 0)
+
+    def test_retry_after_seconds(self):
+        client, _, sleep = self._serve((429, {}, {"Retry-After": "7"}), {"ok": 1})
+        client.get("/x")
+        sleep.assert_called_once_with(7.0)
+
+    def test_retry_after_http_date(self):
+        at = format_datetime(datetime.now(dt_timezone.utc) + timedelta(seconds=20), usegmt=True)
+        client, _, sleep = self._serve((429, {}, {"Retry-After": at}), {"ok": 1})
+        client.get("/x")
+        (delay,), _ = sleep.call_args
+        self.assertTrue(18 <= delay <= 20, delay)
+
+    def test_retry_after_capped(self):
+        client, _, sleep = self._serve((429, {}, {"Retry-After": "3600"}), {"ok": 1})
+        client.max_backoff = 5
+        client.get("/x")
+        sleep.assert_called_once_with(5)
+
+    def test_no_retry(self):
+        client, fake, sleep = self._serve((503, {}, {}), {"ok": 1})
+        with self.assertRaises(requests.HTTPError):
+            client.get("/x", max_retries=0)
+        self.assertEqual(len(fake.requests), 1)
+        sleep.assert_not_called()
+        stats = client.stats()
+        self.assertEqual((stats["requests"], stats["retries"], stats["errors"]), (1, 0, 1))
+
+    def test_not_retried_status(self):
+        client, fake, _ = self._serve((404, {}, {}))
+        with self.assertRaises(requests.HTTPError):
+            client.get("/x")
+        self.assertEqual(len(fake.requests), 1)
+        self.assertEqual(client.stats()["status"], {"404": 1})
+
+    def test_network_error(self):
+        client, fake, sleep = self._serve({"ok": 1})
+        fake.__exit__(None, None, None)  # 포트를 닫아 연결 거부
+        client.max_retries = 2
+        with self.assertRaises(requests.ConnectionError):
+            client.get("/x")
+        self.assertEqual(sleep.call_count, 2)
+        stats = client.stats()
+        self.assertEqual((stats["requests"], stats["retries"], stats["errors"]), (3, 2, 1))
+        self.assertEqual(stats["status"], {"error": 3})
+
+
+class TMDBResponseCacheTests(FakeTMDBMixin, TestCase):
+    """
+    TMDB 응답 디스크 캐시: 엔드포인트별 TTL, on/refresh/off 모드, evict() LRU
+    """
+
+    fake_routes = [(r"^/movie/changes$", lambda m, q: {"results": [], "page": 1, "total_pages": 1})]
+
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = TMDBResponseCache(os.path.join(tmp.name, "cache.sqlite3"), max_bytes=10_000)
+        for ctx in (
+            override_settings(TMDB_CACHE_ENABLED=True),
+            mock.patch.object(tmdb_cache, "_cache", self.cache),
+        ):
+            ctx.__enter__()
+            self.addCleanup(ctx.__exit__, None, None, None)
+
+    def test_ttl_rules(self):
+        self.assertEqual(ttl_for("/genre/movie/list"), 7 * DAY)
+        self.assertEqual(ttl_for("/movie/changes"), 0)
+        self.assertEqual(ttl_for("/movie/550/credits"), 7 * DAY)
+        self.assertEqual(ttl_for("/movie/550"), DAY)
+        self.assertEqual(ttl_for("/movie/popular"), 3600)
+        self.assertEqual(ttl_for("/discover/movie"), 3600)
+        self.assertEqual(ttl_for("/search/movie"), tmdb_cache.DEFAULT_TTL)
+
+    def test_get_set_and_expiry(self):
+        self.cache.set("/movie/1", {"language": "ko-KR", "api_key": "a"}, {"id": 1}, ttl=60)
+        # api_key/params 순서는 key에 영향 없음
+        self.assertEqual(self.cache.get("/movie/1", {"api_key": "b", "language": "ko-KR"}), {"id": 1})
+        self.assertIsNone(self.cache.get("/movie/1", {"language": "en-US"}))
+        with mock.patch.object(tmdb_cache.time, "time", return_value=time.time() + 61):
+            self.assertIsNone(self.cache.get("/movie/1", {"language": "ko-KR"}))
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 2})
+
+        self.cache.set("/movie/changes", {}, {"results": []}, ttl=0)  # TTL 0은 저장 안 함
+        self.assertIsNone(self.cache.get("/movie/changes", {}))
+
+    def test_modes(self):
+        tmdb._tmdb_get("/movie/1")
+        tmdb._tmdb_get("/movie/1")
+        self.assertEqual(len(self.tmdb.paths("/movie/1")), 1)  # on: 두 번째는 캐시
+
+        with cache_mode("refresh"):
+            tmdb._tmdb_get("/movie/1")
+        self.assertEqual(len(self.tmdb.paths("/movie/1")), 2)  # refresh: 읽지 않고 새로 받음
+
+        with cache_mode("off"):
+            tmdb._tmdb_get("/movie/2")
+        tmdb._tmdb_get("/movie/2")
+        self.assertEqual(len(self.tmdb.paths("/movie/2")), 2)  # off: 쓰지도 않음
+
+        tmdb._tmdb_get("/movie/changes")
+        tmdb._tmdb_get("/movie/changes")
+        self.assertEqual(len(self.tmdb.paths("/movie/changes")), 2)  # TTL 0 경로는 항상 요청
+        self.assertEqual(tmdb_cache.get_mode(), "on")
+
+    def test_evict_lru(self):
+        body = {"blob": os.urandom(1500).hex()}
+        started = time.time()
+        clock = mock.patch.object(tmdb_cache.time, "time").start()
+        self.addCleanup(mock.patch.stopall)
+        for i in range(4):
+            clock.return_value = started + i
+            self.cache.set(f"/movie/{i}", {}, body, ttl=DAY)
+        # 0번을 나중에 다시 읽음 → 가장 최근 사용
+        clock.return_value = started + 1000
+        self.assertIsNotNone(self.cache.get("/movie/0", {}))
+
+        size = self.cache._conn().execute("SELECT MAX(size) FROM tmdb_cache").fetchone()[0]
+        self.cache.max_bytes = int(size * 2.5)  # 4개 → 90%(2.25개) 이하로: 가장 오래 안 쓴 1, 2번 삭제
+        self.assertEqual(self.cache.evict(), 2)
+        kept = [i for i in range(4) if self.cache.get(f"/movie/{i}", {}) is not None]
+        self.assertEqual(kept, [0, 3])
+        self.assertEqual(self.cache.evict(), 0)  # 이미 max_bytes 이하
+
+        clock.return_value = started + 2 * DAY  # 만료된 항목은 용량과 상관없이 삭제
+        self.cache.evict()
+        self.assertEqual(self.cache._conn().execute("SELECT COUNT(*) FROM tmdb_cache").fetchone()[0], 0)
+
+
+def fake_changes(match, query):
+    # 창(start_date)마다 2페이지, 페이지마다 id 2개 (+ adult 1개는 제외 대상)
+    start = date.fromisoformat(query["start_date"])
+    page = int(query.get("page", 1))
+    base = start.toordinal() % 1000 * 10 + page * 2
+    return {
+        "page": page,
+        "total_pages": 2,
+        "results": [{"id": base, "adult": False}, {"id": base + 1, "adult": False}, {"id": 999999, "adult": True}],
+    }
+
+
+class ChangesFeedTests(FakeTMDBMixin, TestCase):
+    """
+    변경 피드 증분 동기화: 14일 단위 창 분할 + 페이지 순회, DB에 있는 영화만 갱신
+    """
+
+    fake_routes = [(r"^/movie/changes$", fake_changes)]
+
+    def test_window_split_and_pagination(self):
+        ids = fetch_changed_movie_ids(date(2024, 1, 1), date(2024, 1, 31))
+        windows = [(q["start_date"], q["end_date"]) for path, q, _ in self.tmdb.requests if path == "/movie/changes"]
+        self.assertEqual(
+            windows,
+            [
+                ("2024-01-01", "2024-01-14"), ("2024-01-01", "2024-01-14"),
+                ("2024-01-15", "2024-01-28"), ("2024-01-15", "2024-01-28"),
+                ("2024-01-29", "2024-01-31"), ("2024-01-29", "2024-01-31"),
+            ],
+        )
+        pages = [q["page"] for path, q, _ in self.tmdb.requests if path == "/movie/changes"]
+        self.assertEqual(pages, ["1", "2"] * 3)
+        self.assertEqual(len(ids), 12)  # 창 3개 × 페이지 2개 × 2편, adult 제외
+        self.assertNotIn(999999, ids)
+
+        self.tmdb.requests.clear()
+        fetch_changed_movie_ids(date(2024, 1, 1), date(2024, 1, 1))  # 하루짜리도 창 1개
+        self.assertEqual(len(self.tmdb.paths("/movie/changes")), 2)
+
+    def test_sync_counts(self):
+        ids = sorted(fetch_changed_movie_ids(date(2024, 1, 1), date(2024, 1, 14)))
+        self.assertEqual(len(ids), 4)
+        for tmdb_id in ids[:3]:
+            Movie.objects.create(tmdb_id=tmdb_id, title="old")
+        failing = ids[2]
+        self.tmdb.routes.insert(0, (re.compile(rf"^/movie/{failing}$"), lambda m, q: (404, {}, {})))
+
+        with self.assertLogs(tmdb.logger, "WARNING") as logs:
+            result = sync_changed_movies(date(2024, 1, 1), date(2024, 1, 14), chunk_size=2)
+        self.assertEqual(result, {"changed": 4, "updated": 2, "skipped": 1, "failed": 1})
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn(f"detail fetch failed (movie {failing})", logs.output[0])
+        self.assertEqual(Movie.objects.filter(title__startswith="movie ").count(), 2)
+        self.assertEqual(Movie.objects.get(tmdb_id=failing).title, "old")
+        self.assertFalse(Movie.objects.filter(tmdb_id=ids[3]).exists())  # 미보유 영화는 새로 만들지 않음
+        self.assertNotIn(f"/movie/{ids[3]}", self.tmdb.paths("/movie/"))
+
+
+class BulkSyncResumeTests(FakeTMDBMixin, TransactionTestCase):
+    """
+    sync_tmdb_bulk: k페이지에서 실패해도 k 미만 페이지는 커밋된 상태로 남고, --resume은 k페이지부터 이어감
+    """
+
+    def test_failure_then_resume(self):
+        real_get = tmdb._tmdb_get
+        fail = {"page": 3}
+
+        def flaky_get(path, params=None, **kwargs):
+            if path == "/discover/movie" and params["page"] == fail["page"]:
+                fail["page"] = None  # 한 번만 실패
+                raise requests.ConnectionError("boom")
+            return real_get(path, params, **kwargs)
+
+        out = StringIO()
+        with mock.patch.object(tmdb, "_tmdb_get", flaky_get):
+            with self.assertRaisesMessage(CommandError, "2페이지까지 반영 후 실패"):
+                call_command("sync_tmdb_bulk", pages=5, sleep=0, stdout=out)
+
+            run = SyncRun.objects.get()
+            self.assertEqual((run.status, run.last_page, run.total), ("FAILED", 2, 40))
+            self.assertIn("boom", run.last_error)
+            # 1~2페이지는 커밋됨 (이 테스트는 트랜잭션으로 감싸지 않음)
+            self.assertEqual(Movie.objects.count(), 40)
+            self.assertEqual(Movie.objects.filter(genres__tmdb_id=28).count(), 40)
+
+            self.tmdb.requests.clear()
+            call_command("sync_tmdb_bulk", pages=5, sleep=0, resume=True, stdout=out)
+
+        pages = [q["page"] for path, q, _ in self.tmdb.requests if path == "/discover/movie"]
+        self.assertEqual(pages, ["3", "4", "5"])
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.last_page, run.total), ("DONE", 5, 100))
+        self.assertIsNotNone(run.finished_at)
+        self.assertEqual(SyncRun.objects.count(), 1)
+        self.assertEqual(Movie.objects.count(), 100)
+        self.assertIn(f"실행 #{run.pk} 재개: 3페이지부터", out.getvalue())
+
+
+class MovieEnrichmentTests(FakeTMDBMixin, TestCase):
+    """
+    fetch_movie_enrichment: append_to_response=credits로 요청 1번, detail+credits는 한 트랜잭션으로 반영
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.movie = Movie.objects.create(tmdb_id=7, title="old")
+
+    def test_single_request(self):
+        fetch_movie_enrichment(self.movie)
+        self.assertEqual(len(self.tmdb.requests), 1)
+        path, query, _ = self.tmdb.requests[0]
+        self.assertEqual((path, query["append_to_response"]), ("/movie/7", "credits"))
+
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.title, self.movie.runtime), ("movie 7", 100))
+        self.assertIsNotNone(self.movie.enriched_at)
+        self.assertEqual(MovieCredit.objects.filter(movie=self.movie).count(), 3)
+
+    def test_single_transaction(self):
+        with mock.patch.object(tmdb, "apply_movie_credits", side_effect=RuntimeError("credits")):
+            with self.assertRaises(RuntimeError):
+                fetch_movie_enrichment(self.movie)
+        # credits 반영이 실패하면 detail 반영도 함께 롤백
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.title, self.movie.runtime, self.movie.enriched_at), ("old", None, None))
+        self.assertFalse(Genre.objects.exists())
+
+    def test_inline_timeout_does_not_retry(self):
+        self.tmdb.routes.insert(0, (re.compile(r"^/movie/7$"), lambda m, q: (503, {}, {})))
+        with self.assertRaises(requests.HTTPError):
+            fetch_movie_enrichment(self.movie, timeout=1)
+        self.assertEqual(len(self.tmdb.requests), 1)
+
+
+class MovieCreditsDiffTests(TestCase):
+    """
+    apply_movie_credits: 기존 크레딧과 비교해서 바뀐 것만 쓰기, 변경 없으면 조회 1번
+    """
+
+    def setUp(self):
+        self.movie = Movie.objects.create(tmdb_id=1, title="movie")
+        self.credits = {
+            "cast": [
+                {"id": 10, "name": "A", "character": "hero", "order": 0},
+                {"id": 11, "name": "B", "character": "villain", "order": 1},
+            ],
+            "crew": [{"id": 20, "name": "D", "job": "Director"}, {"id": 21, "name": "W", "job": "Writer"}],
+        }
+        apply_movie_credits(self.movie, self.credits)
+
+    def _rows(self):
+        return {
+            (c.person.tmdb_id, c.role_type): (c.pk, c.character_name, c.order)
+            for c in MovieCredit.objects.filter(movie=self.movie).select_related("person")
+        }
+
+    def test_initial(self):
+        rows = self._rows()
+        self.assertEqual(set(rows), {(10, "CAST"), (11, "CAST"), (20, "DIRECTOR")})  # 감독 외 crew는 저장 안 함
+        self.assertEqual(rows[(11, "CAST")][1:], ("villain", 1))
+
+    def test_unchanged_single_select(self):
+        with CaptureQueriesContext(connection) as ctx:
+            apply_movie_credits(self.movie, self.credits)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertTrue(ctx.captured_queries[0]["sql"].startswith("SELECT"))
+
+    def test_role_change(self):
+        before = self._rows()
+        self.credits["cast"][1]["character"] = "anti-hero"
+        self.credits["cast"][1]["order"] = 5
+        apply_movie_credits(self.movie, self.credits)
+        after = self._rows()
+        self.assertEqual(after[(11, "CAST")], (before[(11, "CAST")][0], "anti-hero", 5))  # 같은 행 update
+        self.assertEqual(after[(10, "CAST")], before[(10, "CAST")])
+
+    def test_removed_cast_member(self):
+        self.credits["cast"].pop(1)
+        apply_movie_credits(self.movie, self.credits)
+        self.assertEqual(set(self._rows()), {(10, "CAST"), (20, "DIRECTOR")})
+        self.assertTrue(Person.objects.filter(tmdb_id=11).exists())  # 인물은 남김
+
+    def test_director_also_in_cast(self):
+        self.credits["cast"].append({"id": 20, "name": "D", "character": "cameo", "order": 2})
+        apply_movie_credits(self.movie, self.credits)
+        rows = self._rows()
+        self.assertIn((20, "DIRECTOR"), rows)
+        self.assertEqual(rows[(20, "CAST")][1], "cameo")
+        self.assertEqual(Person.objects.filter(tmdb_id=20).count(), 1)
+
+        # 두 역할 모두 그대로면 다시 쓰지 않음
+        with CaptureQueriesContext(connection) as ctx:
+            apply_movie_credits(self.movie, self.credits)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_person_fields_update(self):
+        before = self._rows()
+        self.credits["cast"][0].update(name="A2", profile_path="/a.jpg")
+        apply_movie_credits(self.movie, self.credits)
+        person = Person.objects.get(tmdb_id=10)
+        self.assertEqual((person.name, person.profile_path), ("A2", "/a.jpg"))
+        self.assertEqual(Person.objects.count(), 3)
+        self.assertEqual(self._rows(), before)  # 크레딧 행은 그대로
+        self.assertEqual(search_person_ids("A2"), [person.pk])  # 검색 색인도 갱신
+
+    def test_cast_limit(self):
+        apply_movie_credits(self.movie, self.credits, cast_limit=1)
+        self.assertEqual(set(self._rows()), {(10, "CAST"), (20, "DIRECTOR")})
+
+
+class HomeSectionSwapTests(FakeTMDBMixin, TestCase):
+    """
+    홈 섹션 version 교체: 새 순위를 다 넣을 때까지 home은 이전 version, 교체 후 새 version
+    - HomeSection 행이 없던 시절(version=0) 데이터도 그대로 노출
+    """
+
+    fake_routes = [
+        (r"^/movie/popular$", lambda m, q: {"page": 1, "total_pages": 1, "results": [fake_movie(i) for i in (3, 2, 1)]}),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        response_cache._memo.clear()
+        self.client = APIClient()
+
+    def _popular(self):
+        return [m["tmdb_id"] for m in self.client.get("/api/movies/home/").json()["popular"]]
+
+    def test_legacy_version_zero(self):
+        for rank, tmdb_id in enumerate((9, 8), start=1):
+            HomeSectionEntry.objects.create(section="POPULAR", movie=Movie.objects.create(tmdb_id=tmdb_id, title="m"), rank=rank)
+        self.assertFalse(HomeSection.objects.exists())
+        self.assertEqual(self._popular(), [9, 8])
+
+    def test_old_version_until_swap(self):
+        old = [Movie.objects.create(tmdb_id=tmdb_id, title="old") for tmdb_id in (9, 8)]
+        swap_home_section("POPULAR", old)
+        self.assertEqual(self._popular(), [9, 8])
+
+        real_swap = tmdb.swap_home_section
+        seen = {}
+
+        def spy(code, movies):
+            # 영화/크레딧은 이미 반영됐지만 포인터 교체 전 → 여전히 이전 순위
+            seen["before"] = self._popular()
+            seen["movies"] = Movie.objects.filter(tmdb_id__in=[1, 2, 3], runtime=100).count()
+            return real_swap(code, movies)
+
+        with mock.patch.object(tmdb, "swap_home_section", spy):
+            sync_home_section("POPULAR", "/movie/popular", with_detail=True, with_credits=True)
+
+        self.assertEqual(seen, {"before": [9, 8], "movies": 3})
+        self.assertEqual(self._popular(), [3, 2, 1])
+        self.assertEqual(HomeSection.objects.get(code="POPULAR").active_version, 2)
+
+        # 직전 version(1)은 한 세대 남기고 그보다 오래된 것만 삭제
+        swap_home_section("POPULAR", old[:1])
+        versions = set(HomeSectionEntry.objects.filter(section="POPULAR").values_list("version", flat=True))
+        self.assertEqual(versions, {2, 3})
+        self.assertEqual(self._popular(), [9])
+
+
+class EnsureMovieEnrichedTests(FakeTMDBMixin, TestCase):
+    """
+    상세 페이지 보강 정책: fresh는 그대로, stale은 작업만 등록(중복 등록은 쓰기 없이), 없으면 인라인 1회
+    - 보강 요청은 디스크 응답 캐시를 읽지 않음 (enriched_at이 캐시된 옛 응답으로 찍히지 않게)
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.movie = Movie.objects.create(tmdb_id=7, title="old")
+
+    def _set_enriched(self, age):
+        Movie.objects.filter(pk=self.movie.pk).update(enriched_at=timezone.now() - timedelta(seconds=age))
+        self.movie.refresh_from_db()
+
+    def test_fresh(self):
+        self._set_enriched(60)
+        self.assertEqual(ensure_movie_enriched(self.movie, has_credits=True), "fresh")
+        self.assertEqual(self.tmdb.requests, [])
+        self.assertFalse(EnrichmentJob.objects.exists())
+
+    def test_stale_enqueues_once(self):
+        self._set_enriched(settings.TMDB_ENRICH_TTL + 60)
+        self.assertEqual(ensure_movie_enriched(self.movie, has_credits=True), "stale")
+        job = EnrichmentJob.objects.get()
+        self.assertEqual((job.kind, job.tmdb_id, job.status), ("ENRICH", 7, "PENDING"))
+        self.assertEqual(self.tmdb.requests, [])
+
+        # 이미 대기 중이면 exists() 조회 1번, 쓰기 없음
+        with self.assertNumQueries(1):
+            self.assertEqual(ensure_movie_enriched(self.movie, has_credits=True), "stale")
+        EnrichmentJob.objects.update(status="RUNNING")
+        with self.assertNumQueries(1):
+            ensure_movie_enriched(self.movie, has_credits=True)
+
+        # 끝난 작업은 다시 대기로
+        EnrichmentJob.objects.update(status="DONE", attempts=2)
+        ensure_movie_enriched(self.movie, has_credits=True)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("PENDING", 0))
+
+    def test_missing_fetched_inline(self):
+        self.assertEqual(ensure_movie_enriched(self.movie, has_credits=False), "fetched")
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.runtime, 100)
+        self.assertFalse(EnrichmentJob.objects.exists())
+
+    def test_inline_failure_enqueues(self):
+        self.tmdb.routes.insert(0, (re.compile(r"^/movie/7$"), lambda m, q: (503, {}, {})))
+        self.assertEqual(ensure_movie_enriched(self.movie, has_credits=False), "failed")
+        self.assertEqual(len(self.tmdb.requests), 1)  # 인라인은 재시도 없음
+        self.assertTrue(EnrichmentJob.objects.filter(kind="ENRICH", tmdb_id=7, status="PENDING").exists())
+
+    def test_enrichment_bypasses_response_cache(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        disk_cache = TMDBResponseCache(os.path.join(tmp.name, "cache.sqlite3"))
+        for ctx in (override_settings(TMDB_CACHE_ENABLED=True), mock.patch.object(tmdb_cache, "_cache", disk_cache)):
+            ctx.__enter__()
+            self.addCleanup(ctx.__exit__, None, None, None)
+
+        params = {"language": "ko-KR", "append_to_response": "credits"}
+        disk_cache.set("/movie/7", params, {"id": 7, "title": "cached", "runtime": 1}, ttl=DAY)
+        self.assertEqual(tmdb._tmdb_get("/movie/7", {"append_to_response": "credits"})["title"], "cached")
+
+        fetch_movie_enrichment(self.movie)
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.title, self.movie.runtime), ("movie 7", 100))
+        self.assertEqual(len(self.tmdb.requests), 1)
+        # 새로 받은 응답으로 캐시도 갱신
+        self.assertEqual(disk_cache.get("/movie/7", params)["title"], "movie 7")
+
+        # 워커가 처리하는 ENRICH 작업도 캐시를 읽지 않음
+        disk_cache.set("/movie/7", params, {"id": 7, "title": "cached", "runtime": 1}, ttl=DAY)
+        enqueue_job("ENRICH", 7)
+        run_enrichment_jobs(claim_jobs("test"))
+        self.assertEqual(len(self.tmdb.requests), 2)
+        self.assertEqual(EnrichmentJob.objects.get().status, "DONE")
+
+
+class EnrichmentJobQueueTests(TestCase):
+    """
+    작업 큐: 워커 간 점유 배타성(compare-and-swap), lease 만료 후 재점유, 백오프 후 FAILED, (kind, tmdb_id) 중복 제거
+    """
+
+    def setUp(self):
+        self.now = timezone.now()
+        clock = mock.patch.object(timezone, "now", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tick(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+    def test_claim_exclusive(self):
+        enqueue_jobs("ENRICH", range(1, 6))
+        first = claim_jobs("w1", limit=3)
+        second = claim_jobs("w2", limit=3)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        self.assertFalse({j.pk for j in first} & {j.pk for j in second})
+        self.assertEqual(claim_jobs("w3"), [])
+        self.assertTrue(all(j.status == "RUNNING" and j.attempts == 1 for j in first + second))
+
+    def test_claim_race(self):
+        # w1이 후보를 고른 뒤 UPDATE 하기 직전에 w2가 같은 후보를 먼저 점유 → w1은 빈손
+        enqueue_jobs("ENRICH", [1, 2])
+        real_claimable = jobs._claimable
+        calls, stolen = [], []
+
+        def racing(now):
+            calls.append(now)
+            if len(calls) == 2:
+                stolen.extend(claim_jobs("w2"))
+            return real_claimable(now)
+
+        with mock.patch.object(jobs, "_claimable", racing):
+            mine = claim_jobs("w1")
+        self.assertEqual(mine, [])
+        self.assertEqual(len(stolen), 2)
+        self.assertEqual(EnrichmentJob.objects.filter(locked_by__startswith="w2:").count(), 2)
+
+    def test_lease_expiry_reclaim(self):
+        enqueue_job("ENRICH", 1)
+        (job,) = claim_jobs("w1", lease=60)
+        self.tick(30)
+        self.assertEqual(claim_jobs("w2"), [])  # lease 유효
+        self.tick(31)
+        (again,) = claim_jobs("w2")  # w1이 죽은 것으로 보고 다시 가져감
+        self.assertEqual((again.pk, again.attempts), (job.pk, 2))
+
+        complete_job(job)  # lease를 잃은 w1의 완료 보고는 무시
+        again.refresh_from_db()
+        self.assertEqual(again.status, "RUNNING")
+        self.assertTrue(again.locked_by.startswith("w2:"))
+        complete_job(again)
+        again.refresh_from_db()
+        self.assertEqual(again.status, "DONE")
+
+    def test_backoff_then_failed(self):
+        enqueue_job("ENRICH", 1)
+        EnrichmentJob.objects.update(max_attempts=3)
+        for attempt, delay in ((1, JOB_BACKOFF_BASE), (2, JOB_BACKOFF_BASE * 2)):
+            (job,) = claim_jobs("w1")
+            self.assertEqual(job.attempts, attempt)
+            fail_job(job, RuntimeError("boom"))
+            job.refresh_from_db()
+            self.assertEqual(job.status, "PENDING")
+            wait = (job.run_after - self.now).total_seconds()
+            self.assertTrue(delay <= wait <= delay * 1.5, wait)
+            self.assertIn("boom", job.last_error)
+            self.tick(delay - 1)
+            self.assertEqual(claim_jobs("w1"), [])  # 백오프 중
+            self.tick(delay)
+
+        (job,) = claim_jobs("w1")
+        fail_job(job, RuntimeError("boom"))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("FAILED", 3))
+        self.tick(JOB_BACKOFF_MAX)
+        self.assertEqual(claim_jobs("w1"), [])
+
+    def test_no_retry(self):
+        enqueue_job("ENRICH", 1)
+        (job,) = claim_jobs("w1")
+        fail_job(job, LookupError("gone"), retry=False)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("FAILED", 1))
+
+    def test_expired_lease_without_attempts_left(self):
+        enqueue_job("ENRICH", 1)
+        EnrichmentJob.objects.update(max_attempts=1)
+        (job,) = claim_jobs("w1", lease=60)
+        self.tick(61)
+        self.assertEqual(claim_jobs("w2"), [])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.last_error), ("FAILED", "lease expired"))
+
+    def test_enqueue_dedup_and_requeue(self):
+        enqueue_jobs("ENRICH", [1, 2, 2])
+        enqueue_jobs("IMAGES", [1])
+        self.assertEqual(EnrichmentJob.objects.count(), 3)
+
+        (job,) = [j for j in claim_jobs("w1") if j.kind == "ENRICH" and j.tmdb_id == 1]
+        complete_job(job)
+        EnrichmentJob.objects.filter(kind="ENRICH", tmdb_id=2).update(status="FAILED", attempts=5, last_error="x")
+        self.tick(10)
+        enqueue_jobs("ENRICH", [1, 2], delay=30)
+        self.assertEqual(EnrichmentJob.objects.count(), 3)
+        for job in EnrichmentJob.objects.filter(kind="ENRICH"):
+            self.assertEqual((job.status, job.attempts, job.last_error), ("PENDING", 0, ""))
+            self.assertEqual(job.run_after, self.now + timedelta(seconds=30))
+
+        # 대기/실행 중인 작업은 그대로 (run_after를 미루지 않음)
+        image = EnrichmentJob.objects.get(kind="IMAGES")
+        enqueue_jobs("IMAGES", [1], delay=600)
+        self.assertEqual(EnrichmentJob.objects.get(kind="IMAGES").run_after, image.run_after)
+
+
+class SingleFlightTests(TestCase):
+    """
+    single_flight: 같은 프로세스는 스레드 간 결과 공유, 다른 프로세스는 FetchLease로 한 곳만 실행
+    """
+
+    def _run_threads(self, fn, count=5, wait=5.0):
+        # 첫 스레드가 fn 안에 들어간 뒤 나머지를 시작 → 나머지는 모두 그 결과를 기다림
+        results = []
+
+        def call():
+            try:
+                results.append(single_flight("k", fn, wait=wait))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        threads[0].start()
+        self.assertTrue(self.entered.wait(2))
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.1)
+        self.release.set()
+        for t in threads:
+            t.join(2)
+        return results
+
+    def _in_process(self):
+        # 스레드에서는 DB를 쓰지 않도록 프로세스 간 lease는 항상 획득한 것으로
+        self.entered, self.release = threading.Event(), threading.Event()
+        for ctx in (
+            mock.patch.object(singleflight, "acquire_lease", return_value=True),
+            mock.patch.object(singleflight, "release_lease"),
+        ):
+            ctx.start()
+            self.addCleanup(ctx.stop)
+
+    def test_coalesces_threads(self):
+        self._in_process()
+        calls = []
+
+        def fn():
+            calls.append(threading.get_ident())
+            self.entered.set()
+            self.release.wait(2)
+            return {"value": 1}
+
+        results = self._run_threads(fn)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"value": 1}] * 5)
+        self.assertEqual(singleflight._flights, {})
+
+        # 끝난 뒤 다시 부르면 새로 실행
+        self.entered.clear()
+        single_flight("k", fn)
+        self.assertEqual(len(calls), 2)
+
+    def test_error_shared(self):
+        self._in_process()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            self.entered.set()
+            self.release.wait(2)
+            raise RuntimeError("boom")
+
+        results = self._run_threads(fn, count=3)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([str(r) for r in results], ["boom"] * 3)
+
+    def test_follower_timeout(self):
+        self._in_process()
+
+        def fn():
+            self.entered.set()
+            self.release.wait(2)
+
+        results = self._run_threads(fn, count=2, wait=0.05)
+        self.assertIsInstance(results[0], SingleFlightTimeout)  # 먼저 끝나는 쪽이 기다리던 스레드
+
+    def test_other_process_holds_lease(self):
+        FetchLease.objects.create(key="k", holder="other-host:1:abcd", expires_at=timezone.now() + timedelta(seconds=30))
+        fn = mock.Mock(return_value="mine")
+        polls = []
+
+        def other_process_finishes(seconds):
+            polls.append(seconds)
+            if len(polls) == 2:
+                FetchLease.objects.filter(key="k").delete()
+
+        with mock.patch.object(singleflight.time, "sleep", other_process_finishes):
+            self.assertIsNone(single_flight("k", fn, wait=5))  # 결과는 DB에서 다시 읽으라는 뜻
+        fn.assert_not_called()
+        self.assertEqual(polls, [singleflight.LEASE_POLL_INTERVAL] * 2)
+
+    def test_expired_lease_takeover(self):
+        FetchLease.objects.create(key="k", holder="dead-host:1:abcd", expires_at=timezone.now() - timedelta(seconds=1))
+        holders = []
+
+        def fn():
+            holders.append(FetchLease.objects.get(key="k").holder)
+            return "mine"
+
+        self.assertEqual(single_flight("k", fn), "mine")
+        self.assertNotEqual(holders, ["dead-host:1:abcd"])
+        self.assertFalse(FetchLease.objects.filter(key="k").exists())  # 끝나면 해제
+
+    def test_timeout_waiting_for_other_process(self):
+        FetchLease.objects.create(key="k", holder="other-host:1:abcd", expires_at=timezone.now() + timedelta(seconds=30))
+        fn = mock.Mock()
+        started = time.monotonic()
+        with self.assertRaises(SingleFlightTimeout):
+            single_flight("k", fn, wait=0.3)
+        self.assertLess(time.monotonic() - started, 1)
+        fn.assert_not_called()
+        self.assertEqual(singleflight._flights, {})
+
+    def test_lease_released_on_error(self):
+        with self.assertRaises(RuntimeError):
+            single_flight("k", mock.Mock(side_effect=RuntimeError("boom")))
+        self.assertFalse(FetchLease.objects.exists())
+
+
+class GenreRegistryTests(TestCase):
+    """
+    GenreRegistry: 장르 master를 1번만 읽어서 영화마다 Genre 조회를 하지 않음, upsert_genres가 바꾸면 다시 로드
+    """
+
+    def setUp(self):
+        self.action = Genre.objects.create(tmdb_id=28, name="Action")
+        self.drama = Genre.objects.create(tmdb_id=18, name="Drama")
+        tmdb.genre_registry.invalidate()
+        self.addCleanup(tmdb.genre_registry.invalidate)
+
+    @staticmethod
+    def _genre_queries(ctx):
+        return [q["sql"] for q in ctx.captured_queries if '"movies_genre"' in q["sql"]]
+
+    def test_no_per_movie_genre_queries(self):
+        tmdb.genre_registry.load()
+        results = [fake_movie(i, genre_ids=[28, 18] if i % 2 else [18]) for i in range(1, 21)]
+        with CaptureQueriesContext(connection) as ctx:
+            movies, changed = tmdb.upsert_movie_page(results)
+            for movie in movies[:5]:
+                tmdb.apply_movie_detail(movie, {**results[0], "runtime": 90, "genres": [{"id": 28, "name": "Action"}]})
+        self.assertEqual(changed, 20)
+        self.assertEqual(self._genre_queries(ctx), [])
+        # 홀수 10편 + detail로 Action만 남은 1~5번 중 짝수 2편 / Drama는 1~5번에서 빠짐
+        self.assertEqual(MovieGenre.objects.filter(genre=self.action).count(), 12)
+        self.assertEqual(MovieGenre.objects.filter(genre=self.drama).count(), 15)
+
+    def test_upsert_genres_invalidates(self):
+        self.assertEqual(tmdb.genre_registry.pk_map([28, 99]), {28: self.action.pk})
+
+        with self.assertNumQueries(0):  # 그대로면 쓰기 없음
+            tmdb.upsert_genres([{"id": 28, "name": "Action"}, {"id": 18, "name": "Drama"}])
+
+        tmdb.upsert_genres([{"id": 99, "name": "Documentary"}, {"id": 18, "name": "드라마"}])
+        self.assertEqual(tmdb.genre_registry.pk_map([99]), {99: Genre.objects.get(tmdb_id=99).pk})
+        self.assertEqual(tmdb.genre_registry.changed([{"id": 18, "name": "드라마"}]), [])
+        self.assertEqual(Genre.objects.get(tmdb_id=18).name, "드라마")
+
+    def test_unknown_id_reload_throttled(self):
+        tmdb.genre_registry.load()
+        other = Genre.objects.create(tmdb_id=99, name="Documentary")  # 다른 프로세스가 추가
+        with self.assertNumQueries(0):
+            self.assertEqual(tmdb.genre_registry.pk_map([99]), {})  # RELOAD_INTERVAL 안에는 다시 읽지 않음
+
+        later = time.monotonic() + GenreRegistry.RELOAD_INTERVAL + 1
+        with mock.patch.object(tmdb.time, "monotonic", return_value=later), self.assertNumQueries(1):
+            self.assertEqual(tmdb.genre_registry.pk_map([99]), {99: other.pk})
+
+
+class IngestProfilerTests(FakeTMDBMixin, TestCase):
+    """
+    IngestProfiler: 중첩 단계는 self time으로, 쿼리는 실행 중인 가장 안쪽 단계에 집계
+    """
+
+    fake_routes = [
+        (
+            r"^/movie/(popular|now_playing|top_rated)$",
+            lambda m, q: {"page": 1, "total_pages": 1, "results": [fake_movie(i) for i in range(1, 4)]},
+        ),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.now = 0.0
+        clock = mock.patch.object(profiling.time, "perf_counter", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_stage_self_time(self):
+        profiler = IngestProfiler()
+        with profiling.profiling(profiler):
+            with profiling.stage("upsert"):
+                self.now += 1.0
+                with profiling.stage("genres"):
+                    self.now += 2.0
+                    with profiling.stage("genres"):  # 같은 이름 재진입도 안쪽만큼 빠짐
+                        self.now += 0.5
+                self.now += 0.25
+            with profiling.stage("http"):
+                self.now += 4.0
+        report = profiler.as_dict()
+        self.assertEqual(report["elapsed"], 7.75)
+        self.assertEqual(
+            {name: (s["calls"], s["seconds"]) for name, s in report["stages"].items()},
+            {"http": (1, 4.0), "upsert": (1, 1.25), "genres": (2, 2.5)},
+        )
+        self.assertEqual(list(report["stages"]), ["http", "upsert", "genres"])  # STAGE_ORDER 순서
+        self.assertIsNone(profiling._profiler)  # 블록이 끝나면 꺼짐
+
+    def test_query_attribution(self):
+        profiler = IngestProfiler()
+
+        @profiling.profiled("detail")
+        def detail():
+            Movie.objects.count()
+            with profiling.stage("credits"):
+                Movie.objects.count()
+                Person.objects.count()
+
+        with profiling.profiling(profiler):
+            Movie.objects.count()
+            detail()
+            profiling.count_rows("movie", inserted=2, unchanged=1)
+            profiling.count_rows("movie", updated=1)
+        Movie.objects.count()  # profiling 밖: 집계 안 함
+
+        report = profiler.as_dict()
+        self.assertEqual(
+            {name: s["queries"] for name, s in report["stages"].items()},
+            {"detail": 1, "credits": 2, "other": 1},
+        )
+        self.assertEqual(report["queries"], 4)
+        self.assertEqual(report["rows"], {"movie": {"inserted": 2, "unchanged": 1, "updated": 1}})
+
+        with profiling.stage("upsert"):  # profiler가 꺼져 있으면 아무것도 안 함
+            Movie.objects.count()
+        self.assertEqual(profiler.as_dict()["queries"], 4)
+
+    def test_command_profile_output(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "profile.json")
+        out = StringIO()
+        call_command("sync_tmdb_home", no_credits=True, profile_json=path, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("프로파일", output)
+        self.assertIn("HTTP: 요청 4건", output)  # 장르 1 + 섹션 3
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertEqual(report["http"]["requests"], 4)
+        self.assertEqual(report["stages"]["http"]["calls"], 4)
+        self.assertEqual(report["rows"]["movie"], {"inserted": 3, "unchanged": 6})
+        self.assertEqual(report["stages"]["swap"]["calls"], 3)
+
+
+class ImportTMDBExportTests(FakeTMDBMixin, TestCase):
+    """
+    import_tmdb_export: gzip NDJSON을 스트리밍으로 읽어서 없는 영화만 등록, 보강은 작업 큐(또는 --inline)
+    """
+
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "movie_ids_01_01_2024.json.gz")
+        lines = [
+            {"adult": False, "id": 1, "original_title": "Existing", "popularity": 5.0, "video": False},
+            {"adult": False, "id": 2, "original_title": "새 영화", "popularity": 3.5, "video": False},
+            {"adult": True, "id": 3, "original_title": "Adult", "popularity": 9.0, "video": False},
+            {"adult": False, "id": 4, "original_title": "Video", "popularity": 1.0, "video": True},
+            {"adult": False, "id": 5, "original_title": "Low", "popularity": 0.1, "video": False},
+            {"adult": False, "id": 6, "original_title": "Six", "popularity": 2.0, "video": False},
+            {"adult": False, "id": 7, "original_title": "Seven", "popularity": 1.5, "video": False},
+        ]
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for item in lines:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f.write("not json\n\n")
+            f.write('{"original_title": "no id"}\n')
+        Movie.objects.create(tmdb_id=1, title="Existing")
+
+    def test_counts_and_jobs(self):
+        progress = []
+        stats = import_tmdb_export(self.path, chunk_size=3, min_popularity=0.5, progress=lambda s: progress.append(dict(s)))
+        self.assertEqual(
+            dict(stats),
+            {"read": 9, "invalid": 2, "filtered": 3, "existing": 1, "created": 3},
+        )
+        self.assertEqual(len(progress), 2)  # 유효한 4줄 → chunk 2개
+        movie = Movie.objects.get(tmdb_id=2)
+        self.assertEqual((movie.title, movie.original_title, movie.popularity), ("새 영화", "새 영화", 3.5))
+        self.assertEqual(search_movie_ids("새 영화"), [movie.pk])  # 검색 색인도 같이
+        self.assertEqual(
+            sorted(EnrichmentJob.objects.values_list("kind", "tmdb_id", "status")),
+            [("DETAIL", 2, "PENDING"), ("DETAIL", 6, "PENDING"), ("DETAIL", 7, "PENDING")],
+        )
+        self.assertEqual(self.tmdb.requests, [])  # 큐 모드는 네트워크 없음
+
+        # 다시 돌리면 전부 기존 영화
+        stats = import_tmdb_export(self.path, min_popularity=0.5, with_credits=True)
+        self.assertEqual((stats["existing"], stats["created"]), (4, 0))
+        self.assertEqual(EnrichmentJob.objects.count(), 3)
+
+    def test_limit_adult_and_credits(self):
+        stats = import_tmdb_export(self.path, chunk_size=2, limit=2, include_adult=True, with_credits=True)
+        self.assertEqual((stats["filtered"], stats["created"]), (1, 2))  # video만 제외, 2개에서 멈춤
+        self.assertEqual(sorted(Movie.objects.values_list("tmdb_id", flat=True)), [1, 2, 3])
+        self.assertEqual(sorted(EnrichmentJob.objects.values_list("kind", "tmdb_id")), [("ENRICH", 2), ("ENRICH", 3)])
+
+    def test_inline(self):
+        stats = import_tmdb_export(self.path, min_popularity=0.5, with_credits=True, inline=True)
+        self.assertEqual((stats["created"], stats["enriched"]), (3, 3))
+        self.assertFalse(EnrichmentJob.objects.exists())
+        self.assertEqual(sorted(self.tmdb.paths("/movie/")), ["/movie/2", "/movie/6", "/movie/7"])
+        self.assertEqual(Movie.objects.filter(runtime=100).count(), 3)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("import_tmdb_export", self.path, "--min-popularity", "0.5", stdout=out)
+        self.assertIn("신규 3개 / 기존 1개 / 제외 3개 / 잘못된 줄 2개", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("import_tmdb_export", self.path + ".missing", stdout=out)
+
+
+class GenreFingerprintTests(TestCase):
+    """
+    tmdb_fingerprint에는 실제로 연결한 장르만 들어감 → 장르 master가 늦게 생겨도 다음 동기화에서 장르 연결
+    """
+
+    def setUp(self):
+        tmdb.genre_registry.invalidate()
+        self.addCleanup(tmdb.genre_registry.invalidate)
+
+    @staticmethod
+    def _genres(tmdb_id):
+        return sorted(Movie.objects.get(tmdb_id=tmdb_id).genres.values_list("tmdb_id", flat=True))
+
+    def test_resync_links_genres_created_later(self):
+        page = [fake_movie(1, genre_ids=[28])]
+        self.assertEqual(tmdb.upsert_movie_page(page)[1], 1)
+        self.assertEqual(self._genres(1), [])  # Genre master가 비어 있어 연결 못 함
+
+        Genre.objects.create(tmdb_id=28, name="Action")
+        tmdb.genre_registry.load()
+        self.assertEqual(tmdb.upsert_movie_page(page)[1], 1)  # 같은 응답이어도 "바뀜"
+        self.assertEqual(self._genres(1), [28])
+        self.assertEqual(tmdb.upsert_movie_page(page)[1], 0)  # 연결된 뒤에는 그대로
+
+    def test_unknown_genre_linked_when_known(self):
+        Genre.objects.create(tmdb_id=28, name="Action")
+        page = [fake_movie(1, genre_ids=[28, 99])]
+        tmdb.upsert_movie_page(page)
+        self.assertEqual(self._genres(1), [28])
+
+        Genre.objects.create(tmdb_id=99, name="Documentary")
+        tmdb.genre_registry.invalidate()
+        self.assertEqual(tmdb.upsert_movie_page(page)[1], 1)
+        self.assertEqual(self._genres(1), [28, 99])
+
+    def test_detail_links_genres_skipped_by_list(self):
+        tmdb.upsert_movie_page([fake_movie(1, genre_ids=[28])])
+        movie = Movie.objects.get(tmdb_id=1)
+        # 목록 필드/장르가 같은 상세라도 장르 master를 만들고 연결
+        tmdb.apply_movie_detail(movie, {**fake_movie(1), "genres": [{"id": 28, "name": "Action"}]})
+        self.assertEqual(self._genres(1), [28])
+        self.assertEqual(tmdb.upsert_movie_page([fake_movie(1, genre_ids=[28])])[1], 0)  # 목록과 상세 fingerprint 일치
+
+
+class ShardedSyncTests(TestCase):
+    """
+    분할 실행: 구간 점유, 페이지마다 진행 기록, lease를 잃으면 중단(ShardLeaseLost), 실패 구간은 PENDING으로 재시도
+    - TMDB는 _tmdb_get 패치로 대체 (discover 페이지마다 20편)
+    """
+
+    def setUp(self):
+        self.requests = []
+        self.fail_pages = {}  # page → 남은 실패 횟수
+        self.on_request = None
+        patcher = mock.patch.object(tmdb, "_tmdb_get", self.fake_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tmdb.genre_registry.invalidate()
+        self.addCleanup(tmdb.genre_registry.invalidate)
+        self.run_ = create_sharded_run(5, 2)
+
+    def fake_get(self, path, params=None, **kwargs):
+        page = params["page"]
+        self.requests.append(page)
+        if self.on_request is not None:
+            self.on_request(page)
+        if self.fail_pages.get(page):
+            self.fail_pages[page] -= 1
+            raise requests.ConnectionError(f"page {page}")
+        return FakeTMDB._discover(None, {"page": page})
+
+    def _shards(self):
+        return [(s.start_page, s.end_page, s.status, s.last_page, s.attempts) for s in self.run_.shards.all()]
+
+    def test_create_and_claim(self):
+        self.assertEqual(
+            self._shards(), [(1, 2, "PENDING", 0, 0), (3, 4, "PENDING", 0, 0), (5, 5, "PENDING", 0, 0)]
+        )
+        claimed = [claim_shard(self.run_, f"w{i}") for i in range(4)]
+        self.assertEqual([s.start_page if s else None for s in claimed], [1, 3, 5, None])
+        self.assertTrue(claimed[0].locked_by.startswith("w0:"))
+        self.assertEqual((claimed[0].status, claimed[0].attempts), ("RUNNING", 1))
+
+        # lease가 끝난 구간은 다른 워커가 가져감
+        SyncShard.objects.filter(pk=claimed[0].pk).update(locked_until=timezone.now() - timedelta(seconds=1))
+        again = claim_shard(self.run_, "w9")
+        self.assertEqual((again.pk, again.attempts), (claimed[0].pk, 2))
+
+    def test_worker_completes_run(self):
+        seen = []
+        done = run_shard_worker(
+            self.run_, worker="w1", sleep_sec=0, on_shard=lambda s, total, e: seen.append((s.start_page, total, e))
+        )
+        self.assertEqual(done, 3)
+        self.assertEqual(seen, [(1, 40, None), (3, 40, None), (5, 20, None)])
+        self.assertEqual(self._shards(), [(1, 2, "DONE", 2, 1), (3, 4, "DONE", 4, 1), (5, 5, "DONE", 5, 1)])
+        self.assertEqual(self.requests, [1, 2, 3, 4, 5])
+        self.run_.refresh_from_db()
+        self.assertEqual((self.run_.status, self.run_.total, self.run_.changed), ("DONE", 100, 100))
+        self.assertEqual(Movie.objects.count(), 100)
+
+    def test_record_page(self):
+        shard = claim_shard(self.run_, "w1")
+        shard.record_page(1, 20, errors=1, changed=5)
+        shard.refresh_from_db()
+        self.assertEqual((shard.last_page, shard.total, shard.errors, shard.next_page), (1, 20, 1, 2))
+        self.assertGreater(shard.locked_until, timezone.now() + timedelta(seconds=SHARD_LEASE_SECONDS - 5))  # lease 연장
+        self.run_.refresh_from_db()
+        self.assertEqual((self.run_.last_page, self.run_.total, self.run_.errors, self.run_.changed), (0, 20, 1, 5))
+
+    def test_lease_lost(self):
+        stolen = {}
+
+        def steal(page):
+            # 2페이지를 받는 동안 lease가 만료돼 다른 워커가 구간을 가져감
+            if page == 2 and not stolen:
+                SyncShard.objects.filter(start_page=1).update(locked_until=timezone.now() - timedelta(seconds=1))
+                stolen["shard"] = claim_shard(self.run_, "w2")
+
+        self.on_request = steal
+        seen = []
+        run_shard_worker(self.run_, worker="w1", sleep_sec=0, on_shard=lambda s, _, e: seen.append((s.start_page, e)))
+
+        self.assertIsInstance(seen[0][1], ShardLeaseLost)
+        self.assertEqual([(page, e) for page, e in seen[1:]], [(3, None), (5, None)])
+        shard = SyncShard.objects.get(start_page=1)
+        # w1은 1페이지까지만 기록하고 중단, 구간 상태는 w2 것 그대로
+        self.assertEqual((shard.status, shard.last_page, shard.attempts), ("RUNNING", 1, 2))
+        self.assertEqual(shard.locked_by, stolen["shard"].locked_by)
+        self.run_.refresh_from_db()
+        self.assertEqual(self.run_.status, "RUNNING")
+
+        # w2가 2페이지부터 이어서 끝냄 (w1이 받은 2페이지는 기록되지 않았으므로 중복 집계 없음)
+        self.requests.clear()
+        shard = stolen["shard"]
+        tmdb.sync_bulk_movies(pages=shard.end_page, start_page=shard.next_page, sleep_sec=0, run=shard)
+        self.assertEqual(self.requests, [2])
+        self.run_.refresh_from_db()
+        self.assertEqual((self.run_.status, self.run_.total), ("DONE", 100))
+
+    def test_failure_retries_from_next_page(self):
+        self.fail_pages = {4: 1}
+        seen = []
+        done = run_shard_worker(self.run_, worker="w1", sleep_sec=0, on_shard=lambda s, _, e: seen.append((s.start_page, e)))
+        self.assertEqual(done, 3)
+        self.assertEqual(str(seen[1][1]), "page 4")
+        self.assertEqual([p for p, _ in seen], [1, 3, 3, 5])  # 실패한 구간은 PENDING → 다시 점유
+        self.assertEqual(self.requests, [1, 2, 3, 4, 4, 5])  # 3페이지는 다시 받지 않음
+        shard = SyncShard.objects.get(start_page=3)
+        self.assertEqual((shard.status, shard.attempts), ("DONE", 2))
+        self.assertIn("page 4", shard.last_error)
+        self.run_.refresh_from_db()
+        self.assertEqual(self.run_.status, "DONE")
+
+    def test_failed_after_max_attempts(self):
+        self.fail_pages = {5: 99}
+        done = run_shard_worker(self.run_, worker="w1", sleep_sec=0)
+        self.assertEqual(done, 2)
+        shard = SyncShard.objects.get(start_page=5)
+        self.assertEqual((shard.status, shard.attempts), ("FAILED", shard.max_attempts))
+        self.assertEqual(self.requests.count(5), shard.max_attempts)
+        self.run_.refresh_from_db()
+        self.assertEqual(self.run_.status, "FAILED")
+        self.assertIsNone(claim_shard(self.run_, "w2"))
+
+
+def fake_jpeg(width, height, color=(200, 30, 30)) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (width, height), color).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+class ImageMirrorTests(FakeTMDBMixin, TestCase):
+    """
+    이미지 미러: FakeTMDB를 이미지 호스트로 (/original/<name>.jpg), MEDIA_ROOT는 임시 디렉터리
+    - /original/same_a.jpg, /original/same_b.jpg는 같은 바이트 → 같은 해시(파일 공유)
+    """
+
+    big, small, shared = fake_jpeg(1000, 500), fake_jpeg(200, 100, (30, 200, 30)), fake_jpeg(400, 400, (30, 30, 200))
+    fake_routes = (
+        (r"^/original/big\.jpg$", lambda m, q: (200, ImageMirrorTests.big, {})),
+        (r"^/original/small\.jpg$", lambda m, q: (200, ImageMirrorTests.small, {})),
+        (r"^/original/same_[ab]\.jpg$", lambda m, q: (200, ImageMirrorTests.shared, {})),
+    )
+
+    def setUp(self):
+        super().setUp()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.media_root = media.name
+        ctx = override_settings(MEDIA_ROOT=self.media_root, TMDB_IMAGE_BASE_URL=self.tmdb.url)
+        ctx.__enter__()
+        self.addCleanup(ctx.__exit__, None, None, None)
+
+    def mirror(self, *paths, ago=None):
+        # 받아서 저장, ago(초 목록)가 있으면 accessed_at을 그만큼 과거로
+        movie = Movie(tmdb_id=1)
+        images.save_image_assets(movie, [images.fetch_image(p) for p in paths])
+        for path, seconds in zip(paths, ago or ()):
+            ImageAsset.objects.filter(source_path=path).update(accessed_at=timezone.now() - timedelta(seconds=seconds))
+        return {a.source_path: a for a in ImageAsset.objects.filter(source_path__in=paths)}
+
+    def files(self):
+        return sorted(
+            os.path.relpath(os.path.join(root, name), self.media_root)
+            for root, _, names in os.walk(self.media_root)
+            for name in names
+        )
+
+    def test_fetch_image_writes_variants_at_content_addressed_paths(self):
+        info = images.fetch_image("/big.jpg")
+        sha1 = hashlib.sha1(self.big).hexdigest()
+        self.assertEqual(info["sha1"], sha1)
+        self.assertEqual((info["width"], info["height"]), (1000, 500))
+        self.assertEqual(
+            info["variants"],
+            {v: f"tmdb_images/{sha1[:2]}/{sha1}_{v}.jpg" for v in ("w185", "w342", "w780")},
+        )
+        for variant, width in images.IMAGE_VARIANTS.items():
+            with Image.open(os.path.join(self.media_root, info["variants"][variant])) as img:
+                self.assertEqual(img.size, (width, width // 2))
+        self.assertEqual(info["bytes"], sum(os.path.getsize(os.path.join(self.media_root, p)) for p in info["variants"].values()))
+        self.assertEqual(self.tmdb.paths("/original"), ["/original/big.jpg"])
+
+    def test_fetch_image_keeps_narrow_originals_and_reuses_files(self):
+        info = images.fetch_image("/small.jpg")
+        sizes = {}
+        for variant, relpath in info["variants"].items():
+            with Image.open(os.path.join(self.media_root, relpath)) as img:
+                sizes[variant] = img.size
+        self.assertEqual(sizes, {"w185": (185, 92), "w342": (200, 100), "w780": (200, 100)})  # 원본보다 넓은 변형은 원본 크기
+
+        a, b = images.fetch_image("/same_a.jpg"), images.fetch_image("/same_b.jpg")
+        self.assertEqual(a["variants"], b["variants"])  # 경로가 달라도 같은 파일
+        self.assertEqual(len(self.files()), 6)
+
+    def test_mirror_usage_counts_shared_files_once(self):
+        assets = self.mirror("/big.jpg", "/same_a.jpg", "/same_b.jpg")
+        self.assertEqual(assets["/same_a.jpg"].bytes, assets["/same_b.jpg"].bytes)
+        self.assertEqual(images.mirror_usage(), assets["/big.jpg"].bytes + assets["/same_a.jpg"].bytes)
+        self.assertEqual(images.mirror_usage(), sum(os.path.getsize(os.path.join(self.media_root, f)) for f in self.files()))
+
+    def test_budget_evicts_least_recently_used_first(self):
+        assets = self.mirror("/big.jpg", "/small.jpg", ago=[300, 100])
+        evicted, used = images.enforce_image_budget(max_bytes=assets["/small.jpg"].bytes)
+
+        self.assertEqual((evicted, used), (1, assets["/small.jpg"].bytes))
+        self.assertEqual(list(ImageAsset.objects.values_list("source_path", flat=True)), ["/small.jpg"])
+        self.assertEqual(self.files(), sorted(assets["/small.jpg"].variants.values()))
+
+    def test_budget_keeps_files_another_asset_still_uses(self):
+        assets = self.mirror("/same_a.jpg", "/big.jpg", "/same_b.jpg", ago=[300, 200, 100])
+        shared_bytes = assets["/same_a.jpg"].bytes
+
+        # same_a를 지워도 same_b가 같은 파일을 쓰므로 줄지 않음 → big까지 지워야 예산 안
+        evicted, used = images.enforce_image_budget(max_bytes=shared_bytes, batch=1)
+
+        self.assertEqual((evicted, used), (2, shared_bytes))
+        self.assertEqual(list(ImageAsset.objects.values_list("source_path", flat=True)), ["/same_b.jpg"])
+        self.assertEqual(self.files(), sorted(assets["/same_b.jpg"].variants.values()))
+
+    def test_serializer_images_use_mirror_urls_once_asset_exists(self):
+        movie = Movie.objects.create(tmdb_id=1, title="m", poster_path="/big.jpg", backdrop_path="/small.jpg")
+        self.assertEqual(MovieListSerializer(movie).data["images"], {"poster": None, "backdrop": None})
+
+        assets = self.mirror("/big.jpg")
+        self.assertEqual(
+            MovieListSerializer(movie).data["images"],
+            {"poster": {v: f"/media/{p}" for v, p in assets["/big.jpg"].variants.items()}, "backdrop": None},
+        )
+
+        request = APIRequestFactory().get("/api/movies/list/")
+        poster = MovieListSerializer(movie, context={"request": request}).data["images"]["poster"]
+        self.assertEqual(poster["w342"], f"http://testserver/media/{assets['/big.jpg'].variants['w342']}")
+
+
+class ReviewFixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create(username=f"u{i}", email=f"u{i}@example.com") for i in range(3)]
+        genre = Genre.objects.create(tmdb_id=28, name="Action")
+        cls.movies = []
+        for i in range(20):
+            movie = Movie.objects.create(tmdb_id=1000 + i, title=f"movie {i}", poster_path=f"/p{i}.jpg", popularity=100 - i)
+            movie.genres.add(genre)
+            cls.movies.append(movie)
+            if i % 4 == 3:
+                continue  # 리뷰 없는 영화
+            for rating, user in enumerate(cls.users, start=3):
+                Review.objects.create(user=user, movie=movie, content=f"{user.username} {i}", watched=True, rating=rating)
+
+        # 영화마다 u1 리뷰가 좋아요 최다
+        for review in Review.objects.filter(user=cls.users[1]):
+            review.likes.add(cls.users[0], cls.users[2])
+        refresh_review_stats(m.id for m in cls.movies)
+
+
+class TopReviewBatchTests(ReviewFixtureMixin, TestCase):
+    """
+    MovieListSerializer(many=True): 영화 수와 상관없이 쿼리 수 고정, reviews 테이블은 읽지 않음
+    """
+
+    def _serialize(self, size):
+        qs = Movie.objects.order_by("-popularity").prefetch_related("genres")[:size]
+        return MovieListSerializer(qs, many=True).data
+
+    def test_query_count_constant(self):
+        # 영화 / 장르 prefetch / 미러 이미지
+        for size in (5, 20):
+            with self.assertNumQueries(3):
+                data = self._serialize(size)
+            self.assertEqual(len(data), size)
+
+    def test_picks_most_liked_review(self):
+        data = {m["tmdb_id"]: m for m in self._serialize(20)}
+        top = data[1000]["top_review"]
+        self.assertEqual(top["username"], "u1")
+        self.assertEqual(top["like_count"], 2)
+        self.assertIsNone(data[1003]["top_review"])
+
+    def test_stored_top_review_matches_window_query(self):
+        movie = Movie.objects.get(tmdb_id=1000)
+        live = load_top_reviews([movie.id])[movie.id]
+        self.assertEqual(movie.top_review_id, live["id"])
+        self.assertEqual(MovieListSerializer(movie).data["top_review"]["content"], live["content"])
+
+    def test_review_list_preloads_movies(self):
+        # 리뷰 목록에 중첩된 영화도 리뷰 수와 상관없이 고정 (영화별 장르 제외)
+        for user in self.users[:2]:
+            qs = (
+                Review.objects.filter(user=user)
+                .select_related("user", "movie")
+                .annotate(likes_count=Count("likes"), comments_count=Count("comments"))
+            )
+            count = qs.count()
+            # 리뷰(+user/movie) / 미러 이미지 / 영화별 장르
+            with self.assertNumQueries(2 + count):
+                ReviewSerializer(qs, many=True).data
+
+
+class ReviewStatsTests(ReviewFixtureMixin, TestCase):
+    """
+    리뷰 작성/수정/삭제/좋아요 API가 Movie의 리뷰 통계를 갱신하는지
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = self.movies[3]  # 리뷰 없는 영화
+
+    def test_stats_after_refresh(self):
+        movie = Movie.objects.get(tmdb_id=1000)
+        self.assertEqual(movie.review_count, 3)
+        self.assertEqual(movie.rating_hist, [0, 0, 1, 1, 1])
+        self.assertEqual(movie.rating_avg, 4.0)
+
+    def test_create_update_delete_review(self):
+        self.client.force_authenticate(self.users[0])
+        res = self.client.post(
+            f"/api/reviews/movie/{self.movie.tmdb_id}/create/", {"content": "good", "watched": True, "rating": 5}
+        )
+        self.assertEqual(res.status_code, 201)
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.review_count, 1)
+        self.assertEqual(self.movie.rating_hist, [0, 0, 0, 0, 1])
+        self.assertEqual(self.movie.top_review["content"], "good")
+
+        review_id = res.data["id"]
+        self.client.put(f"/api/reviews/{review_id}/", {"content": "so so", "watched": True, "rating": 2})
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.rating_avg, 2.0)
+        self.assertEqual(self.movie.top_review["content"], "so so")
+
+        self.client.delete(f"/api/reviews/{review_id}/")
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.review_count, 0)
+        self.assertIsNone(self.movie.top_review)
+
+    def test_like_changes_top_review(self):
+        movie = self.movies[0]
+        u0_review = Review.objects.get(movie=movie, user=self.users[0])
+        u1_review = Review.objects.get(movie=movie, user=self.users[1])
+
+        # u0 리뷰도 좋아요 2개 → 동점이면 최신(u1) 유지
+        for user in self.users[1:]:
+            self.client.force_authenticate(user)
+            self.client.post(f"/api/reviews/{u0_review.id}/like/")
+        movie.refresh_from_db()
+        self.assertEqual(movie.top_review["username"], "u1")
+
+        # u2가 u1 리뷰 좋아요 취소 → u0
+        self.client.post(f"/api/reviews/{u1_review.id}/like/")
+        movie.refresh_from_db()
+        self.assertEqual(movie.top_review["username"], "u0")
+
+    def test_wish_not_counted(self):
+        self.client.force_authenticate(self.users[0])
+        self.client.post(f"/api/reviews/movies/{self.movie.tmdb_id}/wish/")
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.review_count, 0)
+        self.assertIsNone(self.movie.top_review)
+
+
+class HomeCacheTests(ReviewFixtureMixin, TestCase):
+    """
+    home 응답 캐시: hit이면 쿼리 0번, 홈 섹션 교체/홈 영화 리뷰 통계 변경 시 다시 만듦
+    """
+
+    def setUp(self):
+        cache.clear()
+        response_cache._memo.clear()
+        swap_home_section("POPULAR", self.movies[:5])
+        self.client = APIClient()
+
+    def test_hit_without_queries(self):
+        first = self.client.get("/api/movies/home/").json()
+        self.assertEqual(len(first["popular"]), 5)
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/movies/home/").json()
+        self.assertEqual(first, second)
+
+    def test_swap_invalidates(self):
+        self.client.get("/api/movies/home/")
+        swap_home_section("POPULAR", self.movies[5:8])
+        data = self.client.get("/api/movies/home/").json()
+        self.assertEqual([m["tmdb_id"] for m in data["popular"]], [1005, 1006, 1007])
+
+    def test_review_stats_invalidate_only_home_movies(self):
+        version = response_cache.get_version(response_cache.HOME_VERSION_KEY)
+        refresh_review_stats([self.movies[10].id])  # 홈에 없는 영화
+        self.assertEqual(response_cache.get_version(response_cache.HOME_VERSION_KEY), version)
+        refresh_review_stats([self.movies[0].id])
+        self.assertEqual(response_cache.get_version(response_cache.HOME_VERSION_KEY), version + 1)
+
+        # HomeSection 행 없이 version 0 항목만 있는 섹션 (홈 뷰는 version 0을 노출)
+        HomeSectionEntry.objects.create(section="TOP_RATED", version=0, movie=self.movies[11], rank=1)
+        self.assertFalse(HomeSection.objects.filter(code="TOP_RATED").exists())
+        refresh_review_stats([self.movies[11].id])
+        self.assertEqual(response_cache.get_version(response_cache.HOME_VERSION_KEY), version + 2)
+        refresh_review_stats([self.movies[12].id])
+        self.assertEqual(response_cache.get_version(response_cache.HOME_VERSION_KEY), version + 2)
+
+
+class KeysetPaginationTests(ReviewFixtureMixin, TestCase):
+    """
+    ?cursor= 모드: 페이지를 끝까지 넘기면 전체 정렬 결과와 같아야 함 (동점/NULL 포함, 중복/누락 없음)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for i, movie in enumerate(cls.movies):
+            movie.popularity = 10 * (i % 3)  # 동점 많이
+            movie.vote_average = 7 if i % 2 else 8
+            movie.release_date = None if i % 5 == 0 else date(2020, 1 + i % 4, 1)
+            movie.save()
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def _walk(self, url):
+        ids, pages = [], 0
+        while url:
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, 200)
+            ids += [m.get("tmdb_id", m.get("id")) for m in res.json()["results"]]
+            url = res.json()["next"]
+            pages += 1
+        return ids, pages
+
+    def test_movie_list_matches_full_ordering(self):
+        orderings = {
+            "popular": [F("popularity").desc(), F("vote_count").desc(), F("id").desc()],
+            "latest": [F("release_date").desc(nulls_last=True), F("id").desc()],
+            "rating": [F("vote_average").desc(), F("vote_count").desc(), F("id").desc()],
+        }
+        for sort, ordering in orderings.items():
+            expected = list(Movie.objects.order_by(*ordering).values_list("tmdb_id", flat=True))
+            ids, pages = self._walk(f"/api/movies/list/?sort={sort}&page_size=3&cursor=")
+            self.assertEqual(ids, expected, sort)
+            self.assertEqual(pages, 7)
+
+    def test_count_only_when_requested(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get("/api/movies/list/?cursor=&genre=28").json()
+        self.assertNotIn("count", data)
+        self.assertFalse(any("COUNT(" in q["sql"] for q in queries))
+
+        data = self.client.get("/api/movies/list/?cursor=&genre=28&with_count=1").json()
+        self.assertEqual(data["count"], 20)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/api/movies/list/?cursor=garbage").status_code, 404)
+        first = self.client.get("/api/movies/list/?sort=popular&page_size=3&cursor=").json()
+        # 다른 정렬의 커서는 거부
+        cursor = parse_qs(urlparse(first["next"]).query)["cursor"][0]
+        self.assertEqual(self.client.get(f"/api/movies/list/?sort=latest&cursor={cursor}").status_code, 404)
+
+    def test_movie_reviews(self):
+        movie = self.movies[0]
+        expected = list(
+            Review.objects.filter(movie=movie, watched=True)
+            .annotate(likes_count=Count("likes", distinct=True))
+            .order_by("-likes_count", "-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+        ids, _ = self._walk(f"/api/reviews/movie/{movie.tmdb_id}/?page_size=1&cursor=")
+        self.assertEqual(ids, expected)
+
+
+class SearchIndexTests(TestCase):
+    """
+    검색 색인(FTS5 + 한글 bigram): upsert 시 색인 갱신, 부분 일치, BM25 + popularity 순
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        upsert_movies_from_tmdb(
+            [
+                {"id": 1, "title": "어벤져스: 엔드게임", "original_title": "Avengers: Endgame", "popularity": 50},
+                {"id": 2, "title": "어벤져스", "original_title": "The Avengers", "popularity": 80},
+                {"id": 3, "title": "기생충", "original_title": "Parasite", "overview": "어벤져스와 무관한 가족 이야기", "popularity": 90},
+                {"id": 4, "title": "엔드 오브 왓치", "original_title": "End of Watch", "popularity": 10},
+            ]
+        )
+
+    def _search(self, q, **params):
+        res = APIClient().get("/api/movies/search/", {"q": q, **params})
+        return [m["tmdb_id"] for m in res.json()["results"]]
+
+    def test_tokens(self):
+        self.assertEqual(search_tokens("어벤져스 Endgame"), "어벤 벤져 져스 endgame")
+        self.assertEqual(search_tokens("봄"), "봄")
+
+    def test_hangul_partial_match(self):
+        self.assertEqual(set(self._search("벤져")), {1, 2})
+        self.assertEqual(self._search("충"), [])  # 1글자는 접두어 → "기생/생충"은 "충"으로 시작하지 않음
+        self.assertEqual(self._search("기생"), [3])
+
+    def test_title_beats_popularity(self):
+        # overview에만 있는 기생충은 제목 검색에서 제외, 제목 일치끼리는 관련도 → popularity
+        ids = self._search("어벤져스")
+        self.assertEqual(set(ids), {1, 2})
+        self.assertEqual(ids[0], 2)
+
+    def test_latin_prefix(self):
+        self.assertEqual(set(self._search("aveng")), {1, 2})
+        self.assertEqual(self._search("end", cursor=""), [1, 4])  # 커서 모드: popularity 순
+
+    def test_reindex_on_update(self):
+        upsert_movies_from_tmdb([{"id": 4, "title": "왓치맨", "original_title": "Watchmen", "popularity": 10}])
+        self.assertEqual(self._search("엔드"), [1])
+        self.assertEqual(self._search("왓치"), [4])
+
+    def test_orm_save_and_delete_keep_index(self):
+        # TMDB 수집 경로가 아닌 저장(admin, 직접 ORM)도 시그널로 색인
+        movie = Movie.objects.create(tmdb_id=5, title="인터스텔라", original_title="Interstellar")
+        self.assertEqual(self._search("스텔"), [5])
+        movie.title = "테넷"
+        movie.save()
+        self.assertEqual(self._search("스텔"), [])
+        self.assertEqual(self._search("테넷"), [5])
+        pk = movie.pk
+        movie.delete()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM movies_movie_fts WHERE rowid = %s", [pk])
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+        person = Person.objects.create(tmdb_id=20, name="크리스토퍼 놀란")
+        self.assertEqual(search_person_ids("놀란"), [person.pk])
+        person.delete()
+        self.assertEqual(search_person_ids("놀란"), [])
+
+    def test_update_fields_outside_index_skip_reindex(self):
+        movie = Movie.objects.get(tmdb_id=4)
+        movie.popularity = 99
+        with CaptureQueriesContext(connection) as ctx:
+            movie.save(update_fields=["popularity"])
+        self.assertFalse([q for q in ctx.captured_queries if "_fts" in q["sql"]])
+
+    def test_loaddata_is_indexed(self):
+        fixture = [
+            {"model": "movies.movie", "pk": 900, "fields": {"tmdb_id": 900, "title": "라라랜드", "original_title": "La La Land", "updated_at": "2025-12-20T15:00:47.272Z"}},
+            {"model": "movies.person", "pk": 900, "fields": {"tmdb_id": 900, "name": "데이미언 셔젤"}},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        self.addCleanup(os.unlink, f.name)
+        call_command("loaddata", f.name, verbosity=0)
+
+        self.assertEqual(self._search("라라"), [900])
+        self.assertEqual(search_person_ids("셔젤"), [900])
+
+
+class SuggestTests(TestCase):
+    """
+    자동완성(/api/movies/suggest/): 접두어/단어 시작/초성 일치, popularity 순, catalog version 변경 시 재빌드
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        movies = upsert_movies_from_tmdb(
+            [
+                {"id": 1, "title": "어벤져스: 엔드게임", "original_title": "Avengers: Endgame", "popularity": 50},
+                {"id": 2, "title": "어바웃 타임", "original_title": "About Time", "popularity": 80},
+                {"id": 3, "title": "엔드 오브 왓치", "original_title": "End of Watch", "popularity": 10},
+            ]
+        )
+        person = Person.objects.create(tmdb_id=10, name="안소니 루소")
+        MovieCredit.objects.create(movie=movies[0], person=person, role_type="DIRECTOR", job="Director")
+
+    def setUp(self):
+        response_cache._memo.clear()
+        suggest._index = None
+
+    def _suggest(self, q):
+        res = APIClient().get("/api/movies/suggest/", {"q": q})
+        return [(r["type"], r["tmdb_id"]) for r in res.json()["results"]]
+
+    def test_prefix_and_chosung(self):
+        self.assertEqual(self._suggest("어벤"), [("movie", 1)])
+        self.assertEqual(self._suggest("ㅇㅂㅈㅅ"), [("movie", 1)])
+        # popularity 순 ("오브 왓치"도 단어 시작 초성 ㅇㅂ)
+        self.assertEqual(self._suggest("ㅇㅂ"), [("movie", 2), ("movie", 1), ("movie", 3)])
+
+    def test_word_start_and_original_title(self):
+        self.assertEqual(self._suggest("엔드"), [("movie", 1), ("movie", 3)])
+        self.assertEqual(self._suggest("end"), [("movie", 1), ("movie", 3)])
+        self.assertEqual(self._suggest("abouttime"), [("movie", 2)])
+        self.assertEqual(self._suggest("루소"), [("person", 10)])
+        self.assertEqual(self._suggest("드게"), [])
+
+    def test_rebuild_when_catalog_changes(self):
+        index = suggest.get_suggest_index()
+        index.built_at -= suggest.REBUILD_MIN_INTERVAL
+        with mock.patch.object(suggest.threading, "Thread") as thread:
+            suggest.get_suggest_index()
+            thread.assert_not_called()
+
+            upsert_movies_from_tmdb([{"id": 4, "title": "어벤져스", "popularity": 90}])
+            self.assertIs(suggest.get_suggest_index(), index)  # 다시 만드는 동안은 이전 색인
+            thread.assert_called_once()
+        suggest._rebuilding.clear()
+        self.assertEqual(suggest.build_suggest_index().lookup("ㅇㅂㅈㅅ")[0]["tmdb_id"], 4)
+
+
+class MovieBundleTests(ReviewFixtureMixin, TestCase):
+    """
+    /api/movies/<tmdb_id>/bundle/: 리뷰/출연진/비슷한 영화 수와 상관없이 쿼리 수 고정
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Movie.objects.filter(pk__in=[m.pk for m in cls.movies]).update(enriched_at=timezone.now())
+        for i in range(6):
+            person = Person.objects.create(tmdb_id=500 + i, name=f"person {i}")
+            role = "DIRECTOR" if i == 0 else "CAST"
+            MovieCredit.objects.create(movie=cls.movies[0], person=person, role_type=role, order=5 - i)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def _bundle(self, tmdb_id, **params):
+        return self.client.get(f"/api/movies/{tmdb_id}/bundle/", params, HTTP_HOST="127.0.0.1")
+
+    def test_matches_separate_endpoints(self):
+        self.client.force_authenticate(self.users[0])
+        data = self._bundle(1000).json()
+        detail = self.client.get("/api/movies/1000/", HTTP_HOST="127.0.0.1").json()
+        similar = self.client.get("/api/movies/1000/similar/", HTTP_HOST="127.0.0.1").json()
+        reviews = self.client.get("/api/reviews/movie/1000/", HTTP_HOST="127.0.0.1").json()
+        mine = self.client.get("/api/reviews/movie/1000/my/", HTTP_HOST="127.0.0.1").json()
+
+        self.assertEqual(data["detail"], detail)
+        self.assertEqual([d["name"] for d in data["detail"]["directors"]], ["person 0"])
+        self.assertEqual([c["name"] for c in data["detail"]["cast"]], [f"person {i}" for i in range(5, 0, -1)])
+        self.assertEqual(data["similar"], similar)
+        self.assertEqual(data["reviews"]["results"], reviews)
+        self.assertEqual(data["reviews"]["count"], 3)
+        self.assertIsNone(data["reviews"]["next"])
+        self.assertEqual(data["me"], {"review": mine, "liked": False, "wished": False})
+
+    def test_query_count_constant(self):
+        self.client.force_authenticate(self.users[0])
+        # 영화 / 장르 / 크레딧(+인물) / 비슷한 영화 / 그 장르 / 미러 이미지 / 리뷰 / 내 리뷰 / 좋아요
+        for tmdb_id in (1000, 1003):  # 크레딧/리뷰 있는 영화, 없는 영화
+            with self.assertNumQueries(9):
+                self.assertEqual(self._bundle(tmdb_id).status_code, 200)
+
+    def test_anonymous_and_next_cursor(self):
+        data = self._bundle(1000, page_size=2).json()
+        self.assertIsNone(data["me"])
+        self.assertEqual(len(data["reviews"]["results"]), 2)
+        rest = self.client.get(data["reviews"]["next"], HTTP_HOST="127.0.0.1").json()
+        ids = [r["id"] for r in data["reviews"]["results"] + rest["results"]]
+        self.assertEqual(len(set(ids)), 3)
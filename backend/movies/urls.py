@@ -6,10 +6,12 @@ urlpatterns = [
     path("list/", views.movie_list),
     path("genres/", views.genre_list),
     path("search/", views.search),
+    path("suggest/", views.suggest),
 
     # ✅ movie detail & similar & like
     path("<int:tmdb_id>/", views.movie_detail),
     path("<int:tmdb_id>/credits/", views.movie_credits),
+    path("<int:tmdb_id>/bundle/", views.movie_bundle),       # 상세 페이지 한 번에 (상세+비슷한 영화+리뷰+내 상태)
     path("<int:tmdb_id>/similar/", views.movie_similar),      # [추가] 비슷한 영화
     path("<int:tmdb_id>/like/", views.movie_like_toggle),     # [추가] 좋아요 토글
 
@@ -5,19 +5,39 @@ from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
 from django.db.models import Prefetch
 from .models import Movie, MovieCredit
-from django.db.models import Q, Count
+from django.db.models import Count
 
 from rest_framework.permissions import IsAuthenticated # 마이페이지 
 
-from .models import Movie, Genre, Person, HomeSectionEntry, MovieCredit, PersonLike, GenreLike, MovieLike, LikedPerson # 마이페이지  # 영화상세 
+from .models import Movie, Genre, Person, HomeSection, HomeSectionEntry, MovieCredit, PersonLike, GenreLike, MovieLike, LikedPerson # 마이페이지  # 영화상세 
 from .serializers import (
+    preload_movie_context,
     MovieListSerializer,
     MovieDetailSerializer,
     GenreSerializer,
     PersonSerializer,
     PersonDetailSerializer,
 )
-from .services.tmdb import fetch_movie_detail_and_update, sync_movie_credits
+from django.conf import settings
+from .pagination import KeysetPagination
+from rest_framework.utils.urls import replace_query_param
+from reviews.models import Review
+from reviews.serializers import ReviewSerializer
+from .services.jobs import enqueue_job
+from .services.reviews import annotate_review_list
+from .services.response_cache import HOME_VERSION_KEY, versioned_response
+from .services.search import fts_enabled, movie_search_q, person_search_q, search_movie_ids, search_person_ids
+from .services.singleflight import single_flight
+from .services.suggest import suggest as suggest_entries
+from .services.tmdb import ensure_movie_enriched, sync_movie_credits
+
+
+# movie_list 커서 모드 정렬 키 (마지막 id로 순서 확정)
+MOVIE_LIST_KEYSETS = {
+    "popular": ["-popularity", "-vote_count", "-id"],
+    "latest": ["-release_date", "-id"],
+    "rating": ["-vote_average", "-vote_count", "-id"],
+}
 
 
 class MoviePagination(PageNumberPagination):
@@ -26,32 +46,33 @@ class MoviePagination(PageNumberPagination):
     max_page_size = 50
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def home(request):
-    popular = (
-        Movie.objects.filter(home_entries__section="POPULAR")
-        .order_by("home_entries__rank")
-        .prefetch_related("genres")[:20]
-    )
-    now_playing = (
-        Movie.objects.filter(home_entries__section="NOW_PLAYING")
-        .order_by("home_entries__rank")
-        .prefetch_related("genres")[:20]
-    )
-    top_rated = (
-        Movie.objects.filter(home_entries__section="TOP_RATED")
+def _home_section_movies(section_code: str, version: int):
+    return (
+        Movie.objects.filter(home_entries__section=section_code, home_entries__version=version)
         .order_by("home_entries__rank")
         .prefetch_related("genres")[:20]
     )
 
-    return Response(
-        {
-            "popular": MovieListSerializer(popular, many=True).data,
-            "now_playing": MovieListSerializer(now_playing, many=True).data,
-            "top_rated": MovieListSerializer(top_rated, many=True).data,
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def home(request):
+    # ✅ 섹션별로 현재 활성 version의 순위만 노출 (동기화 중에도 이전 version이 그대로 보임)
+    # ✅ 응답 전체를 홈 version별로 캐시 (섹션 교체/리뷰 통계 변경 시 version +1 → services/response_cache.py)
+    def build():
+        versions = dict(HomeSection.objects.values_list("code", "active_version"))
+        popular = _home_section_movies("POPULAR", versions.get("POPULAR", 0))
+        now_playing = _home_section_movies("NOW_PLAYING", versions.get("NOW_PLAYING", 0))
+        top_rated = _home_section_movies("TOP_RATED", versions.get("TOP_RATED", 0))
+        return {
+            "popular": MovieListSerializer(popular, many=True, context={"request": request}).data,
+            "now_playing": MovieListSerializer(now_playing, many=True, context={"request": request}).data,
+            "top_rated": MovieListSerializer(top_rated, many=True, context={"request": request}).data,
         }
-    )
+
+    # 이미지 URL이 절대 URL이라 host별로 따로 캐시
+    data = versioned_response("home", HOME_VERSION_KEY, build, vary=request.build_absolute_uri("/"))
+    return Response(data)
 
 
 @api_view(["GET"])
@@ -60,6 +81,7 @@ def movie_list(request):
     """
     /api/movies/list/?sort=popular|latest|rating&genre=28&page=1
     - genre: Genre.tmdb_id
+    - ?cursor= 를 주면 커서 페이지네이션 (COUNT/OFFSET 없음, 다음 페이지는 응답의 next)
     """
     qs = Movie.objects.all().prefetch_related("genres")
 
@@ -68,6 +90,12 @@ def movie_list(request):
         qs = qs.filter(genres__tmdb_id=int(genre_tmdb_id))
 
     sort = request.query_params.get("sort", "popular")
+    if KeysetPagination.requested(request):
+        paginator = KeysetPagination(MOVIE_LIST_KEYSETS.get(sort, MOVIE_LIST_KEYSETS["popular"]), nullable=["release_date"])
+        page = paginator.paginate_queryset(qs, request)
+        data = MovieListSerializer(page, many=True, context={"request": request}).data
+        return paginator.get_paginated_response(data)
+
     if sort == "latest":
         qs = qs.order_by("-release_date", "-popularity")
     elif sort == "rating":
@@ -77,14 +105,32 @@ def movie_list(request):
 
     paginator = MoviePagination()
     page = paginator.paginate_queryset(qs, request)
-    data = MovieListSerializer(page, many=True).data
+    data = MovieListSerializer(page, many=True, context={"request": request}).data
     return paginator.get_paginated_response(data)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def movie_detail(request, tmdb_id: int):
-    movie = (
+    movie = _load_movie_detail(tmdb_id)
+    if not movie:
+        return Response(
+            {"detail": "영화를 찾을 수 없습니다. TMDB 동기화를 먼저 실행하세요."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    # ✅ runtime/genres/크레딧 보강: 최신이면 DB 그대로, 오래됐으면 백그라운드 갱신,
+    #    아예 없을 때만 짧은 timeout으로 인라인 요청 (services/tmdb.py ensure_movie_enriched)
+    state = ensure_movie_enriched(movie, has_credits=bool(movie.moviecredit_set.all()))
+    if state == "fetched":
+        movie = _load_movie_detail(tmdb_id)
+
+    return Response(MovieDetailSerializer(movie, context={"request": request}).data)
+
+
+def _load_movie_detail(tmdb_id: int):
+    # 상세 직렬화(MovieDetailSerializer)에 필요한 장르/크레딧(+인물)까지 쿼리 3번
+    return (
         Movie.objects.filter(tmdb_id=tmdb_id)
         .prefetch_related("genres")
         .prefetch_related(
@@ -95,26 +141,73 @@ def movie_detail(request, tmdb_id: int):
         )
         .first()
     )
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def movie_bundle(request, tmdb_id: int):
+    """
+    /api/movies/<tmdb_id>/bundle/
+    영화 상세 페이지에 필요한 것을 한 번에 (movie_detail + similar + 리뷰 첫 페이지 + 내 상태)
+    - detail: movie_detail과 같음 (directors/cast 포함 → credits 따로 호출 안 해도 됨)
+    - similar: movie_similar와 같음
+    - reviews: {"next": 리뷰 목록 API의 다음 커서 URL | null, "count": n, "results": [...]}
+      (list_movie_reviews ?cursor= 와 같은 정렬, 다음 페이지는 next로)
+    - me: 로그인 시 {"review": 내 리뷰 | null, "liked": 좋아요 여부, "wished": 보고싶어요 여부}, 아니면 null
+    - 쿼리 수는 리뷰/출연진/비슷한 영화 수와 상관없이 고정
+    """
+    movie = _load_movie_detail(tmdb_id)
     if not movie:
         return Response(
             {"detail": "영화를 찾을 수 없습니다. TMDB 동기화를 먼저 실행하세요."},
             status=status.HTTP_404_NOT_FOUND,
         )
+    state = ensure_movie_enriched(movie, has_credits=bool(movie.moviecredit_set.all()))
+    if state == "fetched":
+        movie = _load_movie_detail(tmdb_id)
+
+    # 이미지 미러는 상세/비슷한 영화/리뷰가 context 하나를 같이 씀 → 쿼리 1번
+    context = {"request": request}
+    similar = list(_similar_movies(movie).prefetch_related("genres"))
+    preload_movie_context(context, [movie, *similar])
+
+    paginator = KeysetPagination(["-likes_count", "-created_at", "-id"])
+    reviews = paginator.paginate_queryset(
+        annotate_review_list(Review.objects.filter(movie=movie, watched=True), request.user), request
+    )
+    for review in reviews:
+        review.movie = movie  # 장르 prefetch가 된 객체로 (리뷰마다 장르 조회하지 않도록)
+    next_url = None
+    if paginator.has_next:
+        next_url = replace_query_param(
+            request.build_absolute_uri(f"/api/reviews/movie/{movie.tmdb_id}/"),
+            paginator.cursor_query_param,
+            paginator.encode_cursor(reviews[-1]),
+        )
 
-    # ✅ runtime/genres 등 상세 보정
-    try:
-        fetch_movie_detail_and_update(movie)
-    except Exception:
-        pass
-
-    # ✅ 크레딧(감독/배우) DB가 비어있으면 요청 시 자동 동기화
-    if not MovieCredit.objects.filter(movie=movie).exists():
-        try:
-            sync_movie_credits(movie, cast_limit=10)
-        except Exception:
-            pass
+    me = None
+    if request.user.is_authenticated:
+        mine = annotate_review_list(Review.objects.filter(movie=movie, user=request.user), request.user).first()
+        if mine is not None:
+            mine.movie = movie
+        me = {
+            "review": ReviewSerializer(mine, context=context).data if mine else None,
+            "liked": MovieLike.objects.filter(user=request.user, movie=movie).exists(),
+            "wished": mine is not None and not mine.watched,
+        }
 
-    return Response(MovieDetailSerializer(movie).data)
+    return Response(
+        {
+            "detail": MovieDetailSerializer(movie, context=context).data,
+            "similar": MovieListSerializer(similar, many=True, context=context).data,
+            "reviews": {
+                "next": next_url,
+                "count": movie.review_count,
+                "results": ReviewSerializer(reviews, many=True, context=context).data,
+            },
+            "me": me,
+        }
+    )
 
 
 @api_view(["GET"])
@@ -129,10 +222,17 @@ def movie_credits(request, tmdb_id: int):
         return Response({"detail": "영화를 찾을 수 없습니다."}, status=404)
 
     if not MovieCredit.objects.filter(movie=movie).exists():
+        timeout = settings.TMDB_INLINE_TIMEOUT
         try:
-            sync_movie_credits(movie, cast_limit=10)
+            # 같은 영화 동시 요청은 한 번만 TMDB 호출, 나머지는 그 결과(DB)를 기다렸다가 읽음
+            single_flight(
+                f"credits:{movie.tmdb_id}",
+                lambda: sync_movie_credits(movie, cast_limit=10, timeout=timeout),
+                wait=timeout * 2,
+            )
         except Exception:
-            pass
+            # 인라인으로 못 받았으면 빈 목록으로 응답하고 워커(run_workers)에 맡김
+            enqueue_job("CREDITS", movie.tmdb_id)
 
     qs = MovieCredit.objects.filter(movie=movie).select_related("person").order_by("order")
     directors = qs.filter(role_type="DIRECTOR")
@@ -230,16 +330,59 @@ def search(request):
     if not q:
         return Response({"detail": "q가 비었습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
+    # ?cursor= 를 주면 30개 제한 없이 커서로 다음 페이지 (일치하는 것 전체를 popularity/이름 순)
+    # 기본: 검색 색인(services/search.py)의 BM25 + popularity 순 상위 30개
+    paginated = KeysetPagination.requested(request)
+
     if search_type == "person":
-        people = Person.objects.filter(name__icontains=q).order_by("name")[:30]
+        people = Person.objects.filter(person_search_q(q))
+        if paginated:
+            paginator = KeysetPagination(["name", "id"])
+            page = paginator.paginate_queryset(people, request)
+            return paginator.get_paginated_response(PersonSerializer(page, many=True).data, type="person")
+        if fts_enabled():
+            people = _in_order(Person.objects.all(), search_person_ids(q, limit=30))
+        else:
+            people = people.order_by("name")[:30]
         return Response({"type": "person", "results": PersonSerializer(people, many=True).data})
 
-    movies = (
-        Movie.objects.filter(Q(title__icontains=q) | Q(original_title__icontains=q))
-        .prefetch_related("genres")
-        .order_by("-popularity")[:30]
-    )
-    return Response({"type": "movie", "results": MovieListSerializer(movies, many=True).data})
+    movies = Movie.objects.filter(movie_search_q(q)).prefetch_related("genres")
+    if paginated:
+        paginator = KeysetPagination(["-popularity", "-id"])
+        page = paginator.paginate_queryset(movies, request)
+        data = MovieListSerializer(page, many=True, context={"request": request}).data
+        return paginator.get_paginated_response(data, type="movie")
+    if fts_enabled():
+        ids = search_movie_ids(q, limit=30, columns=("title", "original_title"))
+        movies = _in_order(Movie.objects.prefetch_related("genres"), ids)
+    else:
+        movies = movies.order_by("-popularity")[:30]
+    return Response({"type": "movie", "results": MovieListSerializer(movies, many=True, context={"request": request}).data})
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def suggest(request):
+    """
+    /api/movies/suggest/?q=...&limit=10
+    - 검색창 자동완성 (프로세스 메모리의 접두어 색인, DB는 catalog version 확인만)
+    - 제목/원제/인물 이름의 앞부분 또는 단어 시작 부분, 한글 초성("ㅇㅂㅈㅅ")으로도 일치
+    - 응답: {"results": [{"type": "movie"|"person", "tmdb_id": ..., ...}]} (popularity 순)
+    """
+    q = (request.query_params.get("q") or "").strip()
+    if not q:
+        return Response({"results": []})
+    try:
+        limit = int(request.query_params.get("limit", 10))
+    except ValueError:
+        limit = 10
+    return Response({"results": suggest_entries(q, limit)})
+
+
+def _in_order(qs, ids: list) -> list:
+    # pk 목록 순서 그대로 (검색 순위 유지)
+    by_pk = qs.in_bulk(ids)
+    return [by_pk[pk] for pk in ids if pk in by_pk]
 
 
 
@@ -270,7 +413,7 @@ def my_likes_list(request):
     elif like_type == "movie": # [추가됨] 영화 좋아요 목록
         likes = MovieLike.objects.filter(user=request.user).select_related("movie")
         movies = [l.movie for l in likes]
-        return Response(MovieListSerializer(movies, many=True).data)
+        return Response(MovieListSerializer(movies, many=True, context={"request": request}).data)
     
         
     return Response([])
@@ -300,23 +443,26 @@ def movie_similar(request, tmdb_id: int):
     2. 그 장르를 포함하는 다른 영화들을 찾습니다.
     3. 겹치는 장르가 많은 순서 + 인기도 순으로 정렬하여 20개를 뽑습니다.
     """
-    movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
-    movie_genres = movie.genres.all()
+    movie = get_object_or_404(Movie.objects.prefetch_related("genres"), tmdb_id=tmdb_id)
+    similar_movies = _similar_movies(movie).prefetch_related("genres")
+    return Response(MovieListSerializer(similar_movies, many=True, context={"request": request}).data)
 
-    if not movie_genres.exists():
-        # 장르 정보가 없으면 그냥 인기 영화 반환
-        similar_movies = Movie.objects.exclude(id=movie.id).order_by("-popularity")[:20]
-    else:
-        # 같은 장르를 가진 영화들 찾기 (현재 영화 제외)
-        similar_movies = (
-            Movie.objects.filter(genres__in=movie_genres)
-            .exclude(id=movie.id)
-            .annotate(same_genres=Count("genres")) # 겹치는 장르 개수 세기
-            .order_by("-same_genres", "-popularity") # 많이 겹치고 + 인기 많은 순
-            .distinct()[:20]
-        )
 
-    return Response(MovieListSerializer(similar_movies, many=True).data)
+def _similar_movies(movie, limit=20):
+    # movie.genres는 prefetch된 것을 사용 (장르 id만 필요)
+    genre_ids = [g.id for g in movie.genres.all()]
+
+    if not genre_ids:
+        # 장르 정보가 없으면 그냥 인기 영화 반환
+        return Movie.objects.exclude(id=movie.id).order_by("-popularity")[:limit]
+    # 같은 장르를 가진 영화들 찾기 (현재 영화 제외)
+    return (
+        Movie.objects.filter(genres__in=genre_ids)
+        .exclude(id=movie.id)
+        .annotate(same_genres=Count("genres")) # 겹치는 장르 개수 세기
+        .order_by("-same_genres", "-popularity") # 많이 겹치고 + 인기 많은 순
+        .distinct()[:limit]
+    )
 
 
 @api_view(["POST"])
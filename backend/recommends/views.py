@@ -6,6 +6,7 @@ from rest_framework import status
 from django.db.models import Q, Count, Avg, Prefetch
 from movies.models import Movie, Genre, Person
 from movies.serializers import MovieListSerializer, PersonSerializer
+from movies.services.search import movie_search_q, person_search_q
 
 from reviews.models import Review
 try:
@@ -99,7 +100,7 @@ def ai_taste(request):
         for k in keywords:
             k = (k or "").strip()
             if not k: continue
-            k_q |= Q(title__icontains=k) | Q(overview__icontains=k)
+            k_q |= movie_search_q(k, columns=("title", "overview"))  # 검색 색인 (services/search.py)
 
     qs = base_qs
     if include_genres:
@@ -118,7 +119,7 @@ def ai_taste(request):
     if include_genres and not qs_final.exists() and k_q: qs_final = base_qs.filter(k_q).distinct()
     if not qs_final.exists() and titles:
         t_q = Q()
-        for t in titles: t_q |= Q(title__icontains=t)
+        for t in titles: t_q |= movie_search_q(t, columns=("title",))
         qs_final = base_qs.filter(t_q).distinct()
 
     if not strict and include_genres:
@@ -129,7 +130,7 @@ def ai_taste(request):
     # 👇 [수정 2] 개수 제한 (12개 -> 3개)
     qs_final = qs_final[:RECOMMEND_LIMIT]
 
-    serialized = MovieListSerializer(qs_final, many=True).data
+    serialized = MovieListSerializer(qs_final, many=True, context={"request": request}).data
 
     # 👇 [수정 3] 추천 이유 생성 로직 추가
     reasons_by_tmdb = {}
@@ -164,14 +165,14 @@ def genre_recommend(request):
         genres = Genre.objects.all().order_by("name")
         return Response({"genres": [{"tmdb_id": g.tmdb_id, "name": g.name} for g in genres]})
     qs = Movie.objects.filter(genres__tmdb_id=int(genre_tmdb_id)).prefetch_related("genres").order_by("-popularity")[:24]
-    return Response({"results": MovieListSerializer(qs, many=True).data})
+    return Response({"results": MovieListSerializer(qs, many=True, context={"request": request}).data})
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def people_recommend(request):
     q = (request.query_params.get("q") or "").strip()
     if q:
-        people = Person.objects.annotate(credits_count=Count("movies")).filter(name__icontains=q, credits_count__gt=0).order_by("-credits_count")[:30]
+        people = Person.objects.annotate(credits_count=Count("movies")).filter(person_search_q(q), credits_count__gt=0).order_by("-credits_count")[:30]
         return Response({"results": PersonSerializer(people, many=True).data})
     try:
         people = Person.objects.annotate(credits_count=Count("movies")).filter(credits_count__gt=0).order_by("-credits_count", "name")[:40]
@@ -239,4 +240,4 @@ def taste_summary(request):
     if top_genre_names: rec_qs = rec_qs.filter(genres__name__in=top_genre_names).distinct()
     if tmdb_ids: rec_qs = rec_qs.exclude(tmdb_id__in=tmdb_ids)
     rec_qs = rec_qs.order_by("-popularity")[:12]
-    return Response({"watched_count": watched_count, "top_genre": top_genre, "avg_rating": avg_rating, "recent_movie_title": recent_movie_title, "genre_scores": genre_scores, "watched_movies": watched_data, "recommended_movies": MovieListSerializer(rec_qs, many=True).data})
\ No newline at end of file
+    return Response({"watched_count": watched_count, "top_genre": top_genre, "avg_rating": avg_rating, "recent_movie_title": recent_movie_title, "genre_scores": genre_scores, "watched_movies": watched_data, "recommended_movies": MovieListSerializer(rec_qs, many=True, context={"request": request}).data})
\ No newline at end of file
@@ -1,11 +1,23 @@
 # backend/reviews/serializers.py
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Manager
 from .models import Review
-from movies.serializers import MovieListSerializer
+from movies.serializers import MovieListSerializer, preload_movie_context
 
 User = get_user_model()
 
+
+class ReviewListSerializer(serializers.ListSerializer):
+    """
+    리뷰 목록(many=True): 리뷰에 붙는 영화(MovieListSerializer)의 대표 리뷰/이미지를 한 번에 미리 읽음
+    """
+
+    def to_representation(self, data):
+        reviews = list(data.all() if isinstance(data, Manager) else data)
+        preload_movie_context(self.context, [r.movie for r in reviews])
+        return super().to_representation(reviews)
+
 # ✅ 유저 정보를 객체로 보내기 위한 시리얼라이저 (익명 방지)
 class ReviewUserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -63,6 +75,7 @@ class ReviewSerializer(serializers.ModelSerializer):
             "comments_count",
         ]
         read_only_fields = ["id", "movie", "user", "likes_count", "created_at", "updated_at"]
+        list_serializer_class = ReviewListSerializer
 
     def get_like_count(self, obj):
         # annotate된 값이 있으면 쓰고, 없으면 DB 직접 조회
@@ -74,6 +87,9 @@ class ReviewSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
             return False
+        # annotate된 값이 있으면 사용 (movies/services/reviews.py annotate_review_list)
+        if getattr(obj, "is_liked", None) is not None:
+            return obj.is_liked
         return obj.likes.filter(id=request.user.id).exists()
 
 class RecentReviewSerializer(serializers.ModelSerializer):
@@ -101,6 +117,7 @@ class RecentReviewSerializer(serializers.ModelSerializer):
             "created_at",
             "comments_count",
         ]
+        list_serializer_class = ReviewListSerializer
 
     def get_like_count(self, obj):
         if hasattr(obj, "likes_count") and obj.likes_count is not None:
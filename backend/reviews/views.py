@@ -6,6 +6,8 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
 from movies.models import Movie 
+from movies.pagination import KeysetPagination
+from movies.services.reviews import annotate_review_list, refresh_review_stats
 from .models import Review, ReviewComment 
 from .serializers import ReviewSerializer, ReviewCreateSerializer, RecentReviewSerializer
 
@@ -14,12 +16,13 @@ from .serializers import ReviewSerializer, ReviewCreateSerializer, RecentReviewS
 @permission_classes([AllowAny])
 def list_movie_reviews(request, tmdb_id: int):
     movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
-    qs = (
-        Review.objects.filter(movie=movie, watched=True) # ✅ 빈 코멘트 제외
-        .select_related("user", "movie")
-        .annotate(likes_count=Count("likes", distinct=True), comments_count=Count("comments", distinct=True))
-        .order_by("-likes_count", "-created_at")
-    )
+    qs = annotate_review_list(Review.objects.filter(movie=movie, watched=True), request.user)  # ✅ 빈 코멘트 제외
+    # ?cursor= 를 주면 커서 페이지네이션 (기본: 전체 목록)
+    if KeysetPagination.requested(request):
+        paginator = KeysetPagination(["-likes_count", "-created_at", "-id"])
+        page = paginator.paginate_queryset(qs, request)
+        return paginator.get_paginated_response(ReviewSerializer(page, many=True, context={"request": request}).data)
+    qs = qs.order_by("-likes_count", "-created_at")
     return Response(ReviewSerializer(qs, many=True, context={"request": request}).data)
 
 # 2. 리뷰 작성
@@ -39,6 +42,7 @@ def create_movie_review(request, tmdb_id: int):
         watched=serializer.validated_data.get("watched", False),
         rating=serializer.validated_data["rating"],
     )
+    refresh_review_stats([movie.id])  # ✅ 영화 카드용 리뷰 통계 갱신
     # 리턴 시 user 정보 포함
     out = Review.objects.filter(id=review.id).select_related("user", "movie").annotate(likes_count=Count("likes"), comments_count=Count("comments")).first()
     return Response(ReviewSerializer(out, context={"request": request}).data, status=201)
@@ -53,6 +57,7 @@ def update_delete_review(request, review_id: int):
 
     if request.method == "DELETE":
         review.delete()
+        refresh_review_stats([review.movie_id])
         return Response(status=204)
 
     serializer = ReviewCreateSerializer(data=request.data)
@@ -61,6 +66,7 @@ def update_delete_review(request, review_id: int):
     review.watched = serializer.validated_data.get("watched", review.watched)
     review.rating = serializer.validated_data["rating"]
     review.save()
+    refresh_review_stats([review.movie_id])
     
     out = Review.objects.filter(id=review.id).select_related("user", "movie").annotate(likes_count=Count("likes"), comments_count=Count("comments")).first()
     return Response(ReviewSerializer(out, context={"request": request}).data)
@@ -79,6 +85,7 @@ def toggle_like(request, review_id: int):
     else:
         review.likes.add(request.user)
         liked = True
+    refresh_review_stats([review.movie_id])  # 좋아요 수로 대표 리뷰가 바뀔 수 있음
     return Response({"liked": liked, "like_count": review.likes.count()})
 
 # 5. 최근 리뷰 (홈 화면)
@@ -111,7 +118,14 @@ def my_reviews(request):
         else:
             qs = qs.filter(watched=True)  # ✅ 코멘트만 (빈 것 제외)
 
-    qs = qs.annotate(likes_count=Count("likes", distinct=True), comments_count=Count("comments", distinct=True))
+    qs = annotate_review_list(qs, user)
+
+    # ?cursor= 를 주면 커서 페이지네이션 (기본: 전체 목록)
+    if KeysetPagination.requested(request):
+        ordering = ["-rating", "-created_at", "-id"] if sort_param == "rating_high" else ["-created_at", "-id"]
+        paginator = KeysetPagination(ordering)
+        page = paginator.paginate_queryset(qs, request)
+        return paginator.get_paginated_response(ReviewSerializer(page, many=True, context={"request": request}).data)
     
     if sort_param == "latest": qs = qs.order_by("-created_at")
     elif sort_param == "rating_high": qs = qs.order_by("-rating", "-created_at")
@@ -128,6 +142,8 @@ def toggle_movie_wish(request, tmdb_id: int):
     if review:
         if review.watched:
             return Response({"detail": "이미 감상한 작품입니다."}, status=400)
+        # 보고싶어요(watched=False)는 리뷰 통계에 포함되지 않으므로 refresh_review_stats 불필요
+        # (봤어요로 바뀌는 건 update_delete_review에서 갱신)
         review.delete()
         return Response({"wished": False, "message": "취소됨"})
     else:
@@ -189,16 +205,7 @@ def delete_review_comment(request, comment_id):
 def get_my_movie_review(request, tmdb_id: int):
     movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
 
-    review = (
-        Review.objects
-        .filter(movie=movie, user=request.user)
-        .select_related("user", "movie")
-        .annotate(
-            likes_count=Count("likes", distinct=True),
-            comments_count=Count("comments", distinct=True),
-        )
-        .first()
-    )
+    review = annotate_review_list(Review.objects.filter(movie=movie, user=request.user), request.user).first()
 
     if not review:
         return Response(status=204)
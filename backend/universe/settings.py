@@ -94,6 +94,13 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # 여러 프로세스(sync_tmdb_bulk --worker, run_workers)가 동시에 쓸 때 "database is locked" 방지
+        # - WAL: 쓰는 중에도 읽기 가능 / IMMEDIATE: 트랜잭션 시작 시 쓰기 락을 잡아 락 승격 충돌 방지
+        "OPTIONS": {
+            "timeout": 30,
+            "transaction_mode": "IMMEDIATE",
+            "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;",
+        },
     }
 }
 
@@ -143,6 +150,19 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 CORS_ALLOW_ALL_ORIGINS = True
 # ✅ 외부 API 키(나중 단계에서 사용)
 TMDB_API_KEY = os.getenv("TMDB_API_KEY", "")
+TMDB_BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")  # 로컬 가짜 TMDB 서버 테스트 시 변경
+TMDB_HTTP_POOL_SIZE = int(os.getenv("TMDB_HTTP_POOL_SIZE", "16"))      # 커넥션 풀 크기(--concurrency 이상 권장)
+TMDB_HTTP_MAX_RETRIES = int(os.getenv("TMDB_HTTP_MAX_RETRIES", "3"))   # 429/5xx 재시도 횟수
+# TMDB 응답 디스크 캐시 (엔드포인트별 TTL, 용량 초과 시 LRU 삭제)
+TMDB_CACHE_ENABLED = os.getenv("TMDB_CACHE_ENABLED", "1") == "1"
+TMDB_CACHE_PATH = os.getenv("TMDB_CACHE_PATH", str(BASE_DIR / "tmdb_cache.sqlite3"))
+TMDB_CACHE_MAX_BYTES = int(os.getenv("TMDB_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# 영화 상세 보강 정책: TTL 이내면 DB 그대로, 지나면 응답 후 백그라운드 갱신, 없으면 짧게 인라인 요청
+TMDB_ENRICH_TTL = int(os.getenv("TMDB_ENRICH_TTL", str(24 * 60 * 60)))
+TMDB_INLINE_TIMEOUT = float(os.getenv("TMDB_INLINE_TIMEOUT", "3"))
+# TMDB 포스터/배경 이미지 미러 (MEDIA_ROOT/tmdb_images, 용량 초과 시 오래 안 쓴 것부터 삭제)
+TMDB_IMAGE_BASE_URL = os.getenv("TMDB_IMAGE_BASE_URL", "https://image.tmdb.org/t/p")  # 로컬 테스트 시 변경
+TMDB_IMAGE_MIRROR_MAX_BYTES = int(os.getenv("TMDB_IMAGE_MIRROR_MAX_BYTES", str(1024 * 1024 * 1024)))
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
 AUTH_USER_MODEL = "accounts.User"
@@ -40,6 +40,12 @@ export async function fetchMovieDetail(tmdbId) {
   return res.data
 }
 
+// 상세 페이지 한 번에: { detail, similar, reviews: { next, count, results }, me: { review, liked, wished } | null }
+export async function fetchMovieBundle(tmdbId) {
+  const res = await api.get(`/movies/${tmdbId}/bundle/`)
+  return res.data
+}
+
 export async function searchMulti(q, page = 1) {
   const res = await api.get('/movies/search/', { params: { q, page } })
   return res.data
@@ -167,6 +173,12 @@ export const searchComet = (params) => {
     .then(res => res.data)
 }
 
+// 검색창 자동완성 (입력할 때마다 호출해도 되는 가벼운 API, 초성 검색 가능)
+export const suggestComet = (q, limit = 10) => {
+  return api.get('/movies/suggest/', { params: { q, limit } })
+    .then(res => res.data.results)
+}
+
 // =========================
 // (taste page)
 // =========================